@@ -12,9 +12,49 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DATABASE_NAME: str
     JWT_SECRET: str
+    MONGO_MAX_POOL_SIZE: int = 100  # Connections per server; size for peak concurrent reads
+    MONGO_MIN_POOL_SIZE: int = 10  # Connections kept open, and opened at startup
+    MONGO_MAX_CONNECTING: int = 2  # Connections established at once per pool
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 0  # Wait for a free connection before failing; 0 waits as long as server selection
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGO_CONNECT_TIMEOUT_MS: int = 5000
+    MONGO_SOCKET_TIMEOUT_MS: int = 0  # 0 disables the timeout; keep above the slowest aggregation
+    MONGO_COMPRESSORS: str = "zstd,snappy,zlib"  # Wire compression in order of preference; unavailable ones are skipped
+    MONGO_READ_PREFERENCE: str = "primary"  # Of the GET routes. Options: primary, primaryPreferred, secondary, secondaryPreferred, nearest
+    MONGO_READ_MAX_STALENESS_SECONDS: int = -1  # Secondary lag allowed for GET reads; -1 for no limit, else at least 90
+    MONGO_WRITE_CONCERN: str = "majority"  # Of uploads and jobs: majority or a number of members, e.g. 1
+    MONGO_WRITE_TIMEOUT_MS: int = 10000  # 0 waits for the write concern indefinitely
     DEBUG_MODE: bool = False
     AUTH_ENABLED: bool = False
+    JWT_CACHE_MAX_ENTRIES: int = 1024  # Verified tokens kept per worker until they expire; 0 verifies every request
     LOG_LEVEL: str = "INFO"  # Options: DEBUG, INFO, WARNING, ERROR, CRITICAL
+    REQUEST_LOG_FORMAT: str = "text"  # Options: text, json (one object per request line)
+    REQUEST_LOG_SAMPLE_RATE: float = 1.0  # Fraction of successful requests logged; errors are always logged
+    REQUEST_LOG_SLOW_MS: float = 1000.0  # Requests slower than this are always logged
+    PARSE_EXECUTOR: str = "thread"  # Options: thread, process
+    PARSE_MAX_WORKERS: int = 2
+    PARSE_QUEUE_SIZE: int = 8  # Jobs allowed to wait for a free worker before returning 503
+    PARSE_TIMEOUT_SECONDS: float = 60.0
+    BATCH_MAX_CONCURRENCY: int = 2  # Sheets of a batch upload processed at once; keep <= workers + queue
+    BATCH_MAX_UNCOMPRESSED_BYTES: int = 200 * 1024 * 1024  # Zip batches whose sheets expand beyond this are rejected with 413
+    INGEST_CHUNK_ROWS: int = 5000  # Rows sanitized together as one DataFrame chunk
+    CSV_ENGINE: str = "c"  # Options: c (chunked), pyarrow (whole file, multithreaded; needs pyarrow)
+    BULK_VALIDATION: bool = True  # Validate upload columns at once instead of one model per row
+    OFFERED_COURSES_STORAGE: str = "embedded"  # Options: embedded, sectioned (one document per section)
+    OFFERED_COURSES_CACHE_TTL_SECONDS: float = 60.0  # 0 disables the GET /offeredCourses cache
+    OFFERED_COURSES_CACHE_MAX_ENTRIES: int = 256
+    OFFERED_COURSES_PATCH_MAX_ROWS: int = 1000  # Change rows accepted by PATCH /offeredCourses; larger deltas should be uploaded
+    FACULTY_CACHE_MAX_ENTRIES: int = 128
+    FACULTY_CACHE_REVALIDATE_SECONDS: float = 30.0  # Cached faculty lists older than this are checked by version
+    UPLOAD_MAX_BYTES: int = 15 * 1024 * 1024  # Larger uploads are rejected with 413; job files are kept in GridFS
+    UPLOAD_SPOOL_BYTES: int = 4 * 1024 * 1024  # Uploads above this are spilled to a temporary file
+    UPLOAD_CHUNK_BYTES: int = 1024 * 1024
+    UPLOAD_JOBS_ENABLED: bool = True  # Uploads return 202 with a job id and are processed by background workers
+    UPLOAD_JOB_WORKERS: int = 1  # Job workers per server process; 0 leaves processing to other replicas
+    UPLOAD_JOB_LEASE_SECONDS: float = 120.0  # A running job is reclaimed if its worker stops renewing the lease
+    UPLOAD_JOB_POLL_SECONDS: float = 1.0
+    UPLOAD_JOB_MAX_ATTEMPTS: int = 3
+    UPLOAD_JOB_RETENTION_DAYS: float = 7.0  # Finished jobs are removed by a TTL index after this
 
     class Config:
         env_file = ".env"
@@ -25,11 +65,55 @@ settings = Settings()
 DATABASE_URL = settings.DATABASE_URL
 DATABASE_NAME = settings.DATABASE_NAME
 JWT_SECRET = settings.JWT_SECRET
+MONGO_MAX_POOL_SIZE = settings.MONGO_MAX_POOL_SIZE
+MONGO_MIN_POOL_SIZE = settings.MONGO_MIN_POOL_SIZE
+MONGO_MAX_CONNECTING = settings.MONGO_MAX_CONNECTING
+MONGO_WAIT_QUEUE_TIMEOUT_MS = settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
+MONGO_SERVER_SELECTION_TIMEOUT_MS = settings.MONGO_SERVER_SELECTION_TIMEOUT_MS
+MONGO_CONNECT_TIMEOUT_MS = settings.MONGO_CONNECT_TIMEOUT_MS
+MONGO_SOCKET_TIMEOUT_MS = settings.MONGO_SOCKET_TIMEOUT_MS
+MONGO_COMPRESSORS = settings.MONGO_COMPRESSORS
+MONGO_READ_PREFERENCE = settings.MONGO_READ_PREFERENCE
+MONGO_READ_MAX_STALENESS_SECONDS = settings.MONGO_READ_MAX_STALENESS_SECONDS
+MONGO_WRITE_CONCERN = settings.MONGO_WRITE_CONCERN
+MONGO_WRITE_TIMEOUT_MS = settings.MONGO_WRITE_TIMEOUT_MS
 DEBUG_MODE = settings.DEBUG_MODE
 AUTH_ENABLED = settings.AUTH_ENABLED
+JWT_CACHE_MAX_ENTRIES = settings.JWT_CACHE_MAX_ENTRIES
 LOG_LEVEL = settings.LOG_LEVEL
+REQUEST_LOG_FORMAT = settings.REQUEST_LOG_FORMAT
+REQUEST_LOG_SAMPLE_RATE = settings.REQUEST_LOG_SAMPLE_RATE
+REQUEST_LOG_SLOW_MS = settings.REQUEST_LOG_SLOW_MS
+PARSE_EXECUTOR = settings.PARSE_EXECUTOR
+PARSE_MAX_WORKERS = settings.PARSE_MAX_WORKERS
+PARSE_QUEUE_SIZE = settings.PARSE_QUEUE_SIZE
+PARSE_TIMEOUT_SECONDS = settings.PARSE_TIMEOUT_SECONDS
+BATCH_MAX_CONCURRENCY = settings.BATCH_MAX_CONCURRENCY
+BATCH_MAX_UNCOMPRESSED_BYTES = settings.BATCH_MAX_UNCOMPRESSED_BYTES
+INGEST_CHUNK_ROWS = settings.INGEST_CHUNK_ROWS
+CSV_ENGINE = settings.CSV_ENGINE
+BULK_VALIDATION = settings.BULK_VALIDATION
+OFFERED_COURSES_STORAGE = settings.OFFERED_COURSES_STORAGE
+OFFERED_COURSES_CACHE_TTL_SECONDS = settings.OFFERED_COURSES_CACHE_TTL_SECONDS
+OFFERED_COURSES_CACHE_MAX_ENTRIES = settings.OFFERED_COURSES_CACHE_MAX_ENTRIES
+OFFERED_COURSES_PATCH_MAX_ROWS = settings.OFFERED_COURSES_PATCH_MAX_ROWS
+FACULTY_CACHE_MAX_ENTRIES = settings.FACULTY_CACHE_MAX_ENTRIES
+FACULTY_CACHE_REVALIDATE_SECONDS = settings.FACULTY_CACHE_REVALIDATE_SECONDS
+UPLOAD_MAX_BYTES = settings.UPLOAD_MAX_BYTES
+UPLOAD_SPOOL_BYTES = settings.UPLOAD_SPOOL_BYTES
+UPLOAD_CHUNK_BYTES = settings.UPLOAD_CHUNK_BYTES
+UPLOAD_JOBS_ENABLED = settings.UPLOAD_JOBS_ENABLED
+UPLOAD_JOB_WORKERS = settings.UPLOAD_JOB_WORKERS
+UPLOAD_JOB_LEASE_SECONDS = settings.UPLOAD_JOB_LEASE_SECONDS
+UPLOAD_JOB_POLL_SECONDS = settings.UPLOAD_JOB_POLL_SECONDS
+UPLOAD_JOB_MAX_ATTEMPTS = settings.UPLOAD_JOB_MAX_ATTEMPTS
+UPLOAD_JOB_RETENTION_DAYS = settings.UPLOAD_JOB_RETENTION_DAYS
 
 # Log the current settings for debugging (ensure LOG_LEVEL includes INFO)
 logger.info(f"DEBUG_MODE: {DEBUG_MODE}")
 logger.info(f"AUTH_ENABLED: {AUTH_ENABLED}")
 logger.info(f"LOG_LEVEL: {LOG_LEVEL}")
+logger.info(f"MONGO_POOL: max={MONGO_MAX_POOL_SIZE}, min={MONGO_MIN_POOL_SIZE}, read_preference={MONGO_READ_PREFERENCE}, write_concern={MONGO_WRITE_CONCERN}")
+logger.info(f"OFFERED_COURSES_STORAGE: {OFFERED_COURSES_STORAGE}")
+logger.info(f"PARSE_EXECUTOR: {PARSE_EXECUTOR} (workers={PARSE_MAX_WORKERS}, queue={PARSE_QUEUE_SIZE})")
+logger.info(f"UPLOAD_JOBS_ENABLED: {UPLOAD_JOBS_ENABLED} (workers={UPLOAD_JOB_WORKERS})")
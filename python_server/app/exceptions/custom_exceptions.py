@@ -16,3 +16,15 @@ class ValidationError(HTTPException):
 class AuthenticationError(HTTPException):
     def __init__(self, detail: str = "Authentication failed."):
         super().__init__(status_code=401, detail=detail)
+
+class ServiceUnavailableError(HTTPException):
+    def __init__(self, detail: str = "Service temporarily unavailable."):
+        super().__init__(status_code=503, detail=detail)
+
+class ProcessingTimeoutError(HTTPException):
+    def __init__(self, detail: str = "Processing timed out."):
+        super().__init__(status_code=504, detail=detail)
+
+class PayloadTooLargeError(HTTPException):
+    def __init__(self, detail: str = "Uploaded file is too large."):
+        super().__init__(status_code=413, detail=detail)
@@ -3,9 +3,11 @@
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import faculty_routes, course_routes
+from app.routes import faculty_routes, course_routes, batch_routes, job_routes, metrics_routes
 from app.models.database import connect_to_mongo, close_mongo_connection
 from app.middleware.logging_middleware import LoggingMiddleware
+from app.utils.parse_executor import start_parse_executor, shutdown_parse_executor
+from app.services.job_service import start_job_workers, stop_job_workers
 from app.config import DEBUG_MODE, AUTH_ENABLED, LOG_LEVEL
 
 # Initialize FastAPI app
@@ -63,15 +65,22 @@ app.add_middleware(LoggingMiddleware)
 # Include routers
 app.include_router(faculty_routes.router)
 app.include_router(course_routes.router)
+app.include_router(batch_routes.router)
+app.include_router(job_routes.router)
+app.include_router(metrics_routes.router)
 
 @app.on_event("startup")
 async def startup_event():
     logger.info("🚀 Starting up the application...")
     await connect_to_mongo()
+    start_parse_executor()
+    start_job_workers()
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("🔄 Shutting down the application...")
+    await stop_job_workers()
+    shutdown_parse_executor()
     await close_mongo_connection()
 
 @app.get("/")
@@ -1,26 +1,124 @@
 # File: python_server/app/middleware/logging_middleware.py
 
+import json
 import logging
+import random
 import time
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from typing import Dict, Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.metrics import HTTP_REQUEST_DURATION, HTTP_RESPONSES, HTTP_REQUEST_SIZE, HTTP_RESPONSE_SIZE
+from app.config import REQUEST_LOG_FORMAT, REQUEST_LOG_SAMPLE_RATE, REQUEST_LOG_SLOW_MS
 
 logger = logging.getLogger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+# Route label of requests that matched no route, so unknown paths cannot grow the metrics
+UNMATCHED_ROUTE = "unmatched"
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware that times every HTTP request with perf_counter and
+    records latency, status and body sizes per route template in the metrics
+    registry. Messages are passed through as they come, so streaming responses
+    are not buffered and no extra task is spawned per request.
+
+    A log line is written for a sample of the requests (REQUEST_LOG_SAMPLE_RATE),
+    and always for server errors and requests slower than REQUEST_LOG_SLOW_MS,
+    as text or as one JSON object per line (REQUEST_LOG_FORMAT).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        log_format: str = REQUEST_LOG_FORMAT,
+        sample_rate: float = REQUEST_LOG_SAMPLE_RATE,
+        slow_ms: float = REQUEST_LOG_SLOW_MS
+    ):
+        self.app = app
+        self.log_format = log_format
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self._routes: Dict[object, str] = {}
+
+    def _route_of(self, scope: Scope) -> str:
+        # The router stores the matched endpoint in the shared scope; map it back to its path template
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        route = self._routes.get(endpoint)
+        if route is None:
+            route = UNMATCHED_ROUTE
+            for candidate in getattr(scope.get("app"), "routes", ()):
+                if getattr(candidate, "endpoint", None) is endpoint or getattr(candidate, "app", None) is endpoint:
+                    route = candidate.path
+                    break
+            self._routes[endpoint] = route
+        return route
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        state = {"status": 500, "request_bytes": 0, "response_bytes": 0}
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                state["request_bytes"] += len(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                state["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                state["response_bytes"] += len(message.get("body", b""))
+            await send(message)
+
+        error: Optional[Exception] = None
         try:
-            response: Response = await call_next(request)
-            process_time = (time.time() - start_time) * 1000  # Convert to milliseconds
-            logger.info(
-                f"✅ {request.method} {request.url.path} completed_in={process_time:.2f}ms status_code={response.status_code}"
-            )
-            return response
+            await self.app(scope, receive_wrapper, send_wrapper)
         except Exception as e:
-            process_time = (time.time() - start_time) * 1000
-            logger.error(
-                f"❌ {request.method} {request.url.path} failed_in={process_time:.2f}ms error={str(e)}"
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            route = self._route_of(scope)
+            labels = (scope["method"], route)
+            HTTP_REQUEST_DURATION.observe(elapsed, labels)
+            HTTP_RESPONSES.inc((scope["method"], route, str(state["status"])))
+            HTTP_REQUEST_SIZE.observe(state["request_bytes"], labels)
+            HTTP_RESPONSE_SIZE.observe(state["response_bytes"], labels)
+            self._log(scope, route, state, elapsed * 1000, error)
+
+    def _log(self, scope: Scope, route: str, state: Dict, elapsed_ms: float, error: Optional[Exception]):
+        failed = error is not None or state["status"] >= 500
+        level = logging.ERROR if failed else logging.INFO
+        # Decide before formatting anything, so skipped requests cost no string building
+        if not logger.isEnabledFor(level):
+            return
+        if not failed and elapsed_ms < self.slow_ms and (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return
+
+        if self.log_format == "json":
+            record = {
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": route,
+                "status": state["status"],
+                "duration_ms": round(elapsed_ms, 2),
+                "request_bytes": state["request_bytes"],
+                "response_bytes": state["response_bytes"],
+            }
+            if error is not None:
+                record["error"] = str(error)
+            logger.log(level, json.dumps(record))
+        elif error is not None:
+            logger.error(f"❌ {scope['method']} {scope['path']} failed_in={elapsed_ms:.2f}ms error={error}")
+        else:
+            logger.log(
+                level,
+                f"{'❌' if failed else '✅'} {scope['method']} {scope['path']} completed_in={elapsed_ms:.2f}ms "
+                f"status_code={state['status']} bytes_in={state['request_bytes']} bytes_out={state['response_bytes']}"
             )
-            raise e
@@ -1,11 +1,15 @@
 # File: python_server/app/models/authentication.py
 
+import hashlib
+import time
 from typing import Optional, Dict
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 import jwt
-from app.config import JWT_SECRET, AUTH_ENABLED
+from app.config import JWT_SECRET, AUTH_ENABLED, JWT_CACHE_MAX_ENTRIES
 from app.exceptions.custom_exceptions import AuthenticationError
+from app.utils.cache import TTLCache
+from app.utils.metrics import REGISTRY
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,19 +17,30 @@ logger = logging.getLogger(__name__)
 # Set auto_error to False to make token optional
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
+# (exp, user) of verified tokens keyed by the SHA-256 digest of the token; entries leave the cache at exp
+token_cache = TTLCache("jwt", max_entries=JWT_CACHE_MAX_ENTRIES, ttl_seconds=float("inf"))
+
+AUTH_TOKEN_VERIFICATIONS = REGISTRY.counter(
+    "auth_token_verifications_total", "Bearer tokens checked, per result (cached, verified, expired, invalid).", ("result",)
+)
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
 
 def decode_jwt(token: str) -> Dict:
     """
     Decodes the JWT token using the provided JWT_SECRET.
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
-        logger.debug(f"Decoded JWT payload: {payload}")
-        return payload
+        return jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
     except jwt.ExpiredSignatureError:
+        AUTH_TOKEN_VERIFICATIONS.inc(("expired",))
         logger.error("❌ Token has expired.")
         raise AuthenticationError(detail="❌ Token has expired.")
     except jwt.InvalidTokenError:
+        AUTH_TOKEN_VERIFICATIONS.inc(("invalid",))
         logger.error("❌ Invalid token.")
         raise AuthenticationError(detail="❌ Invalid token.")
 
@@ -34,10 +49,23 @@ async def get_current_user(token: Optional[str] = Depends(oauth2_scheme)) -> Opt
     """
     Retrieves the current user based on JWT token.
     Returns None if token is not provided or invalid.
+
+    The frontend sends the same token with every request of a session, so
+    verified users are cached per token until the token's `exp`. A cached
+    token is rejected at the same instant jwt.decode would reject it.
     """
     if not token:
         logger.debug("No token provided.")
         return None
+    key = token_digest(token)
+    cached = token_cache.get(key)
+    if cached is not None:
+        expires_at, user = cached
+        if expires_at is None or time.time() < expires_at:
+            AUTH_TOKEN_VERIFICATIONS.inc(("cached",))
+            return dict(user)
+        # Expired since it was cached; decoding it again reports the expiry
+        token_cache.invalidate(key)
     try:
         payload = decode_jwt(token)
     except AuthenticationError as e:
@@ -52,8 +80,12 @@ async def get_current_user(token: Optional[str] = Depends(oauth2_scheme)) -> Opt
     if not user["username"]:
         logger.error("❌ User information missing in token.")
         raise AuthenticationError(detail="❌ User information is incomplete.")
-    logger.debug(f"Authenticated user: {user}")
-    return user
+    AUTH_TOKEN_VERIFICATIONS.inc(("verified",))
+
+    # jwt.decode accepted the token, so exp, if present, is an integer in the future
+    expires_at = int(payload["exp"]) if "exp" in payload else None
+    token_cache.set(key, (expires_at, user), None if expires_at is None else expires_at - time.time())
+    return dict(user)
 
 
 # Mock Authentication Dependency for Testing
@@ -71,9 +103,8 @@ async def get_authenticated_user(token: Optional[str] = Depends(oauth2_scheme))
     """
     Conditionally returns the authenticated user or a mock user based on AUTH_ENABLED.
     """
-    logger.debug(f"AUTH_ENABLED: {AUTH_ENABLED}")
+    # Runs on every authenticated request: debug messages are only formatted when DEBUG is enabled
     if AUTH_ENABLED:
-        logger.debug("AUTH_ENABLED is True, enforcing authentication.")
         if not token:
             logger.warning("❌ No token provided, but AUTH_ENABLED=True.")
             raise HTTPException(
@@ -89,10 +120,7 @@ async def get_authenticated_user(token: Optional[str] = Depends(oauth2_scheme))
                 detail="❌ Not authenticated.",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        logger.debug(f"Authenticated user: {user}")
+        logger.debug("Authenticated user: %s", user)
         return user
     else:
-        logger.debug("AUTH_ENABLED is False, returning mock user.")
-        mock_user = await get_mock_user()
-        logger.debug(f"Mock user returned: {mock_user}")
-        return mock_user
+        return await get_mock_user()
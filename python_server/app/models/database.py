@@ -1,29 +1,163 @@
 # File: app/models/database.py
 
+import asyncio
+import importlib.util
+from typing import Dict, List
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import ASCENDING
-from app.config import DATABASE_URL, DATABASE_NAME
+from pymongo.read_preferences import Primary, PrimaryPreferred, Secondary, SecondaryPreferred, Nearest
+from app.config import (
+    DATABASE_URL, DATABASE_NAME, UPLOAD_JOB_RETENTION_DAYS,
+    MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_MAX_CONNECTING, MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    MONGO_SERVER_SELECTION_TIMEOUT_MS, MONGO_CONNECT_TIMEOUT_MS, MONGO_SOCKET_TIMEOUT_MS, MONGO_COMPRESSORS,
+    MONGO_READ_PREFERENCE, MONGO_READ_MAX_STALENESS_SECONDS, MONGO_WRITE_CONCERN, MONGO_WRITE_TIMEOUT_MS
+)
+from app.utils.mongo_monitoring import CommandLatencyListener, ConnectionPoolListener, open_connections
 import logging
 
 logger = logging.getLogger(__name__)
 
 client: AsyncIOMotorClient = None
 db = None
+read_db = None
+# Keyword arguments the client was built with
+connection_options: Dict = {}
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+# Python module each wire compressor needs; zlib is part of the standard library
+COMPRESSOR_MODULES = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+
+def available_compressors(names: str) -> List[str]:
+    """
+    Keeps the configured compressors whose module is installed, in order of
+    preference. The server picks the first one it also supports.
+    """
+    compressors = []
+    for name in (name.strip() for name in names.split(",")):
+        if not name:
+            continue
+        module = COMPRESSOR_MODULES.get(name)
+        if module is None:
+            logger.warning(f"⚠️ Unknown MongoDB compressor '{name}' ignored")
+        elif importlib.util.find_spec(module) is None:
+            logger.warning(f"⚠️ MongoDB compressor '{name}' needs the {module} module, skipping it")
+        else:
+            compressors.append(name)
+    return compressors
+
+
+def build_read_preference(name: str, max_staleness: int):
+    mode = READ_PREFERENCES.get(name)
+    if mode is None:
+        raise ValueError(f"Invalid MONGO_READ_PREFERENCE '{name}', expected one of {', '.join(READ_PREFERENCES)}")
+    # Staleness only applies to modes that may read from a secondary
+    return mode() if mode is Primary else mode(max_staleness=max_staleness)
+
+
+def client_options() -> Dict:
+    """
+    Keyword arguments of the Motor client built from the MONGO_* settings.
+    Zero timeouts are passed as None, which the driver treats as no limit.
+    """
+    write_concern = int(MONGO_WRITE_CONCERN) if MONGO_WRITE_CONCERN.isdigit() else MONGO_WRITE_CONCERN
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxConnecting": MONGO_MAX_CONNECTING,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS or None,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": MONGO_SOCKET_TIMEOUT_MS or None,
+        "w": write_concern,
+        "wTimeoutMS": MONGO_WRITE_TIMEOUT_MS or None,
+    }
+    compressors = available_compressors(MONGO_COMPRESSORS)
+    if compressors:
+        options["compressors"] = ",".join(compressors)
+    return options
+
+
+def pool_options() -> Dict:
+    """
+    Effective connection settings, as reported by the pool statistics endpoint.
+    """
+    return {**connection_options, "readPreference": MONGO_READ_PREFERENCE, "maxStalenessSeconds": MONGO_READ_MAX_STALENESS_SECONDS}
+
+
+async def warm_connection_pool():
+    """
+    Opens MONGO_MIN_POOL_SIZE connections before the first request with
+    concurrent pings, so early requests do not pay for the TCP/TLS handshake
+    and authentication. The driver keeps the pool at that size afterwards.
+    """
+    if MONGO_MIN_POOL_SIZE <= 0:
+        return
+    pings = [db.command("ping") for _ in range(MONGO_MIN_POOL_SIZE)]
+    if read_db is not db:
+        pings += [read_db.command("ping", read_preference=read_db.read_preference) for _ in range(MONGO_MIN_POOL_SIZE)]
+    await asyncio.gather(*pings)
+    logger.info(f"✅ MongoDB connection pool warmed ({open_connections()} connections open)")
+
 
 async def connect_to_mongo():
-    global client, db
+    global client, db, read_db, connection_options
     try:
-        client = AsyncIOMotorClient(DATABASE_URL)
+        connection_options = client_options()
+        # Command latencies and pool statistics are exported on /metrics
+        client = AsyncIOMotorClient(
+            DATABASE_URL, event_listeners=[CommandLatencyListener(), ConnectionPoolListener()], **connection_options
+        )
         db = client[DATABASE_NAME]
+        read_preference = build_read_preference(MONGO_READ_PREFERENCE, MONGO_READ_MAX_STALENESS_SECONDS)
+        read_db = db if isinstance(read_preference, Primary) else db.with_options(read_preference=read_preference)
         # Create indexes
         await db["faculty_information"].create_index(
             [("department", ASCENDING)], unique=True
         )
+        await db["faculty_information"].create_index([("source_digest", ASCENDING)])
         await db["offered_courses"].create_index(
             [("department", ASCENDING), ("semester", ASCENDING), ("year", ASCENDING)],
             unique=True
         )
+        await db["offered_course_sections"].create_index(
+            [("department", ASCENDING), ("semester", ASCENDING), ("year", ASCENDING),
+             ("course_code", ASCENDING), ("section", ASCENDING)],
+            unique=True
+        )
+        await db["offered_course_sections"].create_index(
+            [("department", ASCENDING), ("semester", ASCENDING), ("year", ASCENDING), ("position", ASCENDING)]
+        )
+        await db["offered_course_sections"].create_index(
+            [("department", ASCENDING), ("semester", ASCENDING), ("year", ASCENDING), ("faculty", ASCENDING)]
+        )
+        # Sections sharing a room or faculty with an upload, for its conflict check; every $or clause needs an index
+        for field in ("room_no", "email", "faculty"):
+            await db["offered_course_sections"].create_index(
+                [("semester", ASCENDING), ("year", ASCENDING), (field, ASCENDING)]
+            )
+            await db["offered_courses"].create_index(
+                [("semester", ASCENDING), ("year", ASCENDING), (f"courses.{field}", ASCENDING)]
+            )
+        await db["offered_course_stats"].create_index(
+            [("department", ASCENDING), ("semester", ASCENDING), ("year", ASCENDING)],
+            unique=True
+        )
+        await db["upload_jobs"].create_index([("status", ASCENDING), ("created_at", ASCENDING)])
+        await db["upload_jobs"].create_index([("status", ASCENDING), ("lease_expires_at", ASCENDING)])
+        # Finished jobs are removed by MongoDB after the retention period
+        await db["upload_jobs"].create_index(
+            [("finished_at", ASCENDING)], expireAfterSeconds=int(UPLOAD_JOB_RETENTION_DAYS * 86400)
+        )
         logger.info("✅ Connected to MongoDB")
+        await warm_connection_pool()
     except Exception as e:
         logger.error(f"❌ Failed to connect to MongoDB: {e}")
         raise e
@@ -38,3 +172,13 @@ def get_database():
     if db is None:
         raise Exception("Database not connected. Please check your MongoDB connection.")
     return db
+
+def get_read_database():
+    """
+    Database for the read-only GET routes, reading with MONGO_READ_PREFERENCE.
+    With a secondary preference, reads may lag behind the latest upload by the
+    replication delay; uploads, jobs and the faculty directory always use get_database.
+    """
+    if read_db is None:
+        raise Exception("Database not connected. Please check your MongoDB connection.")
+    return read_db
@@ -1,7 +1,7 @@
 # File: app/models/schemas.py
 
 from pydantic import BaseModel, EmailStr, Field, validator
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import re
 
@@ -10,6 +10,9 @@ class Timing(BaseModel):
     days: Optional[str] = Field(None, example="MW")
     start_time: Optional[str] = Field(None, example="08:00 AM")
     end_time: Optional[str] = Field(None, example="09:15 AM")
+    # Minutes after midnight, stored next to the display times for range queries and clash checks
+    start_minutes: Optional[int] = Field(None, example=480)
+    end_minutes: Optional[int] = Field(None, example=555)
 
     @validator('days')
     def validate_days(cls, v):
@@ -34,6 +37,9 @@ class Course(BaseModel):
             raise ValueError("course_code is required.")
         return v
 
+# Course fields in the order Course.dict() produces them
+COURSE_FIELDS = list(Course.__fields__)
+
 # OfferedCourses model
 class OfferedCourses(BaseModel):
     department: str = Field(..., example="CSE")
@@ -68,6 +74,61 @@ class CourseResponse(BaseModel):
     uploaded_by: Optional[str] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+class CourseSearchResponse(BaseModel):
+    department: str = Field(..., example="CSE")
+    semester: int = Field(..., ge=1, le=3, example=3)
+    year: int = Field(..., example=2024)
+    # Only the requested fields of every course
+    courses: List[Dict[str, Any]] = Field(..., example=[{"course_code": "CSE101", "section": 1, "room_no": "101"}])
+    count: int = Field(..., example=1)
+    next_cursor: Optional[int] = Field(None, example=42)
+
 class FacultyResponse(BaseModel):
     department: str = Field(..., example="CSE")
     faculty_list: List[Faculty]
+
+# Precomputed per-semester summaries
+
+class FacultyLoad(BaseModel):
+    faculty: Optional[str] = Field(None, example="AASR")
+    email: Optional[str] = None
+    sections: int = Field(..., example=3)
+    courses: int = Field(..., example=2)
+    capacity: int = Field(..., example=120)
+    seat_taken: int = Field(..., example=104)
+    fill_ratio: Optional[float] = Field(None, example=0.8667)
+
+class CourseFill(BaseModel):
+    course_code: str = Field(..., example="CSE101")
+    sections: int = Field(..., example=4)
+    capacity: int = Field(..., example=160)
+    seat_taken: int = Field(..., example=151)
+    fill_ratio: Optional[float] = Field(None, example=0.9438)
+
+class RoomOccupancy(BaseModel):
+    room_no: str = Field(..., example="AB1-301")
+    day: str = Field(..., example="M")
+    start_time: Optional[str] = Field(None, example="08:00 AM")
+    end_time: Optional[str] = Field(None, example="09:15 AM")
+    sections: int = Field(..., example=1)
+    capacity: int = Field(..., example=40)
+    seat_taken: int = Field(..., example=38)
+    courses: List[str] = Field(..., example=["CSE101/1"])
+
+class SummaryTotals(BaseModel):
+    sections: int
+    courses: int
+    faculty: int
+    rooms: int
+    capacity: int
+    seat_taken: int
+    fill_ratio: Optional[float] = None
+
+class CourseSummaryResponse(BaseModel):
+    department: str = Field(..., example="CSE")
+    semester: int = Field(..., ge=1, le=3, example=3)
+    year: int = Field(..., example=2024)
+    totals: SummaryTotals
+    faculty_load: List[FacultyLoad]
+    course_fill: List[CourseFill]
+    room_occupancy: List[RoomOccupancy]
@@ -0,0 +1,119 @@
+# File: app/routes/batch_routes.py
+
+from typing import Optional
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Form
+from app.services.batch_service import split_batch_upload, run_batch, BatchItem
+from app.services.course_service import process_offered_courses
+from app.services.faculty_service import process_faculty_info
+from app.utils.file_handler import receive_upload
+from app.models.authentication import get_authenticated_user
+from app.exceptions.custom_exceptions import (
+    FileProcessingError, ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError
+)
+import logging
+
+router = APIRouter(tags=["Batch Uploads"])
+logger = logging.getLogger(__name__)
+
+
+@router.post("/upload/batch/offeredCourses")
+async def upload_offered_courses_batch(
+    file: UploadFile = File(...),
+    year: int = Form(..., description="Year of the courses, e.g., 2024"),
+    semester_no: int = Form(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
+    # Temporarily mocking current_user since authentication is not implemented
+    current_user: dict = Depends(lambda: {"username": "test_user"})
+):
+    """
+    Uploads offered courses for several departments at once.
+
+    **Form Fields:**
+    - `file`: A zip of Excel, CSV or Parquet files named after their department (e.g. `CSE.xlsx`),
+      or one workbook with one sheet per department named after it.
+    - `year`: Year of the courses, e.g., 2024.
+    - `semester_no`: Semester number (1: Spring, 2: Summer, 3: Fall).
+
+    Sheets are processed concurrently; the response reports the result and
+    warnings of every department.
+    """
+    upload = None
+    try:
+        logger.info(f"📥 User '{current_user['username']}' uploading offered courses batch: {file.filename}")
+        upload = await receive_upload(file)
+        items = await split_batch_upload(upload.source, file.filename, upload.digest)
+
+        async def handle(item: BatchItem) -> dict:
+            result = await process_offered_courses(
+                await item.read(),
+                user=current_user,
+                year=year,
+                semester_no=semester_no,
+                department=item.name,
+                sheet_name=item.sheet_name,
+                source_digest=item.source_digest,
+                filename=item.source
+            )
+            return {
+                "message": result["message"],
+                "department": result["department"],
+                "total_courses": result["total_courses"],
+                "warnings": result.get("warnings", [])
+            }
+
+        report = await run_batch(items, handle)
+        report.update(semester=semester_no, year=year, uploaded_by=current_user["username"])
+        return report
+
+    except FileProcessingError as e:
+        logger.error(f"❌ File processing error: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except (ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError) as e:
+        logger.warning(f"⚠️ Upload not processed: {e.detail}")
+        raise e
+    except Exception as e:
+        logger.error(f"❌ Unexpected error: {e}")
+        raise HTTPException(status_code=500, detail="❌ Internal server error.")
+    finally:
+        if upload is not None:
+            await upload.cleanup()
+
+
+@router.post("/upload/batch/facultyInformation")
+async def upload_faculty_information_batch(
+    file: UploadFile = File(...),
+    current_user: Optional[dict] = Depends(get_authenticated_user)
+):
+    """
+    Uploads faculty information for several departments at once from a zip of
+    Excel, CSV or Parquet files or a workbook with one sheet per department.
+    The department of each sheet is read from its content, as for single uploads.
+    """
+    upload = None
+    try:
+        uploader = current_user.get("username", "anonymous") if current_user else "anonymous"
+        logger.info(f"📥 User '{uploader}' uploading faculty information batch: {file.filename}")
+        upload = await receive_upload(file)
+        items = await split_batch_upload(upload.source, file.filename, upload.digest)
+
+        async def handle(item: BatchItem) -> dict:
+            return await process_faculty_info(
+                await item.read(), uploaded_by=uploader, sheet_name=item.sheet_name,
+                source_digest=item.source_digest, filename=item.source
+            )
+
+        report = await run_batch(items, handle)
+        report.update(uploaded_by=uploader)
+        return report
+
+    except FileProcessingError as e:
+        logger.error(f"❌ File processing error: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except (ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError) as e:
+        logger.warning(f"⚠️ Upload not processed: {e.detail}")
+        raise e
+    except Exception as e:
+        logger.error(f"❌ Unexpected error: {e}")
+        raise HTTPException(status_code=500, detail="❌ Internal server error.")
+    finally:
+        if upload is not None:
+            await upload.cleanup()
@@ -1,14 +1,29 @@
 # File: app/routes/course_routes.py
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, Form
-from app.services.course_service import process_offered_courses, get_offered_courses
-from app.models.schemas import CourseResponse
-from app.models.database import get_database
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, Form, Header, Response, Path, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from app.services.course_service import (
+    process_offered_courses, get_offered_courses_json, get_offered_courses_version, offered_courses_cache,
+    build_course_filter, search_offered_courses, get_offered_courses_summary, COURSE_FIELDS
+)
+from app.services.conflict_service import get_semester_conflicts
+from app.services.patch_service import parse_patch_rows, patch_offered_courses
+from app.services.export_service import build_export_filter, stream_export, CSV_FORMAT
+from app.services.job_service import enqueue_job, OFFERED_COURSES_JOB
+from app.utils.file_handler import receive_upload, receive_body
+from app.models.authentication import get_authenticated_user
+from app.utils.validators import time_to_minutes
+from app.utils.etag import etag_matches, format_etag
+from app.models.schemas import CourseResponse, CourseSearchResponse, CourseSummaryResponse
+from app.models.database import get_database, get_read_database
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from app.exceptions.custom_exceptions import FileProcessingError
+from app.exceptions.custom_exceptions import (
+    FileProcessingError, ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError
+)
 import logging
-from app.config import DEBUG_MODE
-from typing import Optional
+from app.config import DEBUG_MODE, UPLOAD_JOBS_ENABLED
+from typing import List, Optional
 
 router = APIRouter(tags=["Offered Courses"])
 logger = logging.getLogger(__name__)
@@ -19,6 +34,7 @@ async def upload_offered_courses(
     year: int = Form(..., description="Year of the courses, e.g., 2024"),
     semester_no: int = Form(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
     department: str = Form(..., description="Department short name, e.g., CSE"),
+    wait: bool = Form(False, description="Process the file within the request instead of as a background job"),
     # Temporarily mocking current_user since authentication is not implemented
     current_user: dict = Depends(lambda: {"username": "test_user"})
 ):
@@ -26,27 +42,44 @@ async def upload_offered_courses(
     Endpoint to upload offered courses file with required metadata.
 
     **Form Fields:**
-    - `file`: The Excel file containing offered courses.
+    - `file`: The Excel, CSV or Parquet file containing offered courses.
     - `year`: Year of the courses, e.g., 2024.
     - `semester_no`: Semester number (1: Spring, 2: Summer, 3: Fall).
     - `department`: Department short name, e.g., CSE.
+    - `wait`: Process the file within the request instead of as a background job.
+
+    Unless `wait` is set or upload jobs are disabled, the file is queued and the
+    response is `202` with a job id to poll at `GET /jobs/{job_id}`.
     """
+    upload = None
     try:
         logger.info(f"📥 User '{current_user['username']}' uploading offered courses file: {file.filename}")
 
-        # Read file content
-        file_content = await file.read()
+        # Receive the file in chunks, spilling large files to disk
+        upload = await receive_upload(file)
 
         if DEBUG_MODE:
-            logger.debug(f"📄 File content size: {len(file_content)} bytes")
+            logger.debug(f"📄 File content size: {upload.size} bytes ({'spooled to disk' if upload.path else 'in memory'})")
+
+        if UPLOAD_JOBS_ENABLED and not wait:
+            job = await enqueue_job(
+                get_database(),
+                OFFERED_COURSES_JOB,
+                upload,
+                {"user": current_user, "year": year, "semester_no": semester_no, "department": department,
+                 "source_digest": upload.digest}
+            )
+            return JSONResponse(status_code=202, content=jsonable_encoder(job))
 
         # Process the file, passing the metadata
         result = await process_offered_courses(
-            file_content,
+            upload.source,
             user=current_user,
             year=year,
             semester_no=semester_no,
-            department=department
+            department=department,
+            source_digest=upload.digest,
+            filename=file.filename
         )
 
         return {
@@ -56,15 +89,22 @@ async def upload_offered_courses(
             "year": result["year"],
             "total_courses": result["total_courses"],
             "uploaded_by": result["uploaded_by"],
-            "warnings": result.get("warnings", [])
+            "warnings": result.get("warnings", []),
+            "deduplicated": result.get("deduplicated", False)
         }
 
     except FileProcessingError as e:
         logger.error(f"❌ File processing error: {e.detail}")
         raise HTTPException(status_code=400, detail=e.detail)
+    except (ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError) as e:
+        logger.warning(f"⚠️ Upload not processed: {e.detail}")
+        raise e
     except Exception as e:
         logger.error(f"❌ Unexpected error: {e}")
         raise HTTPException(status_code=500, detail="❌ Internal server error.")
+    finally:
+        if upload is not None:
+            await upload.cleanup()
 
 @router.get(
     "/offeredCourses",
@@ -76,12 +116,224 @@ async def fetch_offered_courses(
     department: str = Query(..., description="Department code (e.g., CSE)"),
     semester: int = Query(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
     year: int = Query(..., description="Academic year (e.g., 2024)"),
-    db: AsyncIOMotorDatabase = Depends(get_database)
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response"),
+    db: AsyncIOMotorDatabase = Depends(get_read_database)
 ):
     """
     Fetches offered courses based on department, semester, and year.
+    Responses are cached per (department, semester, year) and served after a
+    version-only lookup confirms no worker has written the semester since.
+    A matching If-None-Match header is answered with 304 Not Modified.
+
+    Filtered, projected or paginated reads are served by GET /offeredCourses/search.
+    """
+    version = None
+    if if_none_match:
+        version = await get_offered_courses_version(db, department, semester, year)
+        if etag_matches(if_none_match, version):
+            return Response(status_code=304, headers=_cache_headers(version))
+
+    result = await get_offered_courses_json(db, department, semester, year, version)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No courses found for the given parameters.")
+    version, body = result
+    if etag_matches(if_none_match, version):
+        return Response(status_code=304, headers=_cache_headers(version))
+    return Response(content=body, media_type="application/json", headers=_cache_headers(version))
+
+@router.get(
+    "/offeredCourses/search",
+    response_model=CourseSearchResponse,
+    summary="Search Offered Courses",
+    tags=["Offered Courses"]
+)
+async def search_offered_course_sections(
+    department: str = Query(..., description="Department code (e.g., CSE)"),
+    semester: int = Query(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
+    year: int = Query(..., description="Academic year (e.g., 2024)"),
+    faculty: Optional[str] = Query(None, description="Only courses taught by this faculty short name"),
+    email: Optional[str] = Query(None, description="Only courses taught by this faculty email"),
+    course_code_prefix: Optional[str] = Query(None, description="Only courses whose code starts with this prefix, e.g., CSE1"),
+    days: Optional[str] = Query(None, description="Only courses on this day pattern, e.g., MW"),
+    room_no: Optional[str] = Query(None, description="Only courses in this room"),
+    starts_after: Optional[str] = Query(None, description="Only courses starting at or after this time, e.g., 10:00 AM"),
+    ends_before: Optional[str] = Query(None, description="Only courses ending at or before this time, e.g., 02:00 PM"),
+    fields: Optional[str] = Query(None, description="Comma-separated course fields to return, e.g., course_code,section,room_no"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size"),
+    cursor: Optional[int] = Query(None, ge=0, description="next_cursor of the previous page"),
+    db: AsyncIOMotorDatabase = Depends(get_read_database)
+):
+    """
+    Filters, projects and paginates the courses of one semester in MongoDB.
+    The response contains the matching `courses` with the requested `fields`,
+    their `count` and `next_cursor` (null on the last page).
+    """
+    bounds = {}
+    for name, value in (("starts_after", starts_after), ("ends_before", ends_before)):
+        if value is not None:
+            bounds[name] = time_to_minutes(value)
+            if bounds[name] is None:
+                raise HTTPException(status_code=422, detail=f"Invalid {name} time '{value}', expected e.g. 10:00 AM")
+    conditions = build_course_filter(faculty, email, course_code_prefix, days, room_no, **bounds)
+    selected = None
+    if fields:
+        selected = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in selected if field not in COURSE_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=422, detail=f"Unknown fields: {', '.join(unknown)}")
+    result = await search_offered_courses(db, department, semester, year, conditions, selected, limit, cursor)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No courses found for the given parameters.")
+    return JSONResponse(content=result)
+
+@router.patch(
+    "/offeredCourses",
+    summary="Patch Offered Course Sections",
+    tags=["Offered Courses"]
+)
+async def patch_offered_course_sections(
+    request: Request,
+    department: str = Query(..., description="Department code (e.g., CSE)"),
+    semester: int = Query(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
+    year: int = Query(..., description="Academic year (e.g., 2024)"),
+    content_type: Optional[str] = Header(None),
+    current_user: Optional[dict] = Depends(get_authenticated_user),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Changes individual sections of an uploaded semester in place, e.g. seat
+    counts synced during registration, without uploading the whole sheet.
+
+    **Body:** JSON (a list of objects or `{"changes": [...]}`) or CSV with
+    `Content-Type: text/csv`. Each row names `course_code` and `section` and
+    any of `faculty`, `timing`, `room_no`, `capacity` and `seat_taken`:
+
+        [{"course_code": "CSE101", "section": 1, "seat_taken": 38}]
+
+    In JSON a null clears the field; in CSV empty cells are left unchanged.
+    Invalid rows and unknown sections are skipped and reported in `warnings`,
+    as are timetable conflicts caused by changed faculty, timings or rooms.
+    Bodies larger than the upload size limit are rejected with 413.
+    """
+    try:
+        user = current_user or {"username": "anonymous"}
+        logger.info(f"📥 User '{user.get('username', 'anonymous')}' patching offered courses: {department} {semester}/{year}")
+        rows = parse_patch_rows(await receive_body(request), content_type)
+        result = await patch_offered_courses(db, department, semester, year, rows, user)
+    except FileProcessingError as e:
+        logger.error(f"❌ Patch processing error: {e.detail}")
+        raise HTTPException(status_code=400, detail=e.detail)
+    except (ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError) as e:
+        logger.warning(f"⚠️ Patch not processed: {e.detail}")
+        raise e
+    except Exception as e:
+        logger.error(f"❌ Unexpected error: {e}")
+        raise HTTPException(status_code=500, detail="❌ Internal server error.")
+    if result is None:
+        raise HTTPException(status_code=404, detail="No courses found for the given parameters.")
+    return result
+
+def _cache_headers(version: str) -> dict:
+    # Clients may keep the body but must revalidate it with If-None-Match
+    return {"ETag": format_etag(version), "Cache-Control": "no-cache"}
+
+@router.get(
+    "/offeredCourses/export",
+    summary="Export Offered Courses",
+    tags=["Offered Courses"]
+)
+async def export_offered_courses(
+    format: str = Query("ndjson", regex="^(ndjson|csv)$", description="ndjson (one section per line) or csv"),
+    department: Optional[List[str]] = Query(None, description="Department codes; repeat for several, all when omitted"),
+    year_from: Optional[int] = Query(None, description="First academic year to include"),
+    year_to: Optional[int] = Query(None, description="Last academic year to include"),
+    semester_from: Optional[int] = Query(None, ge=1, le=3, description="Lowest semester number to include"),
+    semester_to: Optional[int] = Query(None, ge=1, le=3, description="Highest semester number to include"),
+    gzip: bool = Query(False, description="Compress the stream with gzip"),
+    db: AsyncIOMotorDatabase = Depends(get_read_database)
+):
+    """
+    Streams every section of the matching semesters, one row per section with
+    its department, semester and year, ordered by department, semester and year.
+    Rows are read from MongoDB cursors and written as they arrive, so exports of
+    any size use constant memory.
+    """
+    query = build_export_filter(department, year_from, year_to, semester_from, semester_to)
+    media_type = "text/csv" if format == CSV_FORMAT else "application/x-ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="offered_courses.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(stream_export(db, query, format, gzip), media_type=media_type, headers=headers)
+
+@router.get(
+    "/offeredCourses/summary",
+    response_model=CourseSummaryResponse,
+    summary="Offered Courses Summary",
+    tags=["Offered Courses"]
+)
+async def fetch_offered_courses_summary(
+    department: str = Query(..., description="Department code (e.g., CSE)"),
+    semester: int = Query(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
+    year: int = Query(..., description="Academic year (e.g., 2024)"),
+    db: AsyncIOMotorDatabase = Depends(get_read_database)
+):
+    """
+    Returns the aggregates computed when the semester was uploaded: totals,
+    sections and seats per faculty (`faculty_load`), fill ratio per course
+    (`course_fill`) and sections per room, day and time slot (`room_occupancy`).
+    """
+    summary = await get_offered_courses_summary(db, department, semester, year)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="No courses found for the given parameters.")
+    return summary
+
+@router.get(
+    "/offeredCourses/summary/{part}",
+    summary="Offered Courses Summary Part",
+    tags=["Offered Courses"]
+)
+async def fetch_offered_courses_summary_part(
+    part: str = Path(..., regex="^(faculty_load|course_fill|room_occupancy)$", description="One of faculty_load, course_fill, room_occupancy"),
+    department: str = Query(..., description="Department code (e.g., CSE)"),
+    semester: int = Query(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
+    year: int = Query(..., description="Academic year (e.g., 2024)"),
+    db: AsyncIOMotorDatabase = Depends(get_read_database)
+):
+    """
+    Returns one list of the semester summary, e.g. only `room_occupancy`.
     """
-    offered_courses = await get_offered_courses(db, department, semester, year)
-    if not offered_courses:
+    summary = await get_offered_courses_summary(db, department, semester, year)
+    if summary is None:
         raise HTTPException(status_code=404, detail="No courses found for the given parameters.")
-    return offered_courses
+    return {"department": department, "semester": semester, "year": year, part: summary[part]}
+
+@router.get(
+    "/offeredCourses/conflicts",
+    summary="Timetable Conflicts",
+    tags=["Offered Courses"]
+)
+async def fetch_offered_courses_conflicts(
+    semester: int = Query(..., ge=1, le=3, description="Semester number (1: Spring, 2: Summer, 3: Fall)"),
+    year: int = Query(..., description="Academic year (e.g., 2024)"),
+    department: Optional[str] = Query(None, description="Only conflicts involving this department"),
+    type: Optional[str] = Query(None, regex="^(room|faculty)$", description="room (double-booked rooms) or faculty (overlapping classes)"),
+    db: AsyncIOMotorDatabase = Depends(get_read_database)
+):
+    """
+    Lists room double-bookings and faculty overlaps in a semester across all
+    departments. Each conflict names the room or faculty, the days and the
+    overlapping time window, and both sections.
+    """
+    conflicts = await get_semester_conflicts(db, semester, year, department, type)
+    return {"semester": semester, "year": year, "department": department, "count": len(conflicts), "conflicts": conflicts}
+
+@router.get(
+    "/offeredCourses/cache/stats",
+    summary="Offered Courses Cache Statistics",
+    tags=["Offered Courses"]
+)
+async def offered_courses_cache_stats():
+    """
+    Returns hit, miss and eviction counters of the offered courses cache.
+    """
+    return offered_courses_cache.stats()
@@ -1,12 +1,22 @@
 # File: python_server/app/routes/faculty_routes.py
 
 from typing import Optional
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Query, Response, Form
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from app.services.faculty_service import process_faculty_info
+from app.services.job_service import enqueue_job, FACULTY_INFORMATION_JOB
+from app.services.faculty_directory import get_faculty_index, faculty_cache_stats
+from app.utils.file_handler import receive_upload
+from app.models.schemas import FacultyResponse
+from app.models.database import get_database
 from app.models.authentication import get_authenticated_user
-from app.exceptions.custom_exceptions import FileProcessingError
+from app.exceptions.custom_exceptions import (
+    FileProcessingError, ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError
+)
 import logging
-from app.config import DEBUG_MODE
+from app.config import DEBUG_MODE, UPLOAD_JOBS_ENABLED
 
 router = APIRouter(tags=["Faculty Information"])
 logger = logging.getLogger(__name__)
@@ -15,11 +25,15 @@ logger = logging.getLogger(__name__)
 @router.post("/upload/facultyInformation")
 async def upload_faculty_information(
     file: UploadFile = File(...), 
+    wait: bool = Form(False, description="Process the file within the request instead of as a background job"),
     current_user: Optional[dict] = Depends(get_authenticated_user)
 ):
     """
     Endpoint to upload and process faculty information.
+    Unless `wait` is set or upload jobs are disabled, the file is queued and the
+    response is `202` with a job id to poll at `GET /jobs/{job_id}`.
     """
+    upload = None
     try:
         logger.debug(f"Received upload request from user: {current_user}")
         if current_user and current_user.get("username") != "anonymous":
@@ -29,25 +43,70 @@ async def upload_faculty_information(
             uploader = "anonymous"
             logger.info(f"📥 Anonymous user uploading faculty information file: {file.filename}")
         
-        # Read file content
-        file_content = await file.read()
+        # Receive the file in chunks, spilling large files to disk
+        upload = await receive_upload(file)
 
         if DEBUG_MODE:
-            logger.debug(f"📄 File content size: {len(file_content)} bytes")
+            logger.debug(f"📄 File content size: {upload.size} bytes ({'spooled to disk' if upload.path else 'in memory'})")
+
+        if UPLOAD_JOBS_ENABLED and not wait:
+            job = await enqueue_job(
+                get_database(), FACULTY_INFORMATION_JOB, upload,
+                {"uploaded_by": uploader, "source_digest": upload.digest}
+            )
+            return JSONResponse(status_code=202, content=jsonable_encoder(job))
 
         # Process the file
-        result = await process_faculty_info(file_content, uploaded_by=uploader)
+        result = await process_faculty_info(
+            upload.source, uploaded_by=uploader, source_digest=upload.digest, filename=file.filename
+        )
 
         return {
             "message": result["message"],
             "department": result["department"],
             "total_records": result["total_records"],
-            "uploaded_by": uploader
+            "uploaded_by": uploader,
+            "deduplicated": result.get("deduplicated", False)
         }
 
     except FileProcessingError as e:
         logger.error(f"❌ File processing error: {e.detail}")
         raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except (ServiceUnavailableError, ProcessingTimeoutError, PayloadTooLargeError) as e:
+        logger.warning(f"⚠️ Upload not processed: {e.detail}")
+        raise e
     except Exception as e:
         logger.error(f"❌ Unexpected error: {e}")
         raise HTTPException(status_code=500, detail="❌ Internal server error.")
+    finally:
+        if upload is not None:
+            await upload.cleanup()
+
+
+@router.get(
+    "/facultyInformation",
+    response_model=FacultyResponse,
+    summary="Retrieve Faculty Information"
+)
+async def fetch_faculty_information(
+    department: str = Query(..., description="Department code (e.g., CSE)"),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Fetches the faculty list of a department from the shared faculty directory cache.
+    """
+    index = await get_faculty_index(db, department)
+    if index is None:
+        raise HTTPException(status_code=404, detail="No faculty information found for the given department.")
+    return Response(content=index.body(), media_type="application/json")
+
+
+@router.get(
+    "/facultyInformation/cache/stats",
+    summary="Faculty Directory Cache Statistics"
+)
+async def faculty_information_cache_stats():
+    """
+    Returns hit, miss, revalidation and reload counters of the faculty directory cache.
+    """
+    return faculty_cache_stats()
@@ -0,0 +1,34 @@
+# File: app/routes/job_routes.py
+
+from fastapi import APIRouter, HTTPException, Depends, Path
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.services.job_service import get_job
+from app.models.database import get_database
+import logging
+
+router = APIRouter(tags=["Upload Jobs"])
+logger = logging.getLogger(__name__)
+
+
+@router.get(
+    "/jobs/{job_id}",
+    summary="Retrieve Upload Job Status"
+)
+async def fetch_job(
+    job_id: str = Path(..., description="Job id returned by an upload endpoint"),
+    db: AsyncIOMotorDatabase = Depends(get_database)
+):
+    """
+    Returns the status of an upload job.
+
+    `status` is one of queued, running, succeeded or failed. While running,
+    `stage` names the step in progress (faculty_lookup, dedupe_check, parse,
+    conflicts, save, summary) and `rows_processed` the rows parsed from the
+    file once the parse stage is done. Finished jobs include
+    `rows` with the row and warning counts, and either the upload `result`
+    (with its `warnings` list) or an `error`.
+    """
+    job = await get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Upload job not found.")
+    return job
@@ -0,0 +1,55 @@
+# File: app/routes/metrics_routes.py
+
+from fastapi import APIRouter, Response
+from app.utils.metrics import REGISTRY
+from app.models.database import pool_options
+import logging
+
+router = APIRouter(tags=["Metrics"])
+logger = logging.getLogger(__name__)
+
+# Starlette appends "; charset=utf-8"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus Metrics",
+    response_class=Response
+)
+async def prometheus_metrics():
+    """
+    Exposes the metrics of this worker process in the Prometheus text format:
+    request latency and sizes per route, upload pipeline stage timings and
+    outcomes, MongoDB command latency and connection pools, cache counters and
+    the parse queue.
+    With several worker processes, each one reports its own values.
+    """
+    return Response(content=REGISTRY.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get(
+    "/metrics/requests",
+    summary="Request Latency Statistics"
+)
+async def request_metrics():
+    """
+    Returns the request metrics of this worker process: latency and body size
+    histograms per route (count, sum and p50/p95/p99 bucket bounds in seconds
+    or bytes) and response counts per status code.
+    """
+    return REGISTRY.snapshot("http_")
+
+
+@router.get(
+    "/metrics/mongodb/pool",
+    summary="MongoDB Connection Pool Statistics"
+)
+async def mongodb_pool_metrics():
+    """
+    Returns the connection settings and, per server, the open and checked out
+    connections, checkout waits (count, sum and p50/p95/p99 bucket bounds in
+    seconds), failed checkouts per reason and pool clears. Checkout waits that
+    grow under load mean MONGO_MAX_POOL_SIZE is too small for the concurrent reads.
+    """
+    return {"options": pool_options(), **REGISTRY.snapshot("mongodb_pool_")}
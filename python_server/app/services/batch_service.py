@@ -0,0 +1,173 @@
+# File: app/services/batch_service.py
+
+import asyncio
+import os
+import zipfile
+from io import BytesIO
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+from fastapi import HTTPException
+from app.exceptions.custom_exceptions import FileProcessingError, PayloadTooLargeError
+from app.utils.parse_executor import run_parse_job
+from app.utils.file_handler import EXTENSION_FORMATS
+from app.config import BATCH_MAX_CONCURRENCY, BATCH_MAX_UNCOMPRESSED_BYTES
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Zip members are read as Excel, CSV or Parquet files by extension
+TABLE_EXTENSIONS = tuple(EXTENSION_FORMATS)
+
+
+class BatchItem:
+    """
+    One sheet of a batch upload: the workbook content (or its path) plus the
+    sheet to read. `name` is the zip member stem or the sheet name, used as the
+    department for offered courses.
+
+    For zip members, `content` is the archive and `member` the name of the file
+    in it; the member is only decompressed by read(), when its turn comes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        content: Union[bytes, str],
+        sheet_name: Optional[str] = None,
+        source_digest: Optional[str] = None,
+        member: Optional[str] = None
+    ):
+        self.name = name
+        self.source = source
+        self.content = content
+        self.sheet_name = sheet_name
+        self.source_digest = source_digest
+        self.member = member
+
+    async def read(self) -> Union[bytes, str]:
+        """
+        Content of the sheet, decompressing zip members in the parse executor
+        so large members do not block the event loop.
+        """
+        if self.member is None:
+            return self.content
+        try:
+            return await run_parse_job(read_archive_member, self.content, self.member)
+        except (zipfile.BadZipFile, zipfile.LargeZipFile) as e:
+            logger.error(f"❌ Failed to decompress batch member {self.source}: {e}")
+            raise FileProcessingError(detail=f"❌ Could not read {self.source} from the archive.")
+
+
+def _open(source: Union[bytes, str]):
+    return BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+
+def read_archive_member(archive: Union[bytes, str], member: str) -> bytes:
+    """
+    Decompresses one member of a zip archive. Runs inside the parse executor.
+    Reads stop at the size declared in the archive, which split_batch_upload
+    has checked against BATCH_MAX_UNCOMPRESSED_BYTES.
+    """
+    with zipfile.ZipFile(_open(archive)) as opened:
+        return opened.read(member)
+
+
+def _list_sheets(content: Union[bytes, str]) -> List[str]:
+    # Imported on first use, in the parse worker, like the rest of the ingestion stack
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(_open(content), read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+async def split_batch_upload(
+    content: Union[bytes, str],
+    filename: str,
+    source_digest: Optional[str] = None
+) -> List[BatchItem]:
+    """
+    Splits a batch upload into sheets. A zip archive yields one item per Excel,
+    CSV or Parquet member (first sheet of workbooks), a workbook yields one
+    item per sheet.
+
+    :param content: Content of the upload or a path to it.
+    :param source_digest: SHA-256 digest of the upload, shared by the sheets of a workbook.
+    """
+    try:
+        archive = zipfile.ZipFile(_open(content))
+    except zipfile.BadZipFile:
+        raise FileProcessingError(detail="❌ Batch upload must be a zip archive or an Excel workbook.")
+
+    with archive:
+        names = archive.namelist()
+        # An .xlsx file is itself a zip archive with a content types part
+        if "[Content_Types].xml" in names:
+            try:
+                sheets = await run_parse_job(_list_sheets, content)
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Failed to read batch workbook {filename}: {e}")
+                raise FileProcessingError(detail="❌ Invalid Excel file format.")
+            return [
+                BatchItem(sheet, f"{filename}:{sheet}", content, sheet_name=sheet, source_digest=source_digest)
+                for sheet in sheets
+            ]
+
+        items = []
+        uncompressed = 0
+        for member in archive.infolist():
+            base = os.path.basename(member.filename)
+            if member.is_dir() or base.startswith((".", "~$")) or member.filename.startswith("__MACOSX/"):
+                continue
+            stem, extension = os.path.splitext(base)
+            if extension.lower() not in TABLE_EXTENSIONS:
+                logger.warning(f"⚠️ Skipping unsupported batch member: {member.filename}")
+                continue
+            # Only the central directory is read here; members are decompressed one by one later
+            uncompressed += member.file_size
+            items.append(BatchItem(stem, member.filename, content, member=member.filename))
+
+    if uncompressed > BATCH_MAX_UNCOMPRESSED_BYTES:
+        logger.error(f"❌ Batch archive {filename} expands to {uncompressed} bytes (limit {BATCH_MAX_UNCOMPRESSED_BYTES})")
+        raise PayloadTooLargeError(
+            detail=f"❌ Batch archive expands to more than {BATCH_MAX_UNCOMPRESSED_BYTES // (1024 * 1024)} MB."
+        )
+    if not items:
+        raise FileProcessingError(detail="❌ The archive does not contain any Excel, CSV or Parquet files.")
+    return items
+
+
+async def run_batch(items: List[BatchItem], handler: Callable[[BatchItem], Awaitable[Dict]]) -> Dict:
+    """
+    Runs `handler` for every item with at most BATCH_MAX_CONCURRENCY items in
+    flight. Each item succeeds or fails on its own; failures are reported in
+    the result instead of aborting the batch.
+
+    :return: Per-item results in input order with success and failure counts.
+    """
+    semaphore = asyncio.Semaphore(max(1, BATCH_MAX_CONCURRENCY))
+
+    async def run_one(item: BatchItem) -> Dict:
+        async with semaphore:
+            try:
+                result = await handler(item)
+                return {"source": item.source, "status": "succeeded", **result}
+            except HTTPException as e:
+                logger.error(f"❌ Batch item {item.source} failed: {e.detail}")
+                return {"source": item.source, "status": "failed", "error": e.detail}
+            except Exception as e:
+                logger.error(f"❌ Batch item {item.source} failed unexpectedly: {e}")
+                return {"source": item.source, "status": "failed", "error": "❌ Internal server error."}
+
+    results = await asyncio.gather(*(run_one(item) for item in items))
+    succeeded = sum(1 for result in results if result["status"] == "succeeded")
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": list(results)
+    }
@@ -0,0 +1,216 @@
+# File: app/services/conflict_service.py
+
+import heapq
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.services.export_service import iter_export_rows
+from app.utils.parse_executor import run_parse_job
+from app.utils.validators import time_to_minutes, minutes_to_time
+import logging
+
+logger = logging.getLogger(__name__)
+
+ROOM_CONFLICT = "room"
+FACULTY_CONFLICT = "faculty"
+
+
+def _faculty_key(row: Dict) -> Optional[str]:
+    # Emails identify faculty across departments; short names only within one
+    if row.get("email"):
+        return row["email"].lower()
+    if row.get("faculty"):
+        return f"{row.get('department')}:{row['faculty']}"
+    return None
+
+
+def _minutes(timing: Dict, field: str) -> Optional[int]:
+    minutes = timing.get(f"{field}_minutes")
+    if minutes is None and isinstance(timing.get(f"{field}_time"), str):
+        # Sections stored before the minutes were kept next to the display times
+        minutes = time_to_minutes(timing[f"{field}_time"])
+    return minutes
+
+
+def _interval_groups(rows: List[Dict]) -> Dict[Tuple[str, str, str], List[Tuple[int, int, int]]]:
+    """
+    Groups the minute intervals of all sections by (conflict type, resource, day letter).
+    """
+    groups = defaultdict(list)
+    for index, row in enumerate(rows):
+        timing = row.get("timing") or {}
+        start, end = _minutes(timing, "start"), _minutes(timing, "end")
+        if not timing.get("days") or start is None or end is None or end <= start:
+            continue
+        resources = []
+        if row.get("room_no"):
+            resources.append((ROOM_CONFLICT, str(row["room_no"])))
+        faculty = _faculty_key(row)
+        if faculty:
+            resources.append((FACULTY_CONFLICT, faculty))
+        for kind, resource in resources:
+            for day in timing["days"]:
+                groups[(kind, resource, day)].append((start, end, index))
+    return groups
+
+
+def _section(row: Dict) -> Dict:
+    return {
+        "department": row.get("department"),
+        "course_code": row.get("course_code"),
+        "section": row.get("section"),
+        "faculty": row.get("faculty"),
+        "room_no": row.get("room_no"),
+        "timing": row.get("timing"),
+    }
+
+
+def find_conflicts(rows: List[Dict], focus_department: Optional[str] = None) -> List[Dict]:
+    """
+    Finds room double-bookings and faculty overlaps among the given sections.
+
+    Timings become minute intervals per day letter and every (resource, day)
+    group is swept in start order with a heap of the intervals still running,
+    so the cost is O(n log n) plus the number of overlapping pairs instead of
+    comparing every pair of sections. Overlaps of the same two sections on
+    several days are reported once with all their days.
+
+    :param rows: Sections with `department`, `course_code`, `section`, `faculty`,
+                 `email`, `room_no` and `timing`.
+    :param focus_department: Only report conflicts involving a section of this department.
+    :return: Conflicts with their type, resource, days, overlapping window and both sections.
+    """
+    pairs: Dict[Tuple[str, str, int, int], Dict] = {}
+    for (kind, resource, day), intervals in _interval_groups(rows).items():
+        if len(intervals) < 2:
+            continue
+        intervals.sort()
+        running: List[Tuple[int, int, int]] = []  # (end, start, index)
+        for start, end, index in intervals:
+            while running and running[0][0] <= start:
+                heapq.heappop(running)
+            for other_end, other_start, other in running:
+                first, second = sorted((other, index))
+                if focus_department and focus_department not in (rows[first].get("department"), rows[second].get("department")):
+                    continue
+                conflict = pairs.setdefault((kind, resource, first, second), {
+                    "type": kind,
+                    "resource": rows[first]["room_no"] if kind == ROOM_CONFLICT else (rows[first].get("email") or rows[first].get("faculty")),
+                    "days": "",
+                    "start_time": minutes_to_time(max(start, other_start)),
+                    "end_time": minutes_to_time(min(end, other_end)),
+                    "sections": [_section(rows[first]), _section(rows[second])],
+                })
+                if day not in conflict["days"]:
+                    conflict["days"] += day
+            heapq.heappush(running, (end, start, index))
+    return list(pairs.values())
+
+
+def _describe(conflict: Dict, own: Dict, other: Dict) -> str:
+    if conflict["type"] == ROOM_CONFLICT:
+        subject = f"Room {conflict['resource']} is double-booked"
+    else:
+        subject = f"Faculty {own.get('faculty') or conflict['resource']} is scheduled twice"
+    where = f" ({other['department']})" if other["department"] != own["department"] else ""
+    return (f"{subject} on {conflict['days']} {conflict['start_time']} - {conflict['end_time']} "
+            f"with {other['course_code']} section {other['section']}{where}.")
+
+
+def conflict_warnings(conflicts: List[Dict], department: str) -> List[Dict]:
+    """
+    Turns conflicts into upload warnings, attributed to the uploaded department's section.
+    """
+    warnings_list = []
+    for conflict in conflicts:
+        first, second = conflict["sections"]
+        own, other = (second, first) if first["department"] != department else (first, second)
+        warnings_list.append({
+            "record": None,
+            "course_code": own["course_code"],
+            "errors": [_describe(conflict, own, other)]
+        })
+    return warnings_list
+
+
+async def load_semester_rows(
+    db: AsyncIOMotorDatabase,
+    semester: int,
+    year: int,
+    exclude_department: Optional[str] = None
+) -> List[Dict]:
+    """
+    Reads the sections of every department in one semester, optionally without one department.
+    """
+    query = {"semester": semester, "year": year}
+    if exclude_department:
+        query["department"] = {"$ne": exclude_department}
+    return [row async for row in iter_export_rows(db, query)]
+
+
+def shared_resources_filter(courses: Iterable[Dict]) -> Optional[Dict]:
+    """
+    Filter on course fields matching sections that share a room, a faculty
+    email or a faculty short name with `courses`, or None if they have none.
+    Emails are matched as given and lowercased, since _faculty_key compares
+    them lowercased. Sections without a shared resource cannot clash.
+    """
+    rooms, emails, faculty = set(), set(), set()
+    for course in courses:
+        if course.get("room_no"):
+            rooms.add(str(course["room_no"]))
+        if course.get("email"):
+            emails.update((course["email"], course["email"].lower()))
+        if course.get("faculty"):
+            faculty.add(course["faculty"])
+    conditions = [
+        {field: {"$in": sorted(values)}}
+        for field, values in (("room_no", rooms), ("email", emails), ("faculty", faculty)) if values
+    ]
+    return {"$or": conditions} if conditions else None
+
+
+async def load_shared_rows(
+    db: AsyncIOMotorDatabase,
+    semester: int,
+    year: int,
+    courses: List[Dict],
+    exclude_department: Optional[str] = None
+) -> List[Dict]:
+    """
+    Reads only the sections of one semester that could clash with `courses`,
+    so the cost follows the rooms and faculty of the upload instead of the
+    size of the whole semester.
+
+    :param courses: Sections whose rooms, emails and faculty short names are looked up.
+    :param exclude_department: Department whose stored sections are left out, e.g. the one being replaced.
+    """
+    course_filter = shared_resources_filter(courses)
+    if course_filter is None:
+        return []
+    query = {"semester": semester, "year": year}
+    if exclude_department:
+        query["department"] = {"$ne": exclude_department}
+    return [row async for row in iter_export_rows(db, query, course_filter)]
+
+
+async def get_semester_conflicts(
+    db: AsyncIOMotorDatabase,
+    semester: int,
+    year: int,
+    department: Optional[str] = None,
+    conflict_type: Optional[str] = None
+) -> List[Dict]:
+    """
+    Checks the whole semester, across departments, for clashes. Computed on
+    every call from the stored sections so it reflects the latest uploads of
+    all departments.
+
+    :param department: Only return conflicts involving this department.
+    :param conflict_type: Only return ROOM_CONFLICT or FACULTY_CONFLICT conflicts.
+    """
+    rows = await load_semester_rows(db, semester, year)
+    conflicts = await run_parse_job(find_conflicts, rows, department)
+    if conflict_type:
+        conflicts = [conflict for conflict in conflicts if conflict["type"] == conflict_type]
+    return conflicts
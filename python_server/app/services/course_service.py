@@ -1,21 +1,50 @@
 # File: app/services/course_service.py
 
-import pandas as pd
-from io import BytesIO
-from typing import Dict, List, Optional  # Step 1: Import Optional
-from app.models.schemas import OfferedCourses, Course, Timing
+import hashlib
+from contextlib import ExitStack
+import re
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union  # Step 1: Import Optional
+from app.models.schemas import OfferedCourses, Course, Timing, COURSE_FIELDS
 from app.models.database import get_database
-from app.utils.validators import parse_timing
+from app.utils.validators import timing_dict, TIMING_KEYS, email_column, values_of_type
+from app.utils.parse_executor import run_parse_job
+from app.utils.file_handler import content_digest
 from app.exceptions.custom_exceptions import FileProcessingError
+from app.services.section_store import (
+    SECTIONS_COLLECTION, SECTIONED_LAYOUT, semester_key, dedupe_sections, save_sections, load_sections, delete_sections
+)
+from app.services.faculty_directory import get_faculty_index
+from app.services.conflict_service import find_conflicts, conflict_warnings, load_shared_rows
+from app.services.summary_service import summarize_courses, save_course_summary, load_course_summary
+from app.utils.cache import TTLCache
+from app.utils.metrics import StageTimer, observe_stage, record_stages, count_failures, UPLOADS, UPLOAD_RECORDS, UPLOAD_WARNINGS
+from app.utils.etag import compute_version
+from app.utils.progress import ProgressCallback, report_progress
+from app.config import (
+    INGEST_CHUNK_ROWS, BULK_VALIDATION, OFFERED_COURSES_STORAGE,
+    OFFERED_COURSES_CACHE_TTL_SECONDS, OFFERED_COURSES_CACHE_MAX_ENTRIES
+)
 import logging
-import numpy as np
 
 from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from app.models.schemas import CourseResponse
 
+if TYPE_CHECKING:
+    # The ingestion functions import pandas themselves, so read-only workers never load it
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# (version, serialized body) of GET /offeredCourses keyed by (department, semester, year)
+offered_courses_cache = TTLCache(
+    "offered_courses",
+    max_entries=OFFERED_COURSES_CACHE_MAX_ENTRIES,
+    ttl_seconds=OFFERED_COURSES_CACHE_TTL_SECONDS
+)
+
 # Define a mapping from Excel columns to backend-expected columns
 COLUMN_MAPPING = {
     'course': 'course_code',
@@ -26,211 +55,646 @@ COLUMN_MAPPING = {
 # Define columns to drop
 COLUMNS_TO_DROP = ['dedicated_department', 'action']
 
+# Pipeline label of the upload stage metrics
+OFFERED_COURSES_PIPELINE = "offered_courses"
+
 def sanitize_field(x, field_type: str) -> Optional:
     """
     Sanitize fields by setting them to None if missing or invalid.
     For 'room_no', convert to string.
     For other fields, retain their value or set to None if NaN.
     """
+    import pandas as pd
+
     if pd.isna(x):
         return None
     if field_type == 'room_no':
         return str(x)
     return x
 
-async def process_offered_courses(file_content: bytes, user: dict, year: int, semester_no: int, department: str) -> dict:
+def normalize_column_name(name: str) -> str:
     """
-    Processes the offered courses file and saves it to the database.
-
-    :param file_content: Content of the uploaded file.
-    :param user: Dictionary containing user information.
-    :param year: Year of the offered courses.
-    :param semester_no: Semester number (1: Spring, 2: Summer, 3: Fall).
-    :param department: Department short name, e.g., CSE.
-    :return: Summary of the processing result.
+    Normalizes column names to lowercase with underscores.
     """
-    try:
-        logger.info(f"✅ Received metadata: Year={year}, SemesterNo={semester_no}, Department={department}")
-    except Exception as e:
-        logger.error(f"❌ Metadata extraction error: {e}")
-        raise FileProcessingError(detail="❌ Failed to process metadata.")
+    return name.lower().replace(' ', '_')
 
-    try:
-        # Read the uploaded Excel file using openpyxl engine
-        df = pd.read_excel(BytesIO(file_content), engine='openpyxl')
-        logger.info("✅ Excel file read into DataFrame successfully.")
-    except Exception as e:
-        logger.error(f"❌ Failed to read Excel file: {e}")
-        raise FileProcessingError(detail="❌ Invalid Excel file format.")
-
-    # Normalize column names to lowercase with underscores
-    df.columns = [col.lower().replace(' ', '_') for col in df.columns]
+def _coerce_int_column(column: "pd.Series") -> "pd.Series":
+    """
+    Converts whole-number values of a column to Python ints in one pass.
+    Values that are not whole numbers are left untouched so that Course
+    validation reports them exactly as before.
+    """
+    import pandas as pd
 
-    # Rename columns based on COLUMN_MAPPING
-    df.rename(columns=COLUMN_MAPPING, inplace=True)
+    numeric = pd.to_numeric(column, errors='coerce')
+    whole = numeric.notna() & (numeric % 1 == 0)
+    coerced = column.copy()
+    coerced[whole] = numeric[whole].astype('int64').astype(object)
+    return coerced
 
-    # Drop unnecessary columns
-    df.drop(columns=[col for col in COLUMNS_TO_DROP if col in df.columns], inplace=True)
+def sanitize_course_frame(df: "pd.DataFrame", faculty_email_map: Dict[str, str]) -> "pd.DataFrame":
+    """
+    Column-wise equivalent of sanitize_field, the faculty email lookup and
+    timing parsing for a chunk of offered course records.
 
-    # Validate required columns
-    required_columns = ["course_code", "section", "faculty", "capacity", "seat_taken"]
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        logger.error(f"❌ Uploaded file is missing required columns: {missing_columns}")
-        raise FileProcessingError(detail=f"❌ Missing columns: {', '.join(missing_columns)}")
+    :param df: Chunk of normalized course records.
+    :param faculty_email_map: Mapping of faculty short name to email.
+    :return: DataFrame with sanitized values plus `email` and `timing` columns and
+             the `missing_course_code`, `missing_faculty` and `missing_email` flags.
+    """
+    import pandas as pd
 
-    # Handle 'timing' as optional
-    if 'timing' not in df.columns:
-        logger.warning("⚠️ 'timing' column is missing. Setting timing to None for all records.")
-        df['timing'] = None
-    else:
+    df = df.astype(object)
+    for field in ['course_code', 'section', 'faculty', 'timing', 'room_no', 'capacity', 'seat_taken']:
+        if field not in df.columns:
+            df[field] = None
         # Replace NaN with None
-        df['timing'] = df['timing'].where(pd.notnull(df['timing']), None)
+        df[field] = df[field].where(pd.notna(df[field]), None)
+
+    # Coerce integer fields
+    for field in ['capacity', 'seat_taken', 'section']:
+        df[field] = _coerce_int_column(df[field])
 
     # Handle 'room_no' conversion to string without validation
-    if 'room_no' in df.columns:
-        df['room_no'] = df['room_no'].apply(lambda x: sanitize_field(x, 'room_no'))
+    has_room = df['room_no'].notna()
+    df.loc[has_room, 'room_no'] = df.loc[has_room, 'room_no'].astype(str)
 
-    # Sanitize other fields
-    for field in ['capacity', 'seat_taken', 'section', 'faculty', 'course_code']:
-        df[field] = df[field].apply(lambda x: sanitize_field(x, field))
+    # Join faculty emails
+    email = df['faculty'].map(faculty_email_map)
+    df['email'] = email.where(email.notna(), None)
 
-    # Fetch faculty information for mapping
-    db = get_database()
-    faculty_info = await db["faculty_information"].find_one({"department": department})
-    if not faculty_info:
-        logger.error(f"❌ No faculty information found for department: {department}")
-        raise FileProcessingError(detail=f"❌ No faculty information found for department: {department}")
+    # Parse each distinct timing string once; sections share a small set of time slots
+    codes, distinct = pd.factorize(df['timing'], use_na_sentinel=True)
+    parsed = [timing_dict(value) for value in distinct]
+    df['timing'] = [None if code < 0 or parsed[code] is None else dict(parsed[code]) for code in codes]
+
+    # Flag rows that need per-row handling
+    df['missing_course_code'] = df['course_code'].isna() | (df['course_code'] == '')
+    df['missing_faculty'] = df['faculty'].isna() | (df['faculty'] == '')
+    df['missing_email'] = df['email'].isna() & ~df['missing_faculty']
+    return df
 
-    faculty_email_map = {faculty["short_name"]: faculty["email"] for faculty in faculty_info.get("faculty_list", [])}
+def _record_warnings(chunk: "pd.DataFrame", position: int, index: int, course_data: Dict, warnings_list: List[Dict]):
+    """
+    Appends the missing-value warnings of a flagged row to warnings_list.
+    """
+    errors = []
+    if chunk['missing_course_code'].iat[position]:
+        errors.append("Missing course_code.")
+    if chunk['missing_faculty'].iat[position]:
+        errors.append("Missing faculty.")
+    if chunk['missing_email'].iat[position]:
+        errors.append(f"Email mapping not found for faculty '{course_data['faculty']}'.")
+    logger.warning(f"⚠️ Record #{index} has errors: {', '.join(errors)}")
+    warnings_list.append({"record": index, "course_code": course_data["course_code"], "errors": errors})
 
-    # Convert to list of Course objects with email mapping
+def build_courses_per_row(chunk: "pd.DataFrame", offset: int, warnings_list: List[Dict]) -> List[Course]:
+    """
+    Builds one Course model per row of a sanitized chunk.
+
+    :param chunk: Output of sanitize_course_frame.
+    :param offset: Number of records in previous chunks, used for record numbers.
+    :param warnings_list: List that receives the per-record warnings.
+    :return: List of Course objects.
+    """
     course_list = []
-    warnings_list = []
+    flagged = chunk['missing_course_code'] | chunk['missing_faculty'] | chunk['missing_email']
+    records = chunk[COURSE_FIELDS].to_dict(orient='records')
 
-    courses = df.to_dict(orient="records")
-    for index, course_data in enumerate(courses, start=1):
-        errors = []
+    for position, course_data in enumerate(records):
+        index = offset + position + 1
         try:
-            course_code = course_data.get("course_code")
-            section = course_data.get("section")
-            faculty_short_name = course_data.get("faculty")
-            email = faculty_email_map.get(faculty_short_name, None)
-            timing_parsed = parse_timing(course_data.get("timing"))
-            room_no = course_data.get("room_no")
-            capacity = course_data.get("capacity")
-            seat_taken = course_data.get("seat_taken")
-
-            # Check mandatory fields
-            if not course_code:
-                errors.append("Missing course_code.")
-            if not faculty_short_name:
-                errors.append("Missing faculty.")
-
-            if email is None and faculty_short_name:
-                errors.append(f"Email mapping not found for faculty '{faculty_short_name}'.")
-
-            if errors:
-                logger.warning(f"⚠️ Record #{index} has errors: {', '.join(errors)}")
-                warnings_list.append({"record": index, "course_code": course_code, "errors": errors})
-                # Create the course with possible None values
-                course = Course(
-                    course_code=course_code,
-                    section=section,
-                    faculty=faculty_short_name,
-                    email=email,
-                    timing=timing_parsed,
-                    room_no=room_no,
-                    capacity=capacity,
-                    seat_taken=seat_taken
-                )
-                course_list.append(course)
-                continue
-
-            # Create Course instance
-            course = Course(
-                course_code=course_code,
-                section=section,
-                faculty=faculty_short_name,
-                email=email,
-                timing=timing_parsed,
-                room_no=room_no,
-                capacity=capacity,
-                seat_taken=seat_taken
-            )
-            course_list.append(course)
+            # Only rows with missing values need their errors spelled out
+            if flagged.iat[position]:
+                _record_warnings(chunk, position, index, course_data, warnings_list)
+
+            # Create Course instance, keeping records with possible None values
+            course_list.append(Course(**course_data))
         except Exception as e:
             error_message = f"Unexpected error: {e}"
             logger.warning(f"⚠️ Skipping invalid course record #{index}: {course_data} | Error: {error_message}")
             warnings_list.append({"record": index, "course_code": course_data.get("course_code"), "errors": [error_message]})
             continue
+    return course_list
+
+def build_courses_bulk(chunk: "pd.DataFrame", offset: int, warnings_list: List[Dict]) -> List[Dict]:
+    """
+    Validates a sanitized chunk column by column and returns course dictionaries
+    in the same shape as Course.dict(). Only rows whose values would be coerced
+    or rejected by the model go through Course, so their warnings match the
+    per-row path exactly.
+
+    :param chunk: Output of sanitize_course_frame.
+    :param offset: Number of records in previous chunks, used for record numbers.
+    :param warnings_list: List that receives the per-record warnings.
+    :return: List of course dictionaries ready to be stored.
+    """
+    course_code = chunk['course_code']
+    email, valid_email = email_column(chunk['email'])
+    chunk = chunk.assign(email=email)
+    valid = (
+        course_code.notna() & ~chunk['missing_course_code'] & values_of_type(course_code, str)
+        & values_of_type(chunk['faculty'], str)
+        & values_of_type(chunk['room_no'], str)
+        & values_of_type(chunk['section'], int)
+        & values_of_type(chunk['capacity'], int)
+        & values_of_type(chunk['seat_taken'], int)
+        & valid_email
+    )
+    flagged = chunk['missing_course_code'] | chunk['missing_faculty'] | chunk['missing_email']
+
+    course_list = []
+    records = chunk[COURSE_FIELDS].to_dict(orient='records')
+    for position, course_data in enumerate(records):
+        index = offset + position + 1
+        if flagged.iat[position]:
+            _record_warnings(chunk, position, index, course_data, warnings_list)
+        if valid.iat[position]:
+            course_list.append(course_data)
+            continue
+        try:
+            course_list.append(Course(**course_data).dict())
+        except Exception as e:
+            error_message = f"Unexpected error: {e}"
+            logger.warning(f"⚠️ Skipping invalid course record #{index}: {course_data} | Error: {error_message}")
+            warnings_list.append({"record": index, "course_code": course_data.get("course_code"), "errors": [error_message]})
+    return course_list
+
+def parse_offered_courses_file(
+    file_content: Union[bytes, str],
+    faculty_email_map: Dict[str, str],
+    bulk_validation: bool = BULK_VALIDATION,
+    sheet_name: Optional[str] = None,
+    filename: Optional[str] = None
+) -> dict:
+    """
+    Streams the offered courses file (Excel, CSV or Parquet) into course records.
+    This is blocking, CPU-bound work and runs inside the parse executor,
+    so it must stay a picklable module-level function.
+
+    :param file_content: Content of the uploaded file or a path to it.
+    :param faculty_email_map: Mapping of faculty short name to email.
+    :param bulk_validation: Return plain dictionaries validated column-wise
+                            instead of one Course object per row.
+    :param sheet_name: Sheet to read; defaults to the first sheet.
+    :param filename: Name of the uploaded file, used to detect CSV uploads.
+    :return: Dictionary with the parsed `courses`, the per-record `warnings`
+             and the `timings` of the read, sanitize and validate stages.
+    """
+    timer = StageTimer()
+    # Stream the file in chunks instead of materializing a DataFrame
+    with ExitStack() as stack:
+        with timer.stage("read"):
+            # pandas and openpyxl are loaded by the first upload of a worker, not at startup
+            from app.utils.table_reader import open_table_reader
+
+            reader = stack.enter_context(open_table_reader(
+                file_content,
+                normalize_column_name,
+                column_mapping=COLUMN_MAPPING,
+                columns_to_drop=COLUMNS_TO_DROP,
+                sheet_name=sheet_name,
+                filename=filename
+            ))
+        # Validate required columns
+        required_columns = ["course_code", "section", "faculty", "capacity", "seat_taken"]
+        missing_columns = [col for col in required_columns if col not in reader.columns]
+        if missing_columns:
+            logger.error(f"❌ Uploaded file is missing required columns: {missing_columns}")
+            raise FileProcessingError(detail=f"❌ Missing columns: {', '.join(missing_columns)}")
+
+        # Handle 'timing' as optional
+        if 'timing' not in reader.columns:
+            logger.warning("⚠️ 'timing' column is missing. Setting timing to None for all records.")
+
+        # Convert to course records with email mapping
+        course_list = []
+        warnings_list = []
+
+        offset = 0
+        frames = reader.iter_frames(INGEST_CHUNK_ROWS)
+        while True:
+            with timer.stage("read"):
+                chunk = next(frames, None)
+            if chunk is None:
+                break
+            with timer.stage("sanitize"):
+                chunk = sanitize_course_frame(chunk, faculty_email_map)
+            with timer.stage("validate"):
+                if bulk_validation:
+                    course_list.extend(build_courses_bulk(chunk, offset, warnings_list))
+                else:
+                    course_list.extend(build_courses_per_row(chunk, offset, warnings_list))
+            offset += len(chunk)
+
+    return {"courses": course_list, "warnings": warnings_list, "timings": timer.durations}
+
+@count_failures(OFFERED_COURSES_PIPELINE)
+async def process_offered_courses(
+    file_content: Union[bytes, str],
+    user: dict,
+    year: int,
+    semester_no: int,
+    department: str,
+    sheet_name: Optional[str] = None,
+    source_digest: Optional[str] = None,
+    filename: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None
+) -> dict:
+    """
+    Processes the offered courses file and saves it to the database.
+    A file identical to the one stored for the same semester is not parsed
+    again; the summary of its first upload is returned instead.
+
+    :param file_content: Content of the uploaded file or a path to it.
+    :param user: Dictionary containing user information.
+    :param year: Year of the offered courses.
+    :param semester_no: Semester number (1: Spring, 2: Summer, 3: Fall).
+    :param department: Department short name, e.g., CSE.
+    :param sheet_name: Sheet to read; defaults to the first sheet.
+    :param source_digest: SHA-256 digest of `file_content` if already computed.
+    :param filename: Name of the uploaded file, used to detect CSV uploads.
+    :param progress: Called with every stage the upload enters and the row count once parsed,
+                     e.g. to update a background job. Reading, sanitizing and validating
+                     run in the parse executor as the single `parse` stage.
+    :return: Summary of the processing result.
+    """
+    try:
+        logger.info(f"✅ Received metadata: Year={year}, SemesterNo={semester_no}, Department={department}")
+    except Exception as e:
+        logger.error(f"❌ Metadata extraction error: {e}")
+        raise FileProcessingError(detail="❌ Failed to process metadata.")
+
+    # Fetch faculty information for mapping
+    db = get_database()
+    await report_progress(progress, "faculty_lookup")
+    with observe_stage(OFFERED_COURSES_PIPELINE, "faculty_lookup"):
+        faculty_index = await get_faculty_index(db, department)
+    if not faculty_index:
+        logger.error(f"❌ No faculty information found for department: {department}")
+        raise FileProcessingError(detail=f"❌ No faculty information found for department: {department}")
+
+    faculty_email_map = faculty_index.by_short_name
+
+    # The stored result only holds for the same file read the same way with the same faculty emails
+    # and stored in the same shape
+    source_digest = source_digest or content_digest(file_content)
+    source_context = {
+        "sheet_name": sheet_name,
+        "faculty_version": faculty_index.version,
+        "storage": OFFERED_COURSES_STORAGE,
+        "timing_fields": TIMING_KEYS
+    }
+    key = semester_key(department, semester_no, year)
+    await report_progress(progress, "dedupe_check")
+    with observe_stage(OFFERED_COURSES_PIPELINE, "dedupe_check"):
+        previous = await db["offered_courses"].find_one(
+            key, {"_id": 0, "source_digest": 1, "source_context": 1, "upload_summary": 1, "uploaded_by": 1}
+        )
+    if (previous and previous.get("upload_summary")
+            and previous.get("source_digest") == source_digest
+            and previous.get("source_context") == source_context):
+        logger.info(f"✅ Offered courses file unchanged for department: {department}, semester: {semester_no}, year: {year}; skipped processing")
+        UPLOADS.inc((OFFERED_COURSES_PIPELINE, "deduplicated"))
+        return {
+            "department": department,
+            "semester": semester_no,
+            "year": year,
+            "uploaded_by": previous.get("uploaded_by"),
+            **previous["upload_summary"],
+            "deduplicated": True
+        }
+
+    # Parse the workbook off the event loop; the parse stage includes waiting for a free worker
+    await report_progress(progress, "parse")
+    with observe_stage(OFFERED_COURSES_PIPELINE, "parse"):
+        parsed = await run_parse_job(
+            parse_offered_courses_file, file_content, faculty_email_map, BULK_VALIDATION, sheet_name, filename
+        )
+    record_stages(OFFERED_COURSES_PIPELINE, parsed.pop("timings", None))
+    course_list = parsed["courses"]
+    warnings_list = parsed["warnings"]
 
     # No courses to save
     if not course_list:
         logger.error("❌ No valid course records found.")
         raise FileProcessingError(detail="❌ No valid course records found.")
 
-    # Create OfferedCourses instance
-    offered_courses = OfferedCourses(
-        department=department,
-        semester=semester_no,
-        year=year,  # Include 'year' here
-        courses=course_list,
-        uploaded_by=user.get("username")
-    )
+    # Create OfferedCourses document
+    if BULK_VALIDATION:
+        # Courses were validated column-wise already; only the metadata goes through the model
+        document = OfferedCourses(
+            department=department,
+            semester=semester_no,
+            year=year,
+            courses=[],
+            uploaded_by=user.get("username")
+        ).dict(by_alias=True)
+        document["courses"] = course_list
+    else:
+        document = OfferedCourses(
+            department=department,
+            semester=semester_no,
+            year=year,  # Include 'year' here
+            courses=course_list,
+            uploaded_by=user.get("username")
+        ).dict(by_alias=True)
+
+    # Content version used as the ETag of GET /offeredCourses
+    document["version"] = compute_version(document)
+
+    if OFFERED_COURSES_STORAGE == SECTIONED_LAYOUT:
+        # Store a small header and every section as its own document
+        course_list, duplicate_warnings = dedupe_sections(document.pop("courses"))
+        warnings_list.extend(duplicate_warnings)
+        document["layout"] = SECTIONED_LAYOUT
+
+    # Check for room and faculty clashes, including sections of other departments in the same semester
+    stored_courses = document.get("courses", course_list)
+    await report_progress(progress, "conflicts", len(course_list))
+    with observe_stage(OFFERED_COURSES_PIPELINE, "conflicts"):
+        others = await load_shared_rows(db, semester_no, year, stored_courses, exclude_department=department)
+        rows = [{**course, "department": department} for course in stored_courses] + others
+        conflicts = await run_parse_job(find_conflicts, rows, department)
+    if conflicts:
+        logger.warning(f"⚠️ {len(conflicts)} timetable conflicts found for department: {department}, semester: {semester_no}, year: {year}")
+    warnings_list.extend(conflict_warnings(conflicts, department))
+
+    # Keep the source digest and the outcome so an identical re-upload can skip processing
+    message = "✅ Inserted new offered courses." if previous is None else "✅ Updated existing offered courses."
+    document["source_digest"] = source_digest
+    document["source_context"] = source_context
+    document["upload_summary"] = {"message": message, "total_courses": len(course_list), "warnings": warnings_list}
 
     # Save to database
+    await report_progress(progress, "save", len(course_list))
     try:
-        result = await db["offered_courses"].replace_one(
-            {"department": offered_courses.department, "semester": offered_courses.semester, "year": offered_courses.year},
-            offered_courses.dict(by_alias=True),
-            upsert=True
-        )
+        with observe_stage(OFFERED_COURSES_PIPELINE, "save"):
+            if OFFERED_COURSES_STORAGE == SECTIONED_LAYOUT:
+                # Sections go first so the header and its digest are only written once they are complete
+                await save_sections(db, document["department"], document["semester"], document["year"], course_list)
+                result = await db["offered_courses"].replace_one(key, document, upsert=True)
+            else:
+                result = await db["offered_courses"].replace_one(key, document, upsert=True)
+                # Drop sections left over from an earlier upload in the sectioned layout
+                await delete_sections(db, document["department"], document["semester"], document["year"])
         if result.upserted_id:
-            logger.info(f"✅ Inserted new offered courses for department: {offered_courses.department}, semester: {offered_courses.semester}, year: {offered_courses.year}")
-            message = "✅ Inserted new offered courses."
+            logger.info(f"✅ Inserted new offered courses for department: {document['department']}, semester: {document['semester']}, year: {document['year']}")
         else:
-            logger.info(f"✅ Updated offered courses for department: {offered_courses.department}, semester: {offered_courses.semester}, year: {offered_courses.year}")
-            message = "✅ Updated existing offered courses."
+            logger.info(f"✅ Updated offered courses for department: {document['department']}, semester: {document['semester']}, year: {document['year']}")
     except Exception as e:
         logger.error(f"❌ Failed to save offered courses: {e}")
         raise FileProcessingError(detail="❌ Failed to save offered courses.")
 
+    offered_courses_cache.invalidate((document["department"], document["semester"], document["year"]))
+
+    # Precompute the dashboard aggregates; if this fails they are computed on first read instead
+    await report_progress(progress, "summary", len(course_list))
+    try:
+        with observe_stage(OFFERED_COURSES_PIPELINE, "summary"):
+            summary = await run_parse_job(summarize_courses, stored_courses)
+            await save_course_summary(db, department, semester_no, year, document["version"], summary)
+    except Exception as e:
+        logger.error(f"❌ Failed to store summary for department: {department}, semester: {semester_no}, year: {year}: {e}")
+
+    UPLOADS.inc((OFFERED_COURSES_PIPELINE, "processed"))
+    UPLOAD_RECORDS.inc((OFFERED_COURSES_PIPELINE,), len(course_list))
+    UPLOAD_WARNINGS.inc((OFFERED_COURSES_PIPELINE,), len(warnings_list))
+
     # Prepare response
     response = {
         "message": message,
-        "department": offered_courses.department,
-        "semester": offered_courses.semester,
-        "year": offered_courses.year,
+        "department": document["department"],
+        "semester": document["semester"],
+        "year": document["year"],
         "total_courses": len(course_list),
-        "uploaded_by": offered_courses.uploaded_by,
-        "warnings": warnings_list
+        "uploaded_by": document["uploaded_by"],
+        "warnings": warnings_list,
+        "deduplicated": False
     }
 
     return response
 
-async def get_offered_courses(
+async def load_offered_courses_document(
     db: AsyncIOMotorDatabase,
     department: str,
     semester: int,
     year: int
-) -> Optional[CourseResponse]:
+) -> Optional[Dict]:
     """
-    Retrieves offered courses based on department, semester, and year.
+    Loads the raw offered courses document, including sections stored in the
+    sectioned layout and the computed totalCourses.
     """
     query = {
         "department": department,
         "semester": semester,
         "year": year
     }
-    document = await db["offered_courses"].find_one(query)
+    document = await db["offered_courses"].find_one(query, {"upload_summary": 0})
     if not document:
         logger.info(f"No courses found for department={department}, semester={semester}, year={year}")
         return None
+    if document.get("layout") == SECTIONED_LAYOUT:
+        document["courses"] = await load_sections(db, department, semester, year)
     # Calculate totalCourses
     total_courses = len(document["courses"]) if "courses" in document else 0
 
     # Add totalCourses to the document before returning
     document["totalCourses"] = total_courses
-    
-    return CourseResponse(**document)
\ No newline at end of file
+    return document
+
+async def get_offered_courses(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int
+) -> Optional[CourseResponse]:
+    """
+    Retrieves offered courses based on department, semester, and year.
+    """
+    document = await load_offered_courses_document(db, department, semester, year)
+    if not document:
+        return None
+    return CourseResponse(**document)
+
+async def get_offered_courses_version(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int
+) -> Optional[str]:
+    """
+    Returns the stored content version for department, semester, and year
+    without loading the courses. Always read from MongoDB: with several
+    workers, another process may have written the semester since this one
+    cached it.
+    """
+    document = await db["offered_courses"].find_one(
+        {"department": department, "semester": semester, "year": year},
+        {"_id": 0, "version": 1}
+    )
+    return document.get("version") if document else None
+
+async def get_offered_courses_json(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int,
+    current_version: Optional[str] = None
+) -> Optional[Tuple[str, bytes]]:
+    """
+    Returns the version and serialized CourseResponse for department, semester,
+    and year, served from offered_courses_cache when possible.
+
+    The cache is per process and uploads or patches only invalidate it in the
+    worker that wrote, so a cached body is only served after a version-only
+    lookup confirms it is still current.
+
+    :param current_version: Stored version if the caller already looked it up.
+    """
+    key = (department, semester, year)
+    cached = offered_courses_cache.get(key)
+    if cached is not None:
+        if current_version is None:
+            current_version = await get_offered_courses_version(db, department, semester, year)
+        if current_version is not None and cached[0] == current_version:
+            return cached
+        # Written by another worker, or removed; documents without a version are never served from the cache
+        offered_courses_cache.invalidate(key)
+
+    document = await load_offered_courses_document(db, department, semester, year)
+    if not document:
+        return None
+    # Render exactly what FastAPI would produce for response_model=CourseResponse
+    body = JSONResponse(content=None).render(jsonable_encoder(CourseResponse(**document)))
+    # Documents stored before versioning fall back to a hash of the body
+    version = document.get("version") or hashlib.sha256(body).hexdigest()
+    offered_courses_cache.set(key, (version, body))
+    return version, body
+
+async def get_offered_courses_summary(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int
+) -> Optional[Dict]:
+    """
+    Returns the precomputed summary for department, semester, and year.
+    Semesters whose stored summary is missing or older than their courses are
+    summarized once from the stored courses and the result is kept.
+    """
+    header = await db["offered_courses"].find_one(
+        semester_key(department, semester, year), {"_id": 0, "version": 1}
+    )
+    if header is None:
+        return None
+    summary = await load_course_summary(db, department, semester, year)
+    if summary is not None and header.get("version") is not None and summary.get("version") == header["version"]:
+        return summary
+
+    document = await load_offered_courses_document(db, department, semester, year)
+    stats = await run_parse_job(summarize_courses, document.get("courses", []))
+    return await save_course_summary(db, department, semester, year, document.get("version"), stats)
+
+def build_course_filter(
+    faculty: Optional[str] = None,
+    email: Optional[str] = None,
+    course_code_prefix: Optional[str] = None,
+    days: Optional[str] = None,
+    room_no: Optional[str] = None,
+    starts_after: Optional[int] = None,
+    ends_before: Optional[int] = None
+) -> Dict:
+    """
+    Builds a Mongo filter on course fields from the optional query parameters.
+    The course_code prefix becomes an anchored regex so it can use an index.
+    Time bounds are minutes after midnight, compared with the stored
+    `timing.start_minutes` and `timing.end_minutes`.
+    """
+    conditions = {}
+    if faculty:
+        conditions["faculty"] = faculty
+    if email:
+        conditions["email"] = email
+    if course_code_prefix:
+        conditions["course_code"] = {"$regex": f"^{re.escape(course_code_prefix)}"}
+    if days:
+        conditions["timing.days"] = days
+    if room_no:
+        conditions["room_no"] = room_no
+    if starts_after is not None:
+        conditions["timing.start_minutes"] = {"$gte": starts_after}
+    if ends_before is not None:
+        conditions["timing.end_minutes"] = {"$lte": ends_before}
+    return conditions
+
+async def search_offered_courses(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int,
+    conditions: Dict,
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[int] = None
+) -> Optional[Dict]:
+    """
+    Filters, projects and paginates the courses of one semester inside Mongo.
+
+    Embedded documents are unwound with their array index in an aggregation
+    pipeline; sectioned documents are queried directly. In both layouts the
+    position of a course is its keyset, so `cursor` is the position of the
+    last course of the previous page.
+
+    :param conditions: Filter on course fields, see build_course_filter.
+    :param fields: Course fields to return; all fields when omitted.
+    :param limit: Maximum number of courses to return.
+    :param cursor: Only return courses after this position.
+    :return: Matching courses and the cursor of the next page, or None if the semester does not exist.
+    """
+    key = semester_key(department, semester, year)
+    header = await db["offered_courses"].find_one(key, {"_id": 0, "layout": 1})
+    if header is None:
+        return None
+    fields = fields or COURSE_FIELDS
+    fetch = limit + 1 if limit else None
+
+    if header.get("layout") == SECTIONED_LAYOUT:
+        query = {**key, **conditions}
+        if cursor is not None:
+            query["position"] = {"$gt": cursor}
+        projection = {"_id": 0, "position": 1, **{field: 1 for field in fields}}
+        found = db[SECTIONS_COLLECTION].find(query, projection).sort("position", 1)
+        if fetch:
+            found = found.limit(fetch)
+        courses = await found.to_list(length=None)
+    else:
+        match = {f"courses.{field}": value for field, value in conditions.items()}
+        if cursor is not None:
+            match["position"] = {"$gt": cursor}
+        pipeline = [
+            {"$match": key},
+            {"$project": {"_id": 0, "courses": 1}},
+            {"$unwind": {"path": "$courses", "includeArrayIndex": "position"}},
+            {"$match": match},
+        ]
+        if fetch:
+            pipeline.append({"$limit": fetch})
+        pipeline.append({"$project": {"position": 1, **{field: f"$courses.{field}" for field in fields}}})
+        courses = await db["offered_courses"].aggregate(pipeline).to_list(length=None)
+
+    next_cursor = None
+    if fetch and len(courses) > limit:
+        courses = courses[:limit]
+        next_cursor = int(courses[-1]["position"])
+    for course in courses:
+        course.pop("position", None)
+
+    return {
+        "department": department,
+        "semester": semester,
+        "year": year,
+        "courses": courses,
+        "count": len(courses),
+        "next_cursor": next_cursor
+    }
@@ -0,0 +1,172 @@
+# File: app/services/export_service.py
+
+import csv
+import heapq
+import io
+import json
+import zlib
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.services.section_store import SECTIONS_COLLECTION, SECTIONED_LAYOUT
+from app.models.schemas import COURSE_FIELDS
+import logging
+
+logger = logging.getLogger(__name__)
+
+NDJSON_FORMAT = "ndjson"
+CSV_FORMAT = "csv"
+
+# Flat CSV columns; `timing` is split into its parts
+CSV_COLUMNS = ["department", "semester", "year"] + [field for field in COURSE_FIELDS if field != "timing"] + [
+    "days", "start_time", "end_time"
+]
+
+# Rows read from MongoDB per round trip and serialized per yielded chunk
+EXPORT_BATCH_SIZE = 1000
+
+
+def build_export_filter(
+    departments: Optional[List[str]] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    semester_from: Optional[int] = None,
+    semester_to: Optional[int] = None
+) -> Dict:
+    """
+    Builds the filter on (department, semester, year) shared by both storage layouts.
+    """
+    query = {}
+    if departments:
+        query["department"] = {"$in": departments}
+    for field, low, high in (("year", year_from, year_to), ("semester", semester_from, semester_to)):
+        bounds = {}
+        if low is not None:
+            bounds["$gte"] = low
+        if high is not None:
+            bounds["$lte"] = high
+        if bounds:
+            query[field] = bounds
+    return query
+
+
+def _prefix_fields(condition: Dict, prefix: str) -> Dict:
+    prefixed = {}
+    for key, value in condition.items():
+        if key.startswith("$"):
+            # Operators such as $or hold lists of conditions
+            prefixed[key] = [_prefix_fields(part, prefix) for part in value]
+        else:
+            prefixed[f"{prefix}{key}"] = value
+    return prefixed
+
+
+async def _merge_ordered(streams: List[AsyncIterator[Dict]], key: Callable[[Dict], Tuple]) -> AsyncIterator[Dict]:
+    """
+    Merges row streams that are each sorted by `key` into one sorted stream,
+    holding only the next row of every stream. Rows with equal keys keep the
+    order of `streams`, and of their own stream.
+    """
+    heads = []
+
+    async def advance(index: int):
+        try:
+            row = await streams[index].__anext__()
+        except StopAsyncIteration:
+            return
+        heapq.heappush(heads, (key(row), index, row))
+
+    for index in range(len(streams)):
+        await advance(index)
+    while heads:
+        _, index, row = heapq.heappop(heads)
+        yield row
+        await advance(index)
+
+
+async def iter_export_rows(db: AsyncIOMotorDatabase, query: Dict, course_filter: Optional[Dict] = None) -> AsyncIterator[Dict]:
+    """
+    Yields one row per section for every semester matching `query`, ordered by
+    department, semester and year, with the sections of a semester in upload
+    order. Semesters stored embedded are unwound inside MongoDB and merged with
+    the sectioned ones as both cursors are read in batches, so memory stays
+    constant whatever the mix of layouts.
+
+    :param course_filter: Optional filter on course fields, e.g. {"room_no": {"$in": [...]}};
+                          embedded semesters are matched on it before and after unwinding.
+    """
+    order = [("department", 1), ("semester", 1), ("year", 1)]
+    embedded_filter = _prefix_fields(course_filter, "courses.") if course_filter else {}
+    pipeline = [
+        {"$match": {**query, **embedded_filter, "layout": {"$ne": SECTIONED_LAYOUT}}},
+        {"$sort": dict(order)},
+        {"$project": {"_id": 0, "department": 1, "semester": 1, "year": 1, "courses": 1}},
+        {"$unwind": "$courses"},
+    ]
+    if embedded_filter:
+        pipeline.append({"$match": embedded_filter})
+    pipeline += [
+        # $addFields + $replaceRoot rather than $mergeObjects, which mongomock-motor cannot run
+        {"$addFields": {"courses.department": "$department", "courses.semester": "$semester", "courses.year": "$year"}},
+        {"$replaceRoot": {"newRoot": "$courses"}},
+    ]
+    embedded = db["offered_courses"].aggregate(pipeline, allowDiskUse=True, batchSize=EXPORT_BATCH_SIZE)
+
+    projection = {"_id": 0, "department": 1, "semester": 1, "year": 1, **{field: 1 for field in COURSE_FIELDS}}
+    sections = db[SECTIONS_COLLECTION].find({**query, **(course_filter or {})}, projection).sort(order + [("position", 1)])
+
+    rows = _merge_ordered(
+        [embedded.__aiter__(), sections.batch_size(EXPORT_BATCH_SIZE).__aiter__()],
+        key=lambda row: tuple(row.get(field) for field, _ in order)
+    )
+    async for row in rows:
+        yield row
+
+
+def _csv_row(row: Dict) -> List:
+    timing = row.get("timing") or {}
+    values = {**row, "days": timing.get("days"), "start_time": timing.get("start_time"), "end_time": timing.get("end_time")}
+    return [values.get(column) for column in CSV_COLUMNS]
+
+
+async def stream_export(
+    db: AsyncIOMotorDatabase,
+    query: Dict,
+    export_format: str = NDJSON_FORMAT,
+    compress: bool = False
+) -> AsyncIterator[bytes]:
+    """
+    Serializes the export rows as NDJSON or CSV in chunks of EXPORT_BATCH_SIZE
+    rows, optionally gzip-compressed on the fly, for a StreamingResponse.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31 writes a gzip container
+    buffer = io.StringIO()
+    writer = None
+    if export_format == CSV_FORMAT:
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+
+    def take() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return compressor.compress(data) if compressor else data
+
+    rows = 0
+    async for row in iter_export_rows(db, query):
+        if writer is not None:
+            writer.writerow(_csv_row(row))
+        else:
+            buffer.write(json.dumps(row, separators=(",", ":"), default=str))
+            buffer.write("\n")
+        rows += 1
+        if rows % EXPORT_BATCH_SIZE == 0:
+            chunk = take()
+            if chunk:
+                yield chunk
+
+    tail = take()
+    if compressor:
+        tail += compressor.flush()
+    if tail:
+        yield tail
+    logger.info(f"✅ Exported {rows} offered course rows as {export_format}{' (gzip)' if compress else ''}")
@@ -0,0 +1,101 @@
+# File: app/services/faculty_directory.py
+
+import time
+from typing import Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from app.models.schemas import FacultyResponse
+from app.utils.cache import TTLCache
+from app.config import FACULTY_CACHE_MAX_ENTRIES, FACULTY_CACHE_REVALIDATE_SECONDS
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class FacultyIndex:
+    """
+    Lookup tables built once from a department's faculty_information document.
+    """
+
+    def __init__(self, department: str, version: Optional[str], faculty_list: List[Dict]):
+        self.department = department
+        self.version = version
+        self.by_short_name: Dict[str, str] = {faculty["short_name"]: faculty["email"] for faculty in faculty_list}
+        self.by_email: Dict[str, Dict] = {faculty["email"]: faculty for faculty in faculty_list}
+        self.faculty_list = faculty_list
+        self._body: Optional[bytes] = None
+        self.checked_at = time.monotonic()
+
+    def body(self) -> bytes:
+        """
+        Rendered FacultyResponse served by GET /facultyInformation, built on the
+        first read so uploads and patches that only need the lookup tables never
+        validate the response model.
+        """
+        if self._body is None:
+            self._body = JSONResponse(content=None).render(
+                jsonable_encoder(FacultyResponse(department=self.department, faculty_list=self.faculty_list))
+            )
+        return self._body
+
+
+# FacultyIndex per department; entries stay until evicted and are revalidated by version
+faculty_index_cache = TTLCache("faculty_directory", max_entries=FACULTY_CACHE_MAX_ENTRIES, ttl_seconds=float("inf"))
+revalidations = 0
+reloads = 0
+
+
+def document_version(document: Dict) -> Optional[str]:
+    """
+    Version stamp of a faculty_information document. Documents stored before
+    versioning fall back to their upload timestamp.
+    """
+    version = document.get("version")
+    if version is None and document.get("timestamp") is not None:
+        version = str(document["timestamp"])
+    return version
+
+
+def refresh_faculty_index(document: Dict) -> FacultyIndex:
+    """
+    Rebuilds the cached index of a department from a freshly saved document.
+    """
+    index = FacultyIndex(document["department"], document_version(document), document.get("faculty_list", []))
+    faculty_index_cache.set(index.department, index)
+    logger.info(f"✅ Faculty index refreshed for department: {index.department} ({len(index.by_short_name)} faculty)")
+    return index
+
+
+async def get_faculty_index(db: AsyncIOMotorDatabase, department: str) -> Optional[FacultyIndex]:
+    """
+    Returns the faculty index of a department from the cache. Entries older than
+    FACULTY_CACHE_REVALIDATE_SECONDS are revalidated with a version-only lookup
+    and only reloaded when another worker saved a newer document.
+    """
+    global revalidations, reloads
+    index = faculty_index_cache.get(department)
+    if index is not None:
+        if time.monotonic() - index.checked_at < FACULTY_CACHE_REVALIDATE_SECONDS:
+            return index
+        stamp = await db["faculty_information"].find_one(
+            {"department": department}, {"_id": 0, "version": 1, "timestamp": 1}
+        )
+        revalidations += 1
+        if stamp is not None and document_version(stamp) == index.version:
+            index.checked_at = time.monotonic()
+            return index
+        faculty_index_cache.invalidate(department)
+
+    document = await db["faculty_information"].find_one({"department": department})
+    if not document:
+        return None
+    reloads += 1
+    return refresh_faculty_index(document)
+
+
+def faculty_cache_stats() -> Dict:
+    stats = faculty_index_cache.stats()
+    stats.pop("ttl_seconds")
+    stats.update(revalidate_seconds=FACULTY_CACHE_REVALIDATE_SECONDS, revalidations=revalidations, reloads=reloads)
+    return stats
@@ -1,15 +1,29 @@
 # File: python_server/app/services/faculty_service.py
 
-import pandas as pd
-from io import BytesIO
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 from app.models.schemas import FacultyInformation, Faculty
 from app.models.database import get_database
 from app.exceptions.custom_exceptions import FileProcessingError
+from app.utils.parse_executor import run_parse_job
+from app.utils.validators import email_column, values_of_type
+from app.utils.etag import compute_version
+from app.utils.file_handler import content_digest
+from app.utils.metrics import StageTimer, observe_stage, record_stages, count_failures, UPLOADS, UPLOAD_RECORDS
+from app.utils.progress import ProgressCallback, report_progress
+from app.services.faculty_directory import refresh_faculty_index
+from app.config import INGEST_CHUNK_ROWS, BULK_VALIDATION
 import logging
 import re
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Pipeline label of the upload stage metrics
+FACULTY_PIPELINE = "faculty_information"
+
 def camel_to_snake(name: str) -> str:
     """
     Converts CamelCase or camelCase strings to snake_case.
@@ -21,40 +35,31 @@ def camel_to_snake(name: str) -> str:
     snake_case = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
     return snake_case
 
-async def process_faculty_info(file_content: bytes, uploaded_by: str) -> dict:
-    """
-    Processes the uploaded faculty information file and saves it to the database.
-    
-    :param file_content: Content of the uploaded file.
-    :param uploaded_by: The ID of the user uploading the data.
-    :return: Summary of the processing result.
+def build_faculty_bulk(chunk: "pd.DataFrame") -> List[Dict]:
     """
-    try:
-        # Convert bytes to a BytesIO object
-        excel_file = BytesIO(file_content)
-        # Read the uploaded Excel file using openpyxl engine
-        df = pd.read_excel(excel_file, engine='openpyxl')
-        logger.info("✅ Excel file read into DataFrame successfully.")
-    except ImportError as e:
-        logger.error(f"❌ Missing dependency: {e}")
-        raise FileProcessingError(detail="❌ Missing required dependencies for Excel processing.")
-    except Exception as e:
-        logger.error(f"❌ Failed to read Excel file: {e}")
-        raise FileProcessingError(detail="❌ Invalid Excel file format.")
-
-    # Normalize column names to snake_case
-    df.columns = [camel_to_snake(col) for col in df.columns]
+    Validates a chunk of faculty records column by column and returns dictionaries
+    in the same shape as Faculty.dict(). Rows that the fast checks cannot accept
+    are passed through Faculty so they are skipped with the usual warning.
 
-    # Validate required columns
-    required_columns = ["short_name", "email", "name", "designation_name", "academic_department_short_name"]
-    missing_columns = [col for col in required_columns if col not in df.columns]
-    if missing_columns:
-        logger.error(f"❌ Uploaded file is missing required columns: {missing_columns}")
-        raise FileProcessingError(detail=f"❌ Missing columns: {', '.join(missing_columns)}")
+    :param chunk: Chunk of normalized faculty records.
+    :return: List of faculty dictionaries ready to be stored.
+    """
+    email, valid_email = email_column(chunk["email"])
+    valid = valid_email & chunk["email"].notna()
+    for field in ["short_name", "name", "designation_name"]:
+        valid &= chunk[field].notna() & values_of_type(chunk[field], str)
 
-    # Convert DataFrame to list of Faculty objects
     faculty_list = []
-    for _, row in df.iterrows():
+    records = chunk.to_dict(orient="records")
+    for position, row in enumerate(records):
+        if valid.iat[position]:
+            faculty_list.append({
+                "short_name": row["short_name"],
+                "email": email.iat[position],
+                "name": row["name"],
+                "designation": row["designation_name"]
+            })
+            continue
         try:
             faculty = Faculty(
                 short_name=row["short_name"],
@@ -62,40 +67,179 @@ async def process_faculty_info(file_content: bytes, uploaded_by: str) -> dict:
                 name=row["name"],
                 designation=row["designation_name"]
             )
-            faculty_list.append(faculty)
+            faculty_list.append(faculty.dict())
         except Exception as e:
-            logger.warning(f"⚠️ Skipping invalid faculty record: {row.to_dict()} | Error: {e}")
+            logger.warning(f"⚠️ Skipping invalid faculty record: {row} | Error: {e}")
+    return faculty_list
+
+def parse_faculty_file(
+    file_content: Union[bytes, str],
+    bulk_validation: bool = BULK_VALIDATION,
+    sheet_name: Optional[str] = None,
+    filename: Optional[str] = None
+) -> dict:
+    """
+    Streams the faculty information file (Excel, CSV or Parquet) into faculty records.
+    Runs inside the parse executor, so it must stay a picklable module-level function.
+
+    :param file_content: Content of the uploaded file or a path to it.
+    :param bulk_validation: Return plain dictionaries validated column-wise
+                            instead of one Faculty object per row.
+    :param sheet_name: Sheet to read; defaults to the first sheet.
+    :param filename: Name of the uploaded file, used to detect CSV uploads.
+    :return: Dictionary with the `department`, the parsed `faculty_list` and the stage `timings`.
+    """
+    timer = StageTimer()
+    # Stream the file in chunks instead of materializing a DataFrame
+    with ExitStack() as stack:
+        with timer.stage("read"):
+            # pandas and openpyxl are loaded by the first upload of a worker, not at startup
+            from app.utils.table_reader import open_table_reader
+
+            reader = stack.enter_context(
+                open_table_reader(file_content, camel_to_snake, sheet_name=sheet_name, filename=filename)
+            )
+        # Validate required columns
+        required_columns = ["short_name", "email", "name", "designation_name", "academic_department_short_name"]
+        missing_columns = [col for col in required_columns if col not in reader.columns]
+        if missing_columns:
+            logger.error(f"❌ Uploaded file is missing required columns: {missing_columns}")
+            raise FileProcessingError(detail=f"❌ Missing columns: {', '.join(missing_columns)}")
+
+        department = None
+        faculty_list = []
+        if bulk_validation:
+            frames = reader.iter_frames(INGEST_CHUNK_ROWS)
+            while True:
+                with timer.stage("read"):
+                    chunk = next(frames, None)
+                if chunk is None:
+                    break
+                with timer.stage("validate"):
+                    # Replace NaN with None
+                    chunk = chunk.astype(object).where(chunk.notna(), None)
+                    if department is None:
+                        department = chunk["academic_department_short_name"].iat[0]
+                    faculty_list.extend(build_faculty_bulk(chunk))
+        else:
+            # Convert streamed records to a list of Faculty objects; reading and validation interleave per row
+            with timer.stage("read_validate"):
+                for index, row in enumerate(reader):
+                    if index == 0:
+                        department = row["academic_department_short_name"]
+                    try:
+                        faculty = Faculty(
+                            short_name=row["short_name"],
+                            email=row["email"],
+                            name=row["name"],
+                            designation=row["designation_name"]
+                        )
+                        faculty_list.append(faculty)
+                    except Exception as e:
+                        logger.warning(f"⚠️ Skipping invalid faculty record: {row} | Error: {e}")
 
     if not faculty_list:
         logger.error("❌ No valid faculty records found.")
         raise FileProcessingError(detail="❌ No valid faculty records found.")
 
-    faculty_info = FacultyInformation(
-        department=df["academic_department_short_name"].iloc[0],
-        faculty_list=faculty_list,
-        uploaded_by=uploaded_by
-    )
+    return {
+        "department": department,
+        "faculty_list": faculty_list,
+        "timings": timer.durations
+    }
 
-    # Save to database
+@count_failures(FACULTY_PIPELINE)
+async def process_faculty_info(
+    file_content: Union[bytes, str],
+    uploaded_by: str,
+    sheet_name: Optional[str] = None,
+    source_digest: Optional[str] = None,
+    filename: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None
+) -> dict:
+    """
+    Processes the uploaded faculty information file and saves it to the database.
+    A file identical to a stored one is not parsed again; the summary of its
+    first upload is returned instead.
+    
+    :param file_content: Content of the uploaded file or a path to it.
+    :param uploaded_by: The ID of the user uploading the data.
+    :param sheet_name: Sheet to read; defaults to the first sheet.
+    :param source_digest: SHA-256 digest of `file_content` if already computed.
+    :param filename: Name of the uploaded file, used to detect CSV uploads.
+    :param progress: Called with every stage the upload enters and the row count once parsed.
+    :return: Summary of the processing result.
+    """
+    # The department is read from the file, so the digest alone identifies a repeat upload
     db = get_database()
-    try:
-        result = await db["faculty_information"].replace_one(
-            {"department": faculty_info.department},
-            faculty_info.dict(by_alias=True),
-            upsert=True
+    source_digest = source_digest or content_digest(file_content)
+    await report_progress(progress, "dedupe_check")
+    with observe_stage(FACULTY_PIPELINE, "dedupe_check"):
+        previous = await db["faculty_information"].find_one(
+            {"source_digest": source_digest, "source_sheet": sheet_name},
+            {"_id": 0, "department": 1, "upload_summary": 1}
         )
+    if previous and previous.get("upload_summary"):
+        logger.info(f"✅ Faculty information file unchanged for department: {previous['department']}; skipped processing")
+        UPLOADS.inc((FACULTY_PIPELINE, "deduplicated"))
+        return {"department": previous["department"], **previous["upload_summary"], "deduplicated": True}
+
+    # Parse the workbook off the event loop; the parse stage includes waiting for a free worker
+    await report_progress(progress, "parse")
+    with observe_stage(FACULTY_PIPELINE, "parse"):
+        parsed = await run_parse_job(parse_faculty_file, file_content, BULK_VALIDATION, sheet_name, filename)
+    record_stages(FACULTY_PIPELINE, parsed.pop("timings", None))
+
+    if BULK_VALIDATION:
+        # Faculty records were validated column-wise already; only the metadata goes through the model
+        document = FacultyInformation(
+            department=parsed["department"],
+            faculty_list=[],
+            uploaded_by=uploaded_by
+        ).dict(by_alias=True)
+        document["faculty_list"] = parsed["faculty_list"]
+    else:
+        document = FacultyInformation(
+            department=parsed["department"],
+            faculty_list=parsed["faculty_list"],
+            uploaded_by=uploaded_by
+        ).dict(by_alias=True)
+
+    # Version stamp used to revalidate cached faculty indexes
+    document["version"] = compute_version(document)
+
+    # Keep the source digest and the outcome so an identical re-upload can skip processing
+    with observe_stage(FACULTY_PIPELINE, "existing_lookup"):
+        stored = await db["faculty_information"].find_one({"department": document["department"]}, {"_id": 1})
+    message = "✅ Inserted new faculty information." if stored is None else "✅ Updated existing faculty information."
+    document["source_digest"] = source_digest
+    document["source_sheet"] = sheet_name
+    document["upload_summary"] = {"message": message, "total_records": len(document["faculty_list"])}
+
+    # Save to database
+    await report_progress(progress, "save", len(document["faculty_list"]))
+    try:
+        with observe_stage(FACULTY_PIPELINE, "save"):
+            result = await db["faculty_information"].replace_one(
+                {"department": document["department"]},
+                document,
+                upsert=True
+            )
         if result.upserted_id:
-            logger.info(f"✅ Inserted new faculty information for department: {faculty_info.department}")
-            message = "✅ Inserted new faculty information."
+            logger.info(f"✅ Inserted new faculty information for department: {document['department']}")
         else:
-            logger.info(f"✅ Updated faculty information for department: {faculty_info.department}")
-            message = "✅ Updated existing faculty information."
+            logger.info(f"✅ Updated faculty information for department: {document['department']}")
     except Exception as e:
         logger.error(f"❌ Failed to save faculty information: {e}")
         raise FileProcessingError(detail="❌ Failed to save faculty information.")
 
+    refresh_faculty_index(document)
+    UPLOADS.inc((FACULTY_PIPELINE, "processed"))
+    UPLOAD_RECORDS.inc((FACULTY_PIPELINE,), len(document["faculty_list"]))
+
     return {
         "message": message,
-        "department": faculty_info.department,
-        "total_records": len(faculty_list)
+        "department": document["department"],
+        "total_records": len(document["faculty_list"]),
+        "deduplicated": False
     }
@@ -0,0 +1,303 @@
+# File: app/services/job_service.py
+
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Union
+import aiofiles
+from fastapi import HTTPException
+from gridfs.errors import NoFile
+from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorGridFSBucket
+from pymongo import ReturnDocument
+from app.models.database import get_database
+from app.services.course_service import process_offered_courses
+from app.services.faculty_service import process_faculty_info
+from app.utils.file_handler import ReceivedUpload, TEMP_DIR, delete_temp_file
+from app.exceptions.custom_exceptions import FileProcessingError, ServiceUnavailableError
+from app.config import (
+    UPLOAD_JOB_WORKERS, UPLOAD_JOB_LEASE_SECONDS, UPLOAD_JOB_POLL_SECONDS,
+    UPLOAD_JOB_MAX_ATTEMPTS, UPLOAD_SPOOL_BYTES, UPLOAD_CHUNK_BYTES
+)
+import logging
+
+logger = logging.getLogger(__name__)
+
+JOBS_COLLECTION = "upload_jobs"
+
+# Job kinds and the upload they run
+OFFERED_COURSES_JOB = "offered_courses"
+FACULTY_INFORMATION_JOB = "faculty_information"
+
+# GridFS bucket holding the uploaded files of unfinished jobs
+PAYLOADS_BUCKET = "upload_job_payloads"
+
+_workers: List[asyncio.Task] = []
+
+
+def _payloads(db: AsyncIOMotorDatabase) -> AsyncIOMotorGridFSBucket:
+    return AsyncIOMotorGridFSBucket(db, bucket_name=PAYLOADS_BUCKET)
+
+
+async def _store_payload(db: AsyncIOMotorDatabase, job_id: str, upload: ReceivedUpload):
+    """
+    Writes an upload to GridFS in UPLOAD_CHUNK_BYTES chunks, streaming spooled
+    uploads from their temporary file instead of reading them into memory.
+    """
+    async with _payloads(db).open_upload_stream(upload.filename or job_id, metadata={"job_id": job_id}) as stream:
+        if upload.path is None:
+            await stream.write(upload.content)
+        else:
+            async with aiofiles.open(upload.path, 'rb') as source:
+                while chunk := await source.read(UPLOAD_CHUNK_BYTES):
+                    await stream.write(chunk)
+    return stream._id
+
+
+async def _load_payload(db: AsyncIOMotorDatabase, job: Dict) -> Union[bytes, str]:
+    """
+    Reads the file of a job like receive_upload would: in memory up to
+    UPLOAD_SPOOL_BYTES, otherwise into a temporary file whose path is returned.
+    """
+    if "payload_id" not in job:
+        # Queued before payloads moved to GridFS
+        return bytes(job["payload"])
+    stream = await _payloads(db).open_download_stream(job["payload_id"])
+    if stream.length <= UPLOAD_SPOOL_BYTES:
+        return await stream.read()
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    path = os.path.join(TEMP_DIR, f"{job['_id']}{os.path.splitext(job.get('filename') or '')[1]}")
+    try:
+        async with aiofiles.open(path, 'wb') as target:
+            while chunk := await stream.readchunk():
+                await target.write(chunk)
+    except BaseException:
+        await delete_temp_file(path)
+        raise
+    return path
+
+
+async def _delete_payload(db: AsyncIOMotorDatabase, job: Dict):
+    if "payload_id" not in job:
+        return
+    try:
+        await _payloads(db).delete(job["payload_id"])
+    except NoFile:
+        pass
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to delete the file of job {job['_id']}: {e}")
+
+
+async def enqueue_job(db: AsyncIOMotorDatabase, kind: str, upload: ReceivedUpload, params: Dict) -> Dict:
+    """
+    Stores an upload as a queued job and returns its public view. The file
+    goes to the PAYLOADS_BUCKET GridFS bucket and is deleted once the job
+    reaches a terminal state.
+
+    :param kind: OFFERED_COURSES_JOB or FACULTY_INFORMATION_JOB.
+    :param upload: The received file, in memory or spooled to disk.
+    :param params: Keyword arguments for the matching process_* function.
+    """
+    now = datetime.utcnow()
+    job_id = uuid.uuid4().hex
+    job = {
+        "_id": job_id,
+        "kind": kind,
+        "status": "queued",
+        "stage": "queued",
+        "filename": upload.filename,
+        "params": params,
+        "payload_id": await _store_payload(db, job_id, upload),
+        "payload_size": upload.size,
+        "attempts": 0,
+        "created_at": now,
+        "updated_at": now,
+    }
+    try:
+        await db[JOBS_COLLECTION].insert_one(job)
+    except BaseException:
+        await _delete_payload(db, job)
+        raise
+    logger.info(f"📥 Queued {kind} job {job['_id']} for {upload.filename}")
+    return public_job(job)
+
+
+def public_job(job: Dict) -> Dict:
+    """
+    Job fields exposed by the API; the stored file and lease details stay internal.
+    """
+    hidden = {"_id", "payload", "payload_id", "lease_owner", "lease_expires_at"}
+    view = {"job_id": job["_id"]}
+    view.update({key: value for key, value in job.items() if key not in hidden})
+    return view
+
+
+async def get_job(db: AsyncIOMotorDatabase, job_id: str) -> Optional[Dict]:
+    job = await db[JOBS_COLLECTION].find_one({"_id": job_id}, {"payload": 0})
+    return public_job(job) if job else None
+
+
+async def claim_next_job(db: AsyncIOMotorDatabase, worker_id: str) -> Optional[Dict]:
+    """
+    Atomically claims the oldest queued job, or a running job whose lease
+    expired because its worker died, and leases it to `worker_id`.
+    """
+    now = datetime.utcnow()
+    return await db[JOBS_COLLECTION].find_one_and_update(
+        {
+            "attempts": {"$lt": UPLOAD_JOB_MAX_ATTEMPTS},
+            "$or": [
+                {"status": "queued"},
+                {"status": "running", "lease_expires_at": {"$lt": now}},
+            ],
+        },
+        {
+            "$set": {
+                "status": "running",
+                "stage": "processing",
+                "lease_owner": worker_id,
+                "lease_expires_at": now + timedelta(seconds=UPLOAD_JOB_LEASE_SECONDS),
+                "started_at": now,
+                "updated_at": now,
+            },
+            "$inc": {"attempts": 1},
+        },
+        sort=[("created_at", 1)],
+        return_document=ReturnDocument.AFTER,
+    )
+
+
+async def fail_abandoned_jobs(db: AsyncIOMotorDatabase):
+    """
+    Marks jobs whose lease expired after their last allowed attempt as failed
+    and deletes their files.
+    """
+    now = datetime.utcnow()
+    abandoned = {"status": "running", "lease_expires_at": {"$lt": now}, "attempts": {"$gte": UPLOAD_JOB_MAX_ATTEMPTS}}
+    async for job in db[JOBS_COLLECTION].find(abandoned, {"_id": 1, "payload_id": 1}):
+        # Matched again by id so a job renewed in between is left alone
+        result = await db[JOBS_COLLECTION].update_one(
+            {"_id": job["_id"], **abandoned},
+            {
+                "$set": {"status": "failed", "stage": "failed", "error": "❌ Job was abandoned by its worker.",
+                         "finished_at": now, "updated_at": now},
+                "$unset": {"payload": "", "lease_owner": "", "lease_expires_at": ""},
+            },
+        )
+        if result.modified_count:
+            logger.warning(f"⚠️ Job {job['_id']} was abandoned after {UPLOAD_JOB_MAX_ATTEMPTS} attempts")
+            await _delete_payload(db, job)
+
+
+async def _renew_lease(db: AsyncIOMotorDatabase, job_id: str, worker_id: str):
+    while True:
+        await asyncio.sleep(UPLOAD_JOB_LEASE_SECONDS / 3)
+        await db[JOBS_COLLECTION].update_one(
+            {"_id": job_id, "lease_owner": worker_id},
+            {"$set": {"lease_expires_at": datetime.utcnow() + timedelta(seconds=UPLOAD_JOB_LEASE_SECONDS)}},
+        )
+
+
+def _progress_reporter(db: AsyncIOMotorDatabase, job_id: str, worker_id: str):
+    """
+    Progress callback of a running job: every stage change is written to the
+    job with the rows parsed so far and renews the lease on the way.
+    """
+    async def report(stage: str, rows: Optional[int] = None):
+        now = datetime.utcnow()
+        update = {"stage": stage, "updated_at": now, "lease_expires_at": now + timedelta(seconds=UPLOAD_JOB_LEASE_SECONDS)}
+        if rows is not None:
+            update["rows_processed"] = rows
+        await db[JOBS_COLLECTION].update_one({"_id": job_id, "lease_owner": worker_id}, {"$set": update})
+    return report
+
+
+async def _finish_job(db: AsyncIOMotorDatabase, job: Dict, worker_id: str, update: Dict):
+    now = datetime.utcnow()
+    update.update(updated_at=now, finished_at=now)
+    result = await db[JOBS_COLLECTION].update_one(
+        {"_id": job["_id"], "lease_owner": worker_id},
+        {"$set": update, "$unset": {"payload": "", "lease_owner": "", "lease_expires_at": ""}},
+    )
+    # A worker that lost its lease leaves the file to the worker that reclaimed the job
+    if result.modified_count:
+        await _delete_payload(db, job)
+
+
+async def run_job(db: AsyncIOMotorDatabase, job: Dict, worker_id: str):
+    """
+    Runs a claimed job through the regular upload processing and records its outcome.
+    """
+    heartbeat = asyncio.create_task(_renew_lease(db, job["_id"], worker_id))
+    file_content = None
+    try:
+        file_content = await _load_payload(db, job)
+        progress = _progress_reporter(db, job["_id"], worker_id)
+        if job["kind"] == OFFERED_COURSES_JOB:
+            result = await process_offered_courses(file_content, filename=job["filename"], progress=progress, **job["params"])
+            rows = {"total_courses": result["total_courses"]}
+        elif job["kind"] == FACULTY_INFORMATION_JOB:
+            result = await process_faculty_info(file_content, filename=job["filename"], progress=progress, **job["params"])
+            rows = {"total_records": result["total_records"]}
+        else:
+            raise FileProcessingError(detail=f"❌ Unknown job kind: {job['kind']}")
+        rows["warnings"] = len(result.get("warnings", []))
+        await _finish_job(db, job, worker_id, {"status": "succeeded", "stage": "completed", "result": result, "rows": rows})
+        logger.info(f"✅ Job {job['_id']} completed")
+    except ServiceUnavailableError:
+        # The parse executor is saturated; put the job back without counting the attempt
+        await db[JOBS_COLLECTION].update_one(
+            {"_id": job["_id"], "lease_owner": worker_id},
+            {"$set": {"status": "queued", "stage": "queued", "updated_at": datetime.utcnow()},
+             "$inc": {"attempts": -1}, "$unset": {"lease_owner": "", "lease_expires_at": ""}},
+        )
+        await asyncio.sleep(UPLOAD_JOB_POLL_SECONDS)
+    except HTTPException as e:
+        logger.error(f"❌ Job {job['_id']} failed: {e.detail}")
+        await _finish_job(db, job, worker_id, {"status": "failed", "stage": "failed", "error": e.detail})
+    except Exception as e:
+        logger.error(f"❌ Job {job['_id']} failed unexpectedly: {e}")
+        await _finish_job(db, job, worker_id, {"status": "failed", "stage": "failed", "error": "❌ Internal server error."})
+    finally:
+        heartbeat.cancel()
+        if isinstance(file_content, str):
+            await delete_temp_file(file_content)
+
+
+async def job_worker(worker_id: str):
+    """
+    Polls the job collection and runs claimed jobs until cancelled.
+    """
+    logger.info(f"✅ Upload job worker {worker_id} started")
+    while True:
+        try:
+            db = get_database()
+            job = await claim_next_job(db, worker_id)
+            if job is None:
+                await fail_abandoned_jobs(db)
+                await asyncio.sleep(UPLOAD_JOB_POLL_SECONDS)
+                continue
+            await run_job(db, job, worker_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Upload job worker {worker_id} error: {e}")
+            await asyncio.sleep(UPLOAD_JOB_POLL_SECONDS)
+
+
+def start_job_workers():
+    """
+    Starts UPLOAD_JOB_WORKERS background workers in this process. Every server
+    replica can run workers; leases make sure each job runs on one of them.
+    """
+    host = f"{socket.gethostname()}:{os.getpid()}"
+    for number in range(UPLOAD_JOB_WORKERS):
+        _workers.append(asyncio.create_task(job_worker(f"{host}:{number}")))
+
+
+async def stop_job_workers():
+    for worker in _workers:
+        worker.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
@@ -0,0 +1,313 @@
+# File: app/services/patch_service.py
+
+import csv
+import io
+import json
+from typing import Dict, List, Optional, Tuple
+from pydantic import ValidationError as ModelValidationError
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from app.models.schemas import Course
+from app.services.course_service import offered_courses_cache, normalize_column_name, COLUMN_MAPPING
+from app.services.section_store import SECTIONS_COLLECTION, SECTIONED_LAYOUT, semester_key
+from app.services.faculty_directory import get_faculty_index
+from app.services.conflict_service import find_conflicts, conflict_warnings, load_shared_rows
+from app.services.export_service import iter_export_rows
+from app.utils.validators import timing_dict
+from app.utils.etag import compute_version
+from app.utils.parse_executor import run_parse_job
+from app.utils.metrics import observe_stage, count_failures, UPLOADS, UPLOAD_RECORDS, UPLOAD_WARNINGS
+from app.exceptions.custom_exceptions import FileProcessingError, PayloadTooLargeError
+from app.config import OFFERED_COURSES_PATCH_MAX_ROWS
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Course fields a change row may set; course_code and section identify the section and email follows faculty
+PATCHABLE_FIELDS = ("faculty", "timing", "room_no", "capacity", "seat_taken")
+
+# Changes to these fields can create room or faculty clashes
+SCHEDULE_FIELDS = {"faculty", "timing", "room_no"}
+
+# Pipeline label of the patch metrics
+OFFERED_COURSES_PATCH_PIPELINE = "offered_courses_patch"
+
+SectionKey = Tuple[str, int]
+
+
+def _column(name: str) -> str:
+    # Same header names as the upload sheet, e.g. "Course" or "Seat Taken"
+    name = normalize_column_name(name.strip())
+    return COLUMN_MAPPING.get(name, name)
+
+
+def parse_patch_rows(content: bytes, content_type: Optional[str]) -> List[Dict]:
+    """
+    Reads the change rows of a PATCH /offeredCourses body.
+
+    JSON bodies are a list of objects or {"changes": [...]}; a null value
+    clears the field. CSV bodies (text/csv) have a header row; empty cells
+    leave the field unchanged.
+
+    :param content: Raw request body.
+    :param content_type: Content-Type header of the request.
+    :return: Change rows with normalized field names.
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise FileProcessingError(detail="❌ Changes must be UTF-8 encoded.")
+
+    if content_type and "csv" in content_type.lower():
+        rows = [
+            {_column(name): value.strip() for name, value in row.items() if name and value and value.strip()}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    else:
+        try:
+            rows = json.loads(text)
+        except ValueError as e:
+            raise FileProcessingError(detail=f"❌ Invalid JSON: {e}")
+        if isinstance(rows, dict):
+            rows = rows.get("changes")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise FileProcessingError(detail='❌ Expected a list of change objects or {"changes": [...]}.')
+        rows = [{_column(name): value for name, value in row.items()} for row in rows]
+
+    if not rows:
+        raise FileProcessingError(detail="❌ No changes provided.")
+    if len(rows) > OFFERED_COURSES_PATCH_MAX_ROWS:
+        raise PayloadTooLargeError(
+            detail=f"❌ {len(rows)} changes exceed the limit of {OFFERED_COURSES_PATCH_MAX_ROWS}; upload the sheet instead."
+        )
+    return rows
+
+
+def validate_patch_rows(rows: List[Dict], faculty_email_map: Dict[str, str]) -> Tuple[Dict[SectionKey, Dict], List[Dict]]:
+    """
+    Validates every change row as a Course made of its section key and the
+    fields it changes, so only the changed values are checked. Later rows for
+    the same section override earlier ones.
+
+    :param rows: Output of parse_patch_rows.
+    :param faculty_email_map: Mapping of faculty short name to email, for rows changing faculty.
+    :return: Tuple of the stored values to set per (course_code, section) and the per-row warnings.
+    """
+    changes: Dict[SectionKey, Dict] = {}
+    warnings_list = []
+    for index, row in enumerate(rows, start=1):
+        course_code = row.get("course_code")
+        unknown = sorted(set(row) - {"course_code", "section", *PATCHABLE_FIELDS})
+        if unknown:
+            warnings_list.append({"record": index, "course_code": course_code, "errors": [f"Unknown fields: {', '.join(unknown)}."]})
+            continue
+        values = {field: row[field] for field in PATCHABLE_FIELDS if field in row}
+        if not values:
+            warnings_list.append({"record": index, "course_code": course_code, "errors": ["No fields to change."]})
+            continue
+
+        errors = []
+        if values.get("timing") is not None:
+            timing = timing_dict(values["timing"])
+            if timing is None:
+                errors.append(f"Invalid timing '{values['timing']}', expected e.g. MW 08:00 AM - 09:15 AM.")
+            values["timing"] = timing
+        if "faculty" in values:
+            values["email"] = faculty_email_map.get(values["faculty"]) if values["faculty"] else None
+            if values["faculty"] and values["email"] is None:
+                # Stored like an upload would store it, without an email
+                warnings_list.append({
+                    "record": index, "course_code": course_code,
+                    "errors": [f"Email mapping not found for faculty '{values['faculty']}'."]
+                })
+        try:
+            course = Course(course_code=course_code, section=row.get("section"), **values)
+        except ModelValidationError as e:
+            errors.extend(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in e.errors())
+            course = None
+        if course is not None and course.section is None:
+            errors.append("Missing section.")
+        if errors:
+            logger.warning(f"⚠️ Skipping invalid change #{index}: {row} | Errors: {errors}")
+            warnings_list.append({"record": index, "course_code": course_code, "errors": errors})
+            continue
+
+        changes.setdefault((course.course_code, course.section), {}).update(course.dict(include=set(values)))
+    return changes, warnings_list
+
+
+async def load_patched_sections(
+    db: AsyncIOMotorDatabase,
+    key: Dict,
+    sectioned: bool,
+    changes: Dict[SectionKey, Dict]
+) -> Dict[SectionKey, Dict]:
+    """
+    Reads the current values of the fields about to change, for the sections in `changes` only.
+    """
+    fields = {"course_code", "section"}.union(*changes.values())
+    if sectioned:
+        found = db[SECTIONS_COLLECTION].find(
+            {**key, "course_code": {"$in": sorted({code for code, _ in changes})}},
+            {"_id": 0, **{field: 1 for field in fields}}
+        )
+        stored = await found.to_list(length=None)
+    else:
+        document = await db["offered_courses"].find_one(key, {"_id": 0, **{f"courses.{field}": 1 for field in fields}})
+        stored = (document or {}).get("courses", [])
+    return {
+        (course.get("course_code"), course.get("section")): course
+        for course in stored if (course.get("course_code"), course.get("section")) in changes
+    }
+
+
+async def save_patch(db: AsyncIOMotorDatabase, key: Dict, sectioned: bool, changes: Dict[SectionKey, Dict], version: str) -> int:
+    """
+    Writes the changed fields in place, then the new version on the header, in
+    one bulk_write of one update per section.
+
+    Embedded courses are selected with $elemMatch on course_code and section
+    and updated through the positional $ operator, which changes the first
+    matching element; the upload of a sheet with the same section twice keeps
+    both rows, and only the first is patched. Sectioned documents are updated
+    by their unique key. The header loses its source_digest, so uploading the
+    original sheet again is processed instead of skipped as unchanged.
+
+    :return: Number of sections matched, which is less than len(changes) if
+             some were removed since load_patched_sections read them.
+    """
+    if sectioned:
+        operations = [
+            UpdateOne({**key, "course_code": course_code, "section": section}, {"$set": fields})
+            for (course_code, section), fields in changes.items()
+        ]
+        result = await db[SECTIONS_COLLECTION].bulk_write(operations, ordered=False)
+    else:
+        operations = [
+            UpdateOne(
+                {**key, "courses": {"$elemMatch": {"course_code": course_code, "section": section}}},
+                {"$set": {f"courses.$.{field}": value for field, value in fields.items()}}
+            )
+            for (course_code, section), fields in changes.items()
+        ]
+        result = await db["offered_courses"].bulk_write(operations, ordered=False)
+    # The version goes last so a reader never sees the new version with old sections
+    await db["offered_courses"].update_one(key, {"$set": {"version": version}, "$unset": {"source_digest": ""}})
+    return result.matched_count
+
+
+async def patch_conflicts(db: AsyncIOMotorDatabase, department: str, semester: int, year: int, sections: List[SectionKey]) -> List[Dict]:
+    """
+    Conflicts of the semester that involve one of the rescheduled `sections` of `department`.
+    Only the rescheduled sections and the sections sharing a room or faculty with them are read.
+    """
+    rescheduled = set(sections)
+    section_filter = {"$or": [{"course_code": course_code, "section": section} for course_code, section in sections]}
+    patched = [row async for row in iter_export_rows(db, semester_key(department, semester, year), section_filter)]
+    rows = await load_shared_rows(db, semester, year, patched)
+    conflicts = await run_parse_job(find_conflicts, rows, department)
+    return [
+        conflict for conflict in conflicts
+        if any(
+            section["department"] == department and (section["course_code"], section["section"]) in rescheduled
+            for section in conflict["sections"]
+        )
+    ]
+
+
+@count_failures(OFFERED_COURSES_PATCH_PIPELINE)
+async def patch_offered_courses(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int,
+    rows: List[Dict],
+    user: dict
+) -> Optional[Dict]:
+    """
+    Applies a list of (course_code, section) changes to stored offered courses
+    without reprocessing the semester. Only the changed rows are validated and
+    only the changed fields are written; sections whose values already match
+    are left alone, and a patch that changes nothing keeps the version.
+
+    The summary is recomputed on its next read because the version changed.
+    Conflicts are only checked when faculty, timing or room changed, so seat
+    count syncs cost a handful of small queries.
+
+    :param rows: Output of parse_patch_rows.
+    :param user: Dictionary containing user information.
+    :return: Counts of updated and unchanged sections with the warnings, or None if the semester does not exist.
+    """
+    key = semester_key(department, semester, year)
+    with observe_stage(OFFERED_COURSES_PATCH_PIPELINE, "lookup"):
+        header = await db["offered_courses"].find_one(key, {"_id": 0, "version": 1, "layout": 1})
+        if header is None:
+            return None
+        faculty_email_map = {}
+        if any("faculty" in row for row in rows):
+            faculty_index = await get_faculty_index(db, department)
+            faculty_email_map = faculty_index.by_short_name if faculty_index else {}
+
+    with observe_stage(OFFERED_COURSES_PATCH_PIPELINE, "validate"):
+        changes, warnings_list = validate_patch_rows(rows, faculty_email_map)
+
+    sectioned = header.get("layout") == SECTIONED_LAYOUT
+    with observe_stage(OFFERED_COURSES_PATCH_PIPELINE, "read_sections"):
+        stored = await load_patched_sections(db, key, sectioned, changes) if changes else {}
+
+    unchanged = 0
+    for section_key in list(changes):
+        current = stored.get(section_key)
+        if current is None:
+            course_code, section = section_key
+            warnings_list.append({"record": None, "course_code": course_code, "errors": [f"Section {section} not found."]})
+            del changes[section_key]
+            continue
+        changes[section_key] = {field: value for field, value in changes[section_key].items() if current.get(field) != value}
+        if not changes[section_key]:
+            unchanged += 1
+            del changes[section_key]
+
+    version = header.get("version")
+    updated = 0
+    if changes:
+        # The new version follows from the previous one and the delta, like an upload's follows from its content
+        version = compute_version({"version": version, "changes": [[*section_key, fields] for section_key, fields in changes.items()]})
+        try:
+            with observe_stage(OFFERED_COURSES_PATCH_PIPELINE, "save"):
+                updated = await save_patch(db, key, sectioned, changes, version)
+        except Exception as e:
+            logger.error(f"❌ Failed to patch offered courses: {e}")
+            raise FileProcessingError(detail="❌ Failed to save offered course changes.")
+        offered_courses_cache.invalidate((department, semester, year))
+        if updated < len(changes):
+            logger.warning(f"⚠️ {len(changes) - updated} patched sections were removed while patching department: {department}")
+            warnings_list.append({
+                "record": None, "course_code": None,
+                "errors": [f"{len(changes) - updated} sections were removed by a concurrent upload and not patched."]
+            })
+        logger.info(f"✅ Patched {updated} sections for department: {department}, semester: {semester}, year: {year}")
+
+        rescheduled = [section_key for section_key, fields in changes.items() if SCHEDULE_FIELDS.intersection(fields)]
+        if rescheduled:
+            with observe_stage(OFFERED_COURSES_PATCH_PIPELINE, "conflicts"):
+                conflicts = await patch_conflicts(db, department, semester, year, rescheduled)
+            if conflicts:
+                logger.warning(f"⚠️ {len(conflicts)} timetable conflicts after patching department: {department}, semester: {semester}, year: {year}")
+            warnings_list.extend(conflict_warnings(conflicts, department))
+
+    UPLOADS.inc((OFFERED_COURSES_PATCH_PIPELINE, "processed"))
+    UPLOAD_RECORDS.inc((OFFERED_COURSES_PATCH_PIPELINE,), updated)
+    UPLOAD_WARNINGS.inc((OFFERED_COURSES_PATCH_PIPELINE,), len(warnings_list))
+
+    return {
+        "message": "✅ Updated offered course sections." if updated else "✅ No sections changed.",
+        "department": department,
+        "semester": semester,
+        "year": year,
+        "updated": updated,
+        "unchanged": unchanged,
+        "version": version,
+        "updated_by": user.get("username"),
+        "warnings": warnings_list
+    }
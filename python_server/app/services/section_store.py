@@ -0,0 +1,97 @@
+# File: app/services/section_store.py
+
+from typing import Dict, List, Tuple
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import InsertOne, UpdateOne, DeleteOne
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Collection holding one document per (department, semester, year, course_code, section)
+SECTIONS_COLLECTION = "offered_course_sections"
+
+# Value of the `layout` field on offered_courses headers whose courses live in SECTIONS_COLLECTION
+SECTIONED_LAYOUT = "sectioned"
+
+
+def semester_key(department: str, semester: int, year: int) -> Dict:
+    return {"department": department, "semester": semester, "year": year}
+
+
+def dedupe_sections(courses: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Keeps the last row for every (course_code, section) pair, since the
+    sectioned layout stores each pair exactly once.
+
+    :param courses: Course dictionaries in sheet order.
+    :return: Tuple of the unique courses and the warnings for dropped duplicates.
+    """
+    unique: Dict[Tuple, Dict] = {}
+    warnings_list = []
+    for course in courses:
+        key = (course["course_code"], course["section"])
+        if key in unique:
+            warnings_list.append({
+                "record": None,
+                "course_code": course["course_code"],
+                "errors": [f"Duplicate section {course['section']}; only the last row was stored."]
+            })
+            del unique[key]
+        unique[key] = course
+    return list(unique.values()), warnings_list
+
+
+async def save_sections(db: AsyncIOMotorDatabase, department: str, semester: int, year: int, courses: List[Dict]) -> Dict:
+    """
+    Stores the courses of one semester as individual section documents.
+    The stored sections are diffed against `courses` and only inserted, changed
+    or removed sections are written, in a single unordered bulk_write.
+
+    :param courses: Unique course dictionaries in the order they should be read back.
+    :return: Counts of inserted, updated, deleted and unchanged sections.
+    """
+    key = semester_key(department, semester, year)
+    existing = {}
+    async for section in db[SECTIONS_COLLECTION].find(key, {"department": 0, "semester": 0, "year": 0}):
+        existing[(section["course_code"], section["section"])] = section
+
+    operations = []
+    unchanged = 0
+    for position, course in enumerate(courses):
+        target = dict(course, position=position)
+        stored = existing.pop((course["course_code"], course["section"]), None)
+        if stored is None:
+            operations.append(InsertOne({**key, **target}))
+            continue
+        changes = {field: value for field, value in target.items() if stored.get(field) != value}
+        if changes:
+            operations.append(UpdateOne({"_id": stored["_id"]}, {"$set": changes}))
+        else:
+            unchanged += 1
+    for stale in existing.values():
+        operations.append(DeleteOne({"_id": stale["_id"]}))
+
+    counts = {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": unchanged}
+    if operations:
+        result = await db[SECTIONS_COLLECTION].bulk_write(operations, ordered=False)
+        counts.update(inserted=result.inserted_count, updated=result.modified_count, deleted=result.deleted_count)
+    logger.info(f"✅ Section diff for {department} {semester}/{year}: {counts}")
+    return counts
+
+
+async def load_sections(db: AsyncIOMotorDatabase, department: str, semester: int, year: int) -> List[Dict]:
+    """
+    Reads the sections of one semester back in upload order, shaped like the
+    embedded `courses` array.
+    """
+    projection = {"_id": 0, "department": 0, "semester": 0, "year": 0, "position": 0}
+    cursor = db[SECTIONS_COLLECTION].find(semester_key(department, semester, year), projection).sort("position", 1)
+    return await cursor.to_list(length=None)
+
+
+async def delete_sections(db: AsyncIOMotorDatabase, department: str, semester: int, year: int) -> int:
+    """
+    Removes the section documents of one semester, e.g. after it was stored embedded again.
+    """
+    result = await db[SECTIONS_COLLECTION].delete_many(semester_key(department, semester, year))
+    return result.deleted_count
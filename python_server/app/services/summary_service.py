@@ -0,0 +1,130 @@
+# File: app/services/summary_service.py
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from app.services.section_store import semester_key
+import logging
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# One summary document per (department, semester, year), written with every upload
+STATS_COLLECTION = "offered_course_stats"
+
+# Order of the day letters used in timings
+DAY_ORDER = {day: position for position, day in enumerate("SMTWRFA")}
+
+
+def _fill_ratio(frame: "pd.DataFrame") -> "pd.Series":
+    ratio = frame["seat_taken"] / frame["capacity"].where(frame["capacity"] > 0)
+    return ratio.round(4)
+
+
+def _records(frame: "pd.DataFrame") -> List[Dict]:
+    # Missing values become None so the records can be stored and serialized as is
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def _minutes(times: "pd.Series") -> "pd.Series":
+    import pandas as pd
+
+    parsed = pd.to_datetime(times, format="%I:%M %p", errors="coerce")
+    return parsed.dt.hour * 60 + parsed.dt.minute
+
+
+def summarize_courses(courses: List[Dict]) -> Dict:
+    """
+    Computes the dashboard aggregates of one semester with vectorized groupbys:
+    sections and seats per faculty, fill ratio per course and occupancy per
+    room, day and time slot. Runs inside the parse executor.
+
+    :param courses: Course dictionaries as stored.
+    :return: Dictionary with `totals`, `faculty_load`, `course_fill` and `room_occupancy`.
+    """
+    # Imported here so that only workers handling uploads load pandas
+    import pandas as pd
+
+    frame = pd.DataFrame.from_records(courses, columns=[
+        "course_code", "section", "faculty", "email", "timing", "room_no", "capacity", "seat_taken"
+    ])
+    for column in ("capacity", "seat_taken"):
+        frame[column] = pd.to_numeric(frame[column], errors="coerce").fillna(0).astype("int64")
+    timing = frame["timing"].map(lambda value: value or {})
+    frame["days"] = timing.map(lambda value: value.get("days"))
+    frame["start_time"] = timing.map(lambda value: value.get("start_time"))
+    frame["end_time"] = timing.map(lambda value: value.get("end_time"))
+
+    faculty = frame.groupby(["faculty", "email"], dropna=False, sort=False).agg(
+        sections=("course_code", "size"),
+        courses=("course_code", "nunique"),
+        capacity=("capacity", "sum"),
+        seat_taken=("seat_taken", "sum"),
+    ).reset_index()
+    faculty["fill_ratio"] = _fill_ratio(faculty)
+    faculty = faculty.sort_values(["sections", "faculty"], ascending=[False, True], na_position="last")
+
+    course = frame.groupby("course_code", sort=True).agg(
+        sections=("course_code", "size"),
+        capacity=("capacity", "sum"),
+        seat_taken=("seat_taken", "sum"),
+    ).reset_index()
+    course["fill_ratio"] = _fill_ratio(course)
+
+    # One row per room and day letter of a section, e.g. "MW" occupies M and W
+    slots = frame[frame["room_no"].notna() & frame["days"].notna()].copy()
+    slots["day"] = slots["days"].map(list)
+    slots = slots.explode("day")
+    section = slots["section"].map(lambda value: "" if pd.isna(value) else str(int(value)))
+    slots["label"] = slots["course_code"].astype(str) + "/" + section
+    room = slots.groupby(["room_no", "day", "start_time", "end_time"], dropna=False, sort=False).agg(
+        sections=("label", "size"),
+        capacity=("capacity", "sum"),
+        seat_taken=("seat_taken", "sum"),
+        courses=("label", list),
+    ).reset_index()
+    room["_day"] = room["day"].map(DAY_ORDER)
+    room["_start"] = _minutes(room["start_time"])
+    room = room.sort_values(["room_no", "_day", "_start"], na_position="last").drop(columns=["_day", "_start"])
+
+    capacity = int(frame["capacity"].sum())
+    seat_taken = int(frame["seat_taken"].sum())
+    totals = {
+        "sections": len(frame),
+        "courses": int(frame["course_code"].nunique()),
+        "faculty": int(frame["faculty"].nunique()),
+        "rooms": int(frame["room_no"].nunique()),
+        "capacity": capacity,
+        "seat_taken": seat_taken,
+        "fill_ratio": round(seat_taken / capacity, 4) if capacity else None,
+    }
+    return {
+        "totals": totals,
+        "faculty_load": _records(faculty),
+        "course_fill": _records(course),
+        "room_occupancy": _records(room),
+    }
+
+
+async def save_course_summary(
+    db: AsyncIOMotorDatabase,
+    department: str,
+    semester: int,
+    year: int,
+    version: Optional[str],
+    summary: Dict
+) -> Dict:
+    """
+    Stores the summary of one semester, stamped with the version of the courses it was computed from.
+    """
+    key = semester_key(department, semester, year)
+    document = {**key, "version": version, "computed_at": datetime.utcnow(), **summary}
+    await db[STATS_COLLECTION].replace_one(key, document, upsert=True)
+    logger.info(f"✅ Summary stored for department: {department}, semester: {semester}, year: {year}")
+    return document
+
+
+async def load_course_summary(db: AsyncIOMotorDatabase, department: str, semester: int, year: int) -> Optional[Dict]:
+    return await db[STATS_COLLECTION].find_one(semester_key(department, semester, year), {"_id": 0})
@@ -0,0 +1,106 @@
+# File: app/utils/cache.py
+
+import logging
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+from app.utils.metrics import REGISTRY, Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+# Every cache of this process, reported on /metrics
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with a time-to-live per entry and LRU eviction.
+
+    Entries are kept per worker process, so other workers only see a write
+    once their own copy expires. It is meant to be used from the event loop
+    and is not thread-safe.
+    """
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        _caches.add(self)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None):
+        """
+        :param ttl_seconds: Lifetime of this entry if shorter than the cache's ttl_seconds.
+        """
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if self.max_entries <= 0 or ttl_seconds <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+            logger.debug(f"Cache '{self.name}' invalidated key {key}")
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+_CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations", "invalidations")
+
+
+def collect_cache_metrics() -> List:
+    """
+    Builds the counters of all caches at scrape time from their own attributes,
+    so lookups pay nothing extra for being exported.
+    """
+    counters = {
+        name: Counter(f"cache_{name}_total", f"Cache {name} per cache.", ("cache",)) for name in _CACHE_COUNTERS
+    }
+    entries = Gauge("cache_entries", "Entries currently held per cache.", ("cache",))
+    for cache in list(_caches):
+        for name, counter in counters.items():
+            counter.values[(cache.name,)] = getattr(cache, name)
+        entries.values[(cache.name,)] = len(cache._entries)
+    return list(counters.values()) + [entries]
+
+
+REGISTRY.add_collector(collect_cache_metrics)
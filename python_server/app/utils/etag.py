@@ -0,0 +1,36 @@
+# File: app/utils/etag.py
+
+import hashlib
+import json
+from typing import Any, Optional
+
+
+def compute_version(content: Any) -> str:
+    """
+    Returns a stable SHA-256 content hash of a JSON-like document.
+    Keys are sorted so the hash only depends on the values.
+    """
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def format_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], version: Optional[str]) -> bool:
+    """
+    Checks an If-None-Match header against a version, accepting lists of
+    ETags, weak validators (W/"...") and the '*' wildcard.
+    """
+    if not if_none_match or not version:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == version:
+            return True
+    return False
@@ -0,0 +1,147 @@
+# File: app/utils/excel_reader.py
+
+import logging
+from io import BytesIO
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from app.exceptions.custom_exceptions import FileProcessingError
+
+logger = logging.getLogger(__name__)
+
+
+def convert_cell(value):
+    """
+    Mirrors pandas' openpyxl conversion: whole floats become ints and
+    blank strings become None.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and not value.strip():
+        return None
+    return value
+
+
+def select_columns(
+    header: Sequence,
+    normalize_column: Callable[[str], str],
+    column_mapping: Dict[str, str],
+    columns_to_drop: Set[str]
+) -> Tuple[List[str], List[int]]:
+    """
+    Normalizes a header row. Blank cells, dropped columns and repeated names are
+    skipped, so every format ends up with the same column names.
+
+    :return: Tuple of the normalized column names and their positions in the header.
+    """
+    columns, positions = [], []
+    for position, cell in enumerate(header):
+        if cell is None or (isinstance(cell, float) and pd.isna(cell)):
+            continue
+        column = normalize_column(str(cell))
+        column = column_mapping.get(column, column)
+        if column in columns_to_drop or column in columns:
+            continue
+        columns.append(column)
+        positions.append(position)
+    return columns, positions
+
+
+class ExcelRecordReader:
+    """
+    Streams the rows of an Excel sheet as dictionaries keyed by normalized column names.
+
+    The workbook is opened with openpyxl in read-only mode and rows are pulled one
+    at a time with `iter_rows(values_only=True)`, so only the current row is held
+    in memory. Use it as a context manager so the workbook is closed afterwards:
+
+        with ExcelRecordReader(content, normalize_column) as reader:
+            if "email" not in reader.columns: ...
+            for record in reader: ...
+    """
+
+    def __init__(
+        self,
+        source: Union[bytes, str],
+        normalize_column: Callable[[str], str],
+        column_mapping: Optional[Dict[str, str]] = None,
+        columns_to_drop: Optional[Iterable[str]] = None,
+        sheet_name: Optional[str] = None
+    ):
+        """
+        :param source: Raw file content or a path to the workbook.
+        :param normalize_column: Function applied to every header cell.
+        :param column_mapping: Renames applied after normalization.
+        :param columns_to_drop: Normalized column names to leave out of the records.
+        :param sheet_name: Sheet to read; defaults to the first sheet.
+        """
+        self.source = source
+        self.normalize_column = normalize_column
+        self.column_mapping = column_mapping or {}
+        self.columns_to_drop = set(columns_to_drop or [])
+        self.sheet_name = sheet_name
+        self.columns: List[str] = []
+        self._workbook = None
+        self._rows = None
+        self._positions: List[int] = []
+
+    def __enter__(self) -> "ExcelRecordReader":
+        try:
+            stream = BytesIO(self.source) if isinstance(self.source, (bytes, bytearray)) else self.source
+            self._workbook = load_workbook(stream, read_only=True, data_only=True)
+            sheet = self._workbook[self.sheet_name] if self.sheet_name else self._workbook.worksheets[0]
+            # Sheet dimensions written by other tools are often wrong; let openpyxl rescan them
+            sheet.reset_dimensions()
+            self._rows = sheet.iter_rows(values_only=True)
+            header = next(self._rows, None)
+        except Exception as e:
+            self.close()
+            logger.error(f"❌ Failed to read Excel file: {e}")
+            raise FileProcessingError(detail="❌ Invalid Excel file format.")
+
+        self.columns, self._positions = select_columns(
+            header or (), self.normalize_column, self.column_mapping, self.columns_to_drop
+        )
+        logger.info(f"✅ Excel sheet opened for streaming with columns: {self.columns}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        Yields one record per data row. Blank rows in the middle of the sheet are
+        kept (as records of None) so record numbers line up with the sheet, while
+        trailing blank rows are dropped the same way pandas drops them.
+        """
+        pending_blank = 0
+        for row in self._rows:
+            if all(convert_cell(cell) is None for cell in row):
+                pending_blank += 1
+                continue
+            values = [convert_cell(row[i]) if i < len(row) else None for i in self._positions]
+            for _ in range(pending_blank):
+                yield dict.fromkeys(self.columns)
+            pending_blank = 0
+            yield dict(zip(self.columns, values))
+
+    def iter_frames(self, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Groups the streamed records into DataFrames of at most `chunk_rows` rows,
+        so column-wise operations can run without loading the whole sheet.
+        """
+        chunk = []
+        for record in self:
+            chunk.append(record)
+            if len(chunk) >= chunk_rows:
+                yield pd.DataFrame.from_records(chunk, columns=self.columns)
+                chunk = []
+        if chunk:
+            yield pd.DataFrame.from_records(chunk, columns=self.columns)
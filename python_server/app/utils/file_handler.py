@@ -1,13 +1,32 @@
 # app/utils/file_handler.py
 import aiofiles
+import hashlib
 import os
+import uuid
 import logging
-from app.config import DEBUG_MODE
+from typing import List, Optional, Union
+from fastapi import UploadFile, Request
+from app.exceptions.custom_exceptions import PayloadTooLargeError
+from app.config import DEBUG_MODE, UPLOAD_MAX_BYTES, UPLOAD_SPOOL_BYTES, UPLOAD_CHUNK_BYTES
 
 logger = logging.getLogger(__name__)
 
 TEMP_DIR = "temp_uploads"
 
+XLSX_FORMAT = "xlsx"
+CSV_FORMAT = "csv"
+PARQUET_FORMAT = "parquet"
+
+# Table formats by file extension, for uploads without a recognisable signature
+EXTENSION_FORMATS = {
+    ".xlsx": XLSX_FORMAT,
+    ".xlsm": XLSX_FORMAT,
+    ".csv": CSV_FORMAT,
+    ".txt": CSV_FORMAT,
+    ".parquet": PARQUET_FORMAT,
+    ".pq": PARQUET_FORMAT,
+}
+
 async def save_temp_file(file_content: bytes, filename: str) -> str:
     os.makedirs(TEMP_DIR, exist_ok=True)
     temp_file_path = os.path.join(TEMP_DIR, filename)
@@ -28,3 +47,117 @@ async def delete_temp_file(file_path: str):
             logger.info(f"🗑️ Temporary file deleted: {file_path}")
     except Exception as e:
         logger.warning(f"⚠️ Failed to delete temporary file {file_path}: {e}")
+
+def content_digest(source: Union[bytes, str]) -> str:
+    """
+    SHA-256 hex digest of an uploaded file, used to recognise repeated uploads.
+
+    :param source: Raw file content or a path to the file.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, "rb") as stream:
+        for chunk in iter(lambda: stream.read(UPLOAD_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ReceivedUpload:
+    """
+    An upload read by receive_upload: kept in memory when small, otherwise
+    spilled to a temporary file. `source` is what the parsers take, either the
+    bytes or the path of the temporary file.
+    """
+
+    def __init__(self, filename: str, size: int, digest: str, content: Optional[bytes] = None, path: Optional[str] = None):
+        self.filename = filename
+        self.size = size
+        self.digest = digest
+        self.content = content
+        self.path = path
+
+    @property
+    def source(self) -> Union[bytes, str]:
+        return self.content if self.path is None else self.path
+
+    async def cleanup(self):
+        if self.path is not None:
+            await delete_temp_file(self.path)
+            self.path = None
+
+
+async def receive_body(request: Request, max_bytes: int = UPLOAD_MAX_BYTES) -> bytes:
+    """
+    Reads a raw request body, e.g. of PATCH /offeredCourses, with the same size
+    cap as uploads: a larger Content-Length is rejected before reading and the
+    stream is counted as it arrives, so a missing or false length does not
+    get around the cap.
+
+    :raises PayloadTooLargeError: If the body is larger than `max_bytes`.
+    """
+    too_large = PayloadTooLargeError(detail=f"❌ Request body exceeds the maximum upload size of {max_bytes} bytes.")
+    length = request.headers.get("content-length")
+    if length is not None and length.isdigit() and int(length) > max_bytes:
+        raise too_large
+
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise too_large
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def receive_upload(file: UploadFile, max_bytes: int = UPLOAD_MAX_BYTES) -> ReceivedUpload:
+    """
+    Reads an upload in UPLOAD_CHUNK_BYTES chunks, hashing it on the way. Files up
+    to UPLOAD_SPOOL_BYTES stay in memory, larger ones are written to a
+    temporary file that the caller removes with `cleanup()`.
+
+    :raises PayloadTooLargeError: If the file is larger than `max_bytes`.
+    """
+    too_large = PayloadTooLargeError(detail=f"❌ File exceeds the maximum upload size of {max_bytes} bytes.")
+    # The multipart parser knows the size up front for spooled files
+    if file.size is not None and file.size > max_bytes:
+        raise too_large
+
+    digest = hashlib.sha256()
+    chunks: List[bytes] = []
+    size = 0
+    path = None
+    spool = None
+    try:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise too_large
+            digest.update(chunk)
+            if spool is None and size > UPLOAD_SPOOL_BYTES:
+                os.makedirs(TEMP_DIR, exist_ok=True)
+                path = os.path.join(TEMP_DIR, f"{uuid.uuid4().hex}{os.path.splitext(file.filename or '')[1]}")
+                spool = await aiofiles.open(path, 'wb')
+                await spool.write(b"".join(chunks))
+                chunks.clear()
+            if spool is not None:
+                await spool.write(chunk)
+            else:
+                chunks.append(chunk)
+        if spool is not None:
+            await spool.close()
+            spool = None
+    except BaseException:
+        if spool is not None:
+            await spool.close()
+        if path is not None:
+            await delete_temp_file(path)
+        raise
+
+    if path is not None:
+        return ReceivedUpload(file.filename, size, digest.hexdigest(), path=path)
+    return ReceivedUpload(file.filename, size, digest.hexdigest(), content=b"".join(chunks))
@@ -0,0 +1,275 @@
+# File: app/utils/metrics.py
+
+import functools
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Latency buckets in seconds, from fast cached reads to large uploads
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Size buckets in bytes, from empty bodies to the upload limit
+SIZE_BUCKETS = (0, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+
+class Counter:
+    """
+    Monotonic counter per label values. Increments are plain dictionary
+    updates, so recording costs no more than a lookup on the hot path.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values: Dict[Tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple = (), amount: float = 1):
+        with self._lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def snapshot(self) -> List[Dict]:
+        return [{"labels": dict(zip(self.labelnames, labels)), "value": value} for labels, value in list(self.values.items())]
+
+
+class Gauge(Counter):
+    """
+    Value per label values that can go up and down, e.g. a queue length.
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float, labels: Tuple = ()):
+        self.values[labels] = value
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram per label values, Prometheus style: each series keeps
+    a count per bucket upper bound plus the total count and sum. Percentiles
+    are estimated from the buckets.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last one is +Inf), count, sum]
+        self.series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Tuple = ()):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    def quantile(self, labels: Tuple, q: float) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the q-th observation, or None without data.
+        """
+        series = self.series.get(labels)
+        if not series or not series[1]:
+            return None
+        rank = q * series[1]
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), series[0]):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> List[Dict]:
+        result = []
+        for labels, (counts, count, total) in list(self.series.items()):
+            result.append({
+                "labels": dict(zip(self.labelnames, labels)),
+                "count": count,
+                "sum": round(total, 6),
+                "p50": self.quantile(labels, 0.5),
+                "p95": self.quantile(labels, 0.95),
+                "p99": self.quantile(labels, 0.99),
+            })
+        return result
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple, values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsRegistry:
+    """
+    In-process registry of the metrics of one worker process. Metrics are
+    created once at import time and looked up by name. Collectors are called
+    at scrape time for values that are kept elsewhere, such as cache counters.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, object] = {}
+        self.collectors: List[Callable[[], Iterable]] = []
+
+    def _register(self, metric):
+        existing = self.metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable]):
+        """
+        Registers a function returning Counter or Gauge objects filled at scrape time.
+        """
+        if collector not in self.collectors:
+            self.collectors.append(collector)
+
+    def collect(self) -> List:
+        metrics = list(self.metrics.values())
+        for collector in self.collectors:
+            metrics.extend(collector())
+        return metrics
+
+    def snapshot(self, prefix: str = "") -> Dict[str, List[Dict]]:
+        return {metric.name: metric.snapshot() for metric in self.collect() if metric.name.startswith(prefix)}
+
+    def render_prometheus(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format (version 0.0.4).
+        """
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            if metric.kind == "histogram":
+                for labels, (counts, count, total) in list(metric.series.items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(metric.buckets + (float("inf"),), counts):
+                        cumulative += bucket_count
+                        le = _format_labels(metric.labelnames, labels, f'le="{_format_value(bound)}"')
+                        lines.append(f"{metric.name}_bucket{le} {cumulative}")
+                    series_labels = _format_labels(metric.labelnames, labels)
+                    lines.append(f"{metric.name}_sum{series_labels} {_format_value(total)}")
+                    lines.append(f"{metric.name}_count{series_labels} {count}")
+            else:
+                for labels, value in list(metric.values.items()):
+                    lines.append(f"{metric.name}{_format_labels(metric.labelnames, labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "Time from request start to the last response byte, per route.",
+    ("method", "route")
+)
+HTTP_RESPONSES = REGISTRY.counter(
+    "http_responses_total", "Responses per route and status code.", ("method", "route", "status")
+)
+HTTP_REQUEST_SIZE = REGISTRY.histogram(
+    "http_request_size_bytes", "Request body size per route.", ("method", "route"), SIZE_BUCKETS
+)
+HTTP_RESPONSE_SIZE = REGISTRY.histogram(
+    "http_response_size_bytes", "Response body size per route.", ("method", "route"), SIZE_BUCKETS
+)
+
+UPLOAD_STAGE_DURATION = REGISTRY.histogram(
+    "upload_stage_duration_seconds", "Time spent in each stage of an upload pipeline.", ("pipeline", "stage")
+)
+UPLOADS = REGISTRY.counter(
+    "uploads_total", "Uploads per pipeline and outcome (processed, deduplicated, failed).", ("pipeline", "outcome")
+)
+UPLOAD_RECORDS = REGISTRY.counter(
+    "upload_records_total", "Records stored by uploads.", ("pipeline",)
+)
+UPLOAD_WARNINGS = REGISTRY.counter(
+    "upload_warnings_total", "Warnings returned by uploads.", ("pipeline",)
+)
+
+
+class StageTimer:
+    """
+    Accumulates the durations of named stages in a plain dictionary. Used
+    inside parse functions, which may run in a worker process where the
+    registry is not the server's: the durations are returned with the result
+    and recorded by the caller with record_stages.
+    """
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - start
+
+
+@contextmanager
+def observe_stage(pipeline: str, stage: str) -> Iterator[None]:
+    """
+    Times a block, which may contain awaits, as one stage of an upload pipeline.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        UPLOAD_STAGE_DURATION.observe(time.perf_counter() - start, (pipeline, stage))
+
+
+def record_stages(pipeline: str, durations: Optional[Dict[str, float]]):
+    for stage, elapsed in (durations or {}).items():
+        UPLOAD_STAGE_DURATION.observe(elapsed, (pipeline, stage))
+
+
+def count_failures(pipeline: str) -> Callable:
+    """
+    Decorates an upload coroutine so every exception it raises, e.g. an invalid
+    file, a full parse executor or a failed save, is counted as a failed upload
+    of `pipeline` before it propagates.
+    """
+    def decorator(function: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        @functools.wraps(function)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await function(*args, **kwargs)
+            except Exception:
+                UPLOADS.inc((pipeline, "failed"))
+                raise
+        return wrapper
+    return decorator
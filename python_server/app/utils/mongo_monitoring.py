@@ -0,0 +1,112 @@
+# File: app/utils/mongo_monitoring.py
+
+import logging
+from pymongo import monitoring
+from app.utils.metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+MONGO_COMMAND_DURATION = REGISTRY.histogram(
+    "mongodb_command_duration_seconds", "Round trip of MongoDB commands as measured by the driver.", ("command",)
+)
+MONGO_COMMAND_FAILURES = REGISTRY.counter(
+    "mongodb_command_failures_total", "MongoDB commands that returned an error.", ("command",)
+)
+
+
+class CommandLatencyListener(monitoring.CommandListener):
+    """
+    Records the latency of every MongoDB command per command name (find,
+    insert, update, aggregate, getMore, ...). The driver calls the listener
+    synchronously on the thread that ran the command, so it only updates counters.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1e6, (event.command_name,))
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1e6, (event.command_name,))
+        MONGO_COMMAND_FAILURES.inc((event.command_name,))
+
+
+# Checkout waits in seconds: from an idle connection handed out at once to a full pool
+CHECKOUT_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+MONGO_POOL_CONNECTIONS = REGISTRY.gauge(
+    "mongodb_pool_connections", "Open connections in the pool of each server.", ("address",)
+)
+MONGO_POOL_CHECKED_OUT = REGISTRY.gauge(
+    "mongodb_pool_checked_out_connections", "Connections of each pool in use by an operation.", ("address",)
+)
+MONGO_POOL_CHECKOUT_WAIT = REGISTRY.histogram(
+    "mongodb_pool_checkout_wait_seconds", "Time an operation waited for a connection, including opening a new one.",
+    ("address",), CHECKOUT_WAIT_BUCKETS
+)
+MONGO_POOL_CHECKOUT_FAILURES = REGISTRY.counter(
+    "mongodb_pool_checkout_failures_total", "Connection checkouts that failed, per reason (timeout, connectionError, poolClosed).",
+    ("address", "reason")
+)
+MONGO_POOL_CLEARED = REGISTRY.counter(
+    "mongodb_pool_cleared_total", "Times a pool was cleared after a network error or a server change.", ("address",)
+)
+
+
+def _address(event) -> tuple:
+    host, port = event.address
+    return (f"{host}:{port}",)
+
+
+class ConnectionPoolListener(monitoring.ConnectionPoolListener):
+    """
+    Tracks the connection pool of every server: open and checked out
+    connections, how long each checkout waited and why checkouts failed.
+    Waits growing with the number of concurrent requests mean the pool is
+    exhausted and MONGO_MAX_POOL_SIZE is too small for the read fan-out.
+    """
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent):
+        pass
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent):
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent):
+        MONGO_POOL_CLEARED.inc(_address(event))
+        logger.warning(f"⚠️ MongoDB connection pool cleared for {_address(event)[0]}")
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent):
+        MONGO_POOL_CONNECTIONS.set(0, _address(event))
+        MONGO_POOL_CHECKED_OUT.set(0, _address(event))
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent):
+        MONGO_POOL_CONNECTIONS.inc(_address(event))
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent):
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent):
+        MONGO_POOL_CONNECTIONS.inc(_address(event), -1)
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent):
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent):
+        MONGO_POOL_CHECKOUT_WAIT.observe(event.duration or 0.0, _address(event))
+        MONGO_POOL_CHECKOUT_FAILURES.inc(_address(event) + (event.reason,))
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent):
+        MONGO_POOL_CHECKOUT_WAIT.observe(event.duration or 0.0, _address(event))
+        MONGO_POOL_CHECKED_OUT.inc(_address(event))
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent):
+        MONGO_POOL_CHECKED_OUT.inc(_address(event), -1)
+
+
+def open_connections() -> int:
+    """
+    Open connections across all pools, as counted by ConnectionPoolListener.
+    """
+    return int(sum(MONGO_POOL_CONNECTIONS.values.values()))
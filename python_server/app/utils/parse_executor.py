@@ -0,0 +1,100 @@
+# File: app/utils/parse_executor.py
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional
+
+from app.config import PARSE_EXECUTOR, PARSE_MAX_WORKERS, PARSE_QUEUE_SIZE, PARSE_TIMEOUT_SECONDS
+from app.exceptions.custom_exceptions import ServiceUnavailableError, ProcessingTimeoutError
+from app.utils.metrics import REGISTRY, Gauge
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[Executor] = None
+_pending_jobs = 0
+_pending_lock = threading.Lock()
+
+
+def start_parse_executor() -> Executor:
+    """
+    Creates the shared executor used for CPU-bound upload parsing.
+    PARSE_EXECUTOR selects a thread pool (default) or a process pool.
+    """
+    global _executor
+    if _executor is not None:
+        return _executor
+    if PARSE_EXECUTOR.lower() == "process":
+        _executor = ProcessPoolExecutor(max_workers=PARSE_MAX_WORKERS)
+    else:
+        _executor = ThreadPoolExecutor(max_workers=PARSE_MAX_WORKERS, thread_name_prefix="parse")
+    logger.info(f"✅ Parse executor started: {PARSE_EXECUTOR} with {PARSE_MAX_WORKERS} workers")
+    return _executor
+
+
+def shutdown_parse_executor():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        logger.info("✅ Parse executor stopped")
+
+
+def pending_parse_jobs() -> int:
+    """
+    Number of jobs currently running or waiting in the executor.
+    """
+    return _pending_jobs
+
+
+def collect_executor_metrics():
+    pending = Gauge("parse_jobs_pending", "Parse jobs running or waiting in the executor.")
+    pending.set(_pending_jobs)
+    capacity = Gauge("parse_jobs_capacity", "Parse jobs accepted at once before uploads get a 503.")
+    capacity.set(PARSE_MAX_WORKERS + PARSE_QUEUE_SIZE)
+    return [pending, capacity]
+
+
+REGISTRY.add_collector(collect_executor_metrics)
+
+
+def _release_slot(_future):
+    global _pending_jobs
+    with _pending_lock:
+        _pending_jobs -= 1
+
+
+async def run_parse_job(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Runs a blocking parse function in the executor and awaits its result.
+
+    The number of in-flight jobs is bounded by PARSE_MAX_WORKERS + PARSE_QUEUE_SIZE;
+    beyond that a 503 is raised instead of queueing more work. A job that exceeds
+    PARSE_TIMEOUT_SECONDS raises a 504. Its worker keeps running until the job
+    returns, so its slot is only released once the job actually finishes.
+
+    With the process executor, `func` and its arguments must be picklable.
+    """
+    global _pending_jobs
+    executor = start_parse_executor()
+
+    with _pending_lock:
+        if _pending_jobs >= PARSE_MAX_WORKERS + PARSE_QUEUE_SIZE:
+            logger.warning(f"⚠️ Parse queue is full ({_pending_jobs} jobs pending), rejecting upload.")
+            raise ServiceUnavailableError(detail="❌ Server is busy processing other uploads. Please retry shortly.")
+        _pending_jobs += 1
+
+    try:
+        future = executor.submit(partial(func, *args, **kwargs))
+    except Exception:
+        _release_slot(None)
+        raise
+    future.add_done_callback(_release_slot)
+
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout=PARSE_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.error(f"❌ Parse job {getattr(func, '__name__', func)} exceeded {PARSE_TIMEOUT_SECONDS}s")
+        raise ProcessingTimeoutError(detail="❌ Processing the uploaded file took too long.")
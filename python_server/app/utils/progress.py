@@ -0,0 +1,22 @@
+# File: app/utils/progress.py
+
+from typing import Awaitable, Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Called with the stage an upload enters and, once parsing is done, the number of rows it produced
+ProgressCallback = Callable[[str, Optional[int]], Awaitable[None]]
+
+
+async def report_progress(progress: Optional[ProgressCallback], stage: str, rows: Optional[int] = None):
+    """
+    Reports a stage change of an upload to `progress`, if given. A failed
+    report is logged and never fails the upload itself.
+    """
+    if progress is None:
+        return
+    try:
+        await progress(stage, rows)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to report upload progress ({stage}): {e}")
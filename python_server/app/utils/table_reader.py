@@ -0,0 +1,162 @@
+# File: app/utils/table_reader.py
+
+import logging
+import os
+from io import BytesIO
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+
+from app.exceptions.custom_exceptions import FileProcessingError
+from app.utils.excel_reader import ExcelRecordReader, select_columns, convert_cell
+from app.utils.file_handler import XLSX_FORMAT, PARQUET_FORMAT, EXTENSION_FORMATS
+from app.config import CSV_ENGINE
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+# Rows per DataFrame when CSV or Parquet records are iterated one by one
+_ITER_CHUNK_ROWS = 5000
+
+
+def _head(source: Union[bytes, str], size: int = 4) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:size])
+    with open(source, "rb") as stream:
+        return stream.read(size)
+
+
+def detect_format(source: Union[bytes, str], filename: Optional[str] = None) -> str:
+    """
+    Detects the format of an upload from its magic bytes, falling back to the
+    file extension. XLSX files are zip archives (PK), Parquet files start with
+    PAR1; CSV has no signature and is recognised by extension only.
+    """
+    head = _head(source)
+    if head.startswith(b"PK\x03\x04"):
+        return XLSX_FORMAT
+    if head == b"PAR1":
+        return PARQUET_FORMAT
+    name = filename or (source if isinstance(source, str) else "")
+    extension = os.path.splitext(name)[1].lower()
+    return EXTENSION_FORMATS.get(extension, XLSX_FORMAT)
+
+
+class FrameRecordReader:
+    """
+    Reads CSV or Parquet uploads with the same interface as ExcelRecordReader:
+    `columns` holds the normalized header, iterating yields record dictionaries
+    and `iter_frames` yields DataFrames. Values are read column-wise by pandas
+    or pyarrow instead of cell by cell.
+    """
+
+    def __init__(
+        self,
+        source: Union[bytes, str],
+        file_format: str,
+        normalize_column: Callable[[str], str],
+        column_mapping: Optional[Dict[str, str]] = None,
+        columns_to_drop: Optional[Iterable[str]] = None
+    ):
+        self.source = source
+        self.file_format = file_format
+        self.normalize_column = normalize_column
+        self.column_mapping = column_mapping or {}
+        self.columns_to_drop = set(columns_to_drop or [])
+        self.columns: List[str] = []
+        self._positions: List[int] = []
+        self._parquet = None
+
+    def _stream(self):
+        return BytesIO(self.source) if isinstance(self.source, (bytes, bytearray)) else self.source
+
+    def __enter__(self) -> "FrameRecordReader":
+        try:
+            if self.file_format == PARQUET_FORMAT:
+                if pq is None:
+                    raise FileProcessingError(detail="❌ Parquet uploads require the pyarrow package.")
+                self._parquet = pq.ParquetFile(self._stream())
+                header = self._parquet.schema_arrow.names
+            else:
+                header = pd.read_csv(self._stream(), header=None, nrows=1, dtype=str).iloc[0].tolist()
+        except FileProcessingError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Failed to read {self.file_format} file: {e}")
+            raise FileProcessingError(detail=f"❌ Invalid {self.file_format.upper()} file format.")
+
+        self.columns, self._positions = select_columns(
+            header, self.normalize_column, self.column_mapping, self.columns_to_drop
+        )
+        self._names = [header[position] for position in self._positions]
+        logger.info(f"✅ {self.file_format.upper()} file opened with columns: {self.columns}")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+    def _read_frames(self, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        if self.file_format == PARQUET_FORMAT:
+            for batch in self._parquet.iter_batches(batch_size=chunk_rows, columns=self._names):
+                yield batch.to_pandas()
+        elif CSV_ENGINE == "pyarrow" and pq is not None:
+            # The pyarrow engine has no chunked mode; it reads the file at once, in parallel
+            frame = pd.read_csv(self._stream(), header=None, skiprows=1, usecols=self._positions, engine="pyarrow")
+            for start in range(0, len(frame), chunk_rows):
+                yield frame.iloc[start:start + chunk_rows]
+        else:
+            yield from pd.read_csv(
+                self._stream(), header=None, skiprows=1, usecols=self._positions, chunksize=chunk_rows
+            )
+
+    def iter_frames(self, chunk_rows: int) -> Iterator[pd.DataFrame]:
+        """
+        Yields DataFrames of at most `chunk_rows` rows with the normalized column
+        names, numbering rows continuously like ExcelRecordReader.iter_frames.
+        """
+        try:
+            for frame in self._read_frames(chunk_rows):
+                frame = frame.reset_index(drop=True)
+                frame.columns = self.columns
+                yield frame
+        except FileProcessingError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Failed to read {self.file_format} file: {e}")
+            raise FileProcessingError(detail=f"❌ Invalid {self.file_format.upper()} file format.")
+
+    def __iter__(self) -> Iterator[Dict]:
+        for frame in self.iter_frames(_ITER_CHUNK_ROWS):
+            frame = frame.astype(object).where(frame.notna(), None)
+            for record in frame.to_dict("records"):
+                yield {column: convert_cell(value) for column, value in record.items()}
+
+
+def open_table_reader(
+    source: Union[bytes, str],
+    normalize_column: Callable[[str], str],
+    column_mapping: Optional[Dict[str, str]] = None,
+    columns_to_drop: Optional[Iterable[str]] = None,
+    sheet_name: Optional[str] = None,
+    filename: Optional[str] = None
+) -> Union[ExcelRecordReader, FrameRecordReader]:
+    """
+    Returns the reader for the detected format of an upload. All readers apply
+    the same header normalization, so services validate every format alike.
+
+    :param filename: Name of the uploaded file, used when the content has no signature.
+    :param sheet_name: Sheet to read from Excel workbooks; ignored for other formats.
+    """
+    file_format = detect_format(source, filename)
+    if file_format == XLSX_FORMAT:
+        return ExcelRecordReader(source, normalize_column, column_mapping, columns_to_drop, sheet_name)
+    return FrameRecordReader(source, file_format, normalize_column, column_mapping, columns_to_drop)
@@ -1,9 +1,68 @@
 # File: app/utils/validators.py
 
 import re
-from typing import Optional  # Step 1: Import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple  # Step 1: Import Optional
+from pydantic import EmailStr
+from pydantic.errors import PydanticValueError
 from app.models.schemas import Timing
 
+if TYPE_CHECKING:
+    # pandas is imported by the column validators on the first upload, not at startup
+    import pandas as pd
+
+# Pattern used to split a timing string into days, start time and end time
+TIMING_PATTERN = r'^([SMTWRFA]{1,2})\s+(\d{1,2}:\d{2}\s*[AP]M)\s*-\s*(\d{1,2}:\d{2}\s*[AP]M)$'
+TIMING_REGEX = re.compile(TIMING_PATTERN)
+
+# Keys of a stored timing, in the order Timing.dict() produces them
+TIMING_KEYS = list(Timing.__fields__)
+
+# Pattern of a single display time such as "01:30 PM"
+TIME_REGEX = re.compile(r'^(\d{1,2}):(\d{2})\s*([AP]M)$')
+
+@lru_cache(maxsize=4096)
+def time_to_minutes(value: str) -> Optional[int]:
+    """
+    Converts a display time such as "01:30 PM" to minutes after midnight, or None if it does not parse.
+    """
+    match = TIME_REGEX.match(value.strip().upper())
+    if not match:
+        return None
+    hours, minutes, meridiem = int(match.group(1)), int(match.group(2)), match.group(3)
+    return (hours % 12 + (12 if meridiem == "PM" else 0)) * 60 + minutes
+
+def minutes_to_time(minutes: int) -> str:
+    """
+    Formats minutes after midnight the way timings are stored, e.g. 810 -> "01:30 PM".
+    """
+    hours, minutes = divmod(minutes, 60)
+    return f"{(hours % 12) or 12:02d}:{minutes:02d} {'PM' if hours >= 12 else 'AM'}"
+
+@lru_cache(maxsize=4096)
+def timing_parts(timing: str) -> Optional[Tuple[str, str, str, Optional[int], Optional[int]]]:
+    """
+    Splits a raw timing string into (days, start_time, end_time, start_minutes,
+    end_minutes), or None if it does not match TIMING_PATTERN. Memoized on the
+    raw string because sections share a small set of time slots.
+    """
+    match = TIMING_REGEX.match(timing.strip())
+    if not match:
+        return None
+    days, start_time, end_time = match.groups()
+    start_time, end_time = start_time.upper(), end_time.upper()
+    return days, start_time, end_time, time_to_minutes(start_time), time_to_minutes(end_time)
+
+def timing_dict(timing) -> Optional[dict]:
+    """
+    Returns the stored form of a timing cell, i.e. Timing(...).dict(), or None
+    if the cell is not a string or does not parse.
+    """
+    parts = timing_parts(timing) if isinstance(timing, str) else None
+    if parts is None:
+        return None
+    return dict(zip(TIMING_KEYS, parts))
+
 def parse_timing(timing: Optional[str]) -> Optional[Timing]:
     """
     Parse timing into a structured format.
@@ -16,17 +75,48 @@ def parse_timing(timing: Optional[str]) -> Optional[Timing]:
     - "SR 03:30 PM - 04:45 PM"
     If timing is missing or invalid, return None.
     """
-    if not timing or not isinstance(timing, str):  # Step 2
-        return None  # Step 3
+    timing = timing_dict(timing)
+    if timing is None:
+        return None
+    # The pattern already guarantees valid days, so the model validators are skipped
+    return Timing.construct(**timing)
 
-    # Updated regex to handle AM/PM, single or two-letter day codes, and extra spaces
-    pattern = r'^([SMTWRFA]{1,2})\s+(\d{1,2}:\d{2}\s*[AP]M)\s*-\s*(\d{1,2}:\d{2}\s*[AP]M)$'  # Step 4
-    match = re.match(pattern, timing.strip())  # Step 5
-    if not match:
-        return None  # Step 6
-    days, start_time, end_time = match.groups()  # Step 7
-    return Timing(
-        days=days,
-        start_time=start_time.upper(),
-        end_time=end_time.upper()
-    )  # Step 8
+@lru_cache(maxsize=4096)
+def normalize_email(email: str) -> Optional[str]:
+    """
+    Validates an email address the same way EmailStr does and returns its
+    normalized form, or None if it is invalid. Results are cached because the
+    same faculty emails repeat across every course row.
+    """
+    try:
+        return EmailStr.validate(email)
+    except (PydanticValueError, ValueError, TypeError):
+        return None
+
+def values_of_type(column: "pd.Series", python_type: type) -> "pd.Series":
+    """
+    Returns a boolean mask that is True where a column value is None or already
+    an instance of `python_type`, i.e. where model validation would keep it as is.
+    Columns whose non-null values are all of the expected kind are accepted
+    in a single dtype inference pass.
+    """
+    import pandas as pd
+
+    expected_kind = {str: "string", int: "integer"}.get(python_type)
+    if expected_kind and pd.api.types.infer_dtype(column, skipna=True) in (expected_kind, "empty"):
+        return pd.Series(True, index=column.index)
+    return column.map(lambda value: value is None or type(value) is python_type)
+
+def email_column(column: "pd.Series") -> Tuple["pd.Series", "pd.Series"]:
+    """
+    Validates an email column once per distinct value.
+
+    :param column: Column of email addresses or None.
+    :return: Tuple of the normalized column and a mask of values that passed validation.
+    """
+    present = column.notna()
+    distinct = column[present & values_of_type(column, str)].unique()
+    normalized = {value: normalize_email(value) for value in distinct}
+    mapped = column.map(normalized)
+    valid = ~present | mapped.notna()
+    return column.where(~valid | ~present, mapped), valid
@@ -0,0 +1,124 @@
+# File: python_server/benchmarks/bench_auth.py
+"""
+Authentication overhead per request, with and without the token cache,
+reported as JSON.
+
+- dependency: get_authenticated_user called directly with the same token,
+  the way the frontend sends it on every request of a session;
+- request: GET requests through a FastAPI app whose only route depends on
+  get_authenticated_user, over httpx.ASGITransport, minus the same requests
+  with authentication disabled. The three variants alternate over --rounds
+  rounds and the median round of each is reported.
+
+Tokens carry the claims of the frontend's session tokens (username, role,
+department, iat, exp), signed with HS256.
+
+Run from python_server/:
+    python -m benchmarks.bench_auth --calls 20000 --output auth.json
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+import httpx
+import jwt
+from fastapi import Depends, FastAPI
+
+from app.models import authentication
+from app.models.authentication import get_authenticated_user, token_cache
+from benchmarks.report import build_report, write_report
+
+
+def session_token(lifetime_seconds: int = 3600) -> str:
+    now = int(time.time())
+    claims = {"username": "registrar", "role": "admin", "department": "CSE", "iat": now, "exp": now + lifetime_seconds}
+    return jwt.encode(claims, authentication.JWT_SECRET, algorithm="HS256")
+
+
+def configure(auth_enabled: bool, cache_entries: int):
+    authentication.AUTH_ENABLED = auth_enabled
+    token_cache.max_entries = cache_entries
+    token_cache.clear()
+
+
+async def time_dependency(token: str, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await get_authenticated_user(token)
+    return time.perf_counter() - start
+
+
+async def time_requests(client: httpx.AsyncClient, token: str, calls: int) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    start = time.perf_counter()
+    for _ in range(calls):
+        response = await client.get("/whoami", headers=headers)
+        assert response.status_code == 200, response.text
+    return time.perf_counter() - start
+
+
+def per_call_us(elapsed: float, calls: int) -> float:
+    return round(elapsed / calls * 1e6, 2)
+
+
+async def run(calls: int, requests: int, rounds: int) -> dict:
+    token = session_token()
+    results = {}
+
+    for label, cache_entries in (("no_cache", 0), ("cache", 1024)):
+        configure(True, cache_entries)
+        await time_dependency(token, min(calls, 1000))
+        results[f"dependency_{label}_us"] = per_call_us(await time_dependency(token, calls), calls)
+
+    app = FastAPI()
+
+    @app.get("/whoami")
+    async def whoami(user: dict = Depends(get_authenticated_user)):
+        return user
+
+    variants = (("auth_disabled", False, 0), ("no_cache", True, 0), ("cache", True, 1024))
+    timings = {label: [] for label, _, _ in variants}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        # Variants alternate within every round so drift affects them alike
+        for round_number in range(rounds + 1):
+            for label, auth_enabled, cache_entries in variants:
+                configure(auth_enabled, cache_entries)
+                elapsed = await time_requests(client, token, requests)
+                if round_number:
+                    timings[label].append(elapsed)
+
+    baseline = statistics.median(timings["auth_disabled"])
+    for label, _, _ in variants:
+        elapsed = statistics.median(timings[label])
+        results[f"request_{label}_us"] = per_call_us(elapsed, requests)
+        if label != "auth_disabled":
+            results[f"request_{label}_overhead_us"] = per_call_us(elapsed - baseline, requests)
+
+    results["cache_stats"] = token_cache.stats()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000, help="Direct dependency calls per variant")
+    parser.add_argument("--requests", type=int, default=500, help="ASGI requests per variant and round")
+    parser.add_argument("--rounds", type=int, default=7, help="Rounds of requests; the median round is reported")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = asyncio.run(run(args.calls, args.requests, args.rounds))
+    parameters = {key: value for key, value in vars(args).items() if key != "output"}
+    write_report(build_report("auth", parameters, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
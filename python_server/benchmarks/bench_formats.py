@@ -0,0 +1,86 @@
+# File: python_server/benchmarks/bench_formats.py
+"""
+Parse time of the offered courses upload per file format.
+
+Writes the same synthetic courses as XLSX, CSV and (with pyarrow) Parquet and
+times parse_offered_courses_file on each, i.e. reading, normalization,
+sanitizing and bulk validation. Results are reported per 10k rows.
+
+Run from python_server/:
+    python -m benchmarks.bench_formats --rows 10000 --repeat 3
+"""
+
+import argparse
+import io
+import logging
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+import pandas as pd
+
+from benchmarks.workbooks import COURSE_HEADER, synthetic_records, write_xlsx
+from app.services.course_service import parse_offered_courses_file
+from app.utils import table_reader
+
+def write_files(rows: int):
+    records, email_map = synthetic_records(rows)
+    frame = pd.DataFrame.from_records(records)
+    frame.columns = COURSE_HEADER
+    # Parquet needs one type per column; the registrar export writes rooms as text
+    frame["Room No"] = frame["Room No"].astype(str)
+
+    xlsx = write_xlsx(COURSE_HEADER, frame.itertuples(index=False))
+
+    files = {"xlsx": (xlsx, "courses.xlsx"), "csv": (frame.to_csv(index=False).encode(), "courses.csv")}
+    if table_reader.pq is not None:
+        parquet = io.BytesIO()
+        frame.to_parquet(parquet, index=False)
+        files["parquet"] = (parquet.getvalue(), "courses.parquet")
+    return files, email_map
+
+
+def best_of(content, filename, email_map, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse_offered_courses_file(content, email_map, True, None, filename)
+        timings.append(time.perf_counter() - start)
+    stages = result.pop("timings")
+    return min(timings), result, stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    files, email_map = write_files(args.rows)
+    print(f"rows={args.rows} csv_engine={table_reader.CSV_ENGINE}")
+
+    baseline = None
+    for name, (content, filename) in files.items():
+        elapsed, result, stages = best_of(content, filename, email_map, args.repeat)
+        if baseline is None:
+            baseline = result
+        assert result == baseline, f"{name} parsed differently from xlsx"
+        per_10k = elapsed * 10000 / args.rows
+        print(f"{name:14s} {len(content) / 1024:8.0f} KiB {per_10k * 1000:8.1f} ms/10k rows ({args.rows / elapsed:,.0f} rows/s)")
+        print(" " * 15 + "  ".join(f"{stage} {seconds * 1000:.0f} ms" for stage, seconds in stages.items()))
+
+    if "csv" in files and table_reader.pq is not None:
+        # Compare both CSV engines regardless of the configured one
+        table_reader.CSV_ENGINE = "pyarrow" if table_reader.CSV_ENGINE == "c" else "c"
+        content, filename = files["csv"]
+        elapsed, _, _ = best_of(content, filename, email_map, args.repeat)
+        label = f"csv ({table_reader.CSV_ENGINE})"
+        print(f"{label:14s} {len(content) / 1024:8.0f} KiB {elapsed * 10000 / args.rows * 1000:8.1f} ms/10k rows ({args.rows / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
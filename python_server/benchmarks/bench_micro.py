@@ -0,0 +1,103 @@
+# File: python_server/benchmarks/bench_micro.py
+"""
+Microbenchmarks of the upload hot paths, reported as JSON.
+
+- parse_timing over realistic timing cells, with a cold and a warm memo;
+- camel_to_snake over faculty sheet headers;
+- sanitize_field over a mixed room_no column;
+- the offered courses row loop: sanitize_course_frame + build_courses_bulk
+  on in-memory records, and parse_offered_courses_file on a workbook
+  (read + sanitize + validate, as run by process_offered_courses).
+
+Each benchmark reports the best of --repeat runs.
+
+Run from python_server/:
+    python -m benchmarks.bench_micro --rows 10000 --output micro.json
+"""
+
+import argparse
+import logging
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+import pandas as pd
+
+from app.services.course_service import (
+    sanitize_field, sanitize_course_frame, build_courses_bulk, parse_offered_courses_file
+)
+from app.services.faculty_service import camel_to_snake
+from app.utils.validators import parse_timing, timing_parts, time_to_minutes
+from benchmarks.bench_timing import timing_cells
+from benchmarks.report import build_report, write_report
+from benchmarks.workbooks import FACULTY_HEADER, COURSE_HEADER, synthetic_records, write_xlsx
+
+
+def best_of(function, repeat: int, reset=None) -> float:
+    timings = []
+    for _ in range(repeat):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def result(operations: int, elapsed: float, unit: str = "ops") -> dict:
+    return {
+        unit: operations,
+        "total_ms": round(elapsed * 1000, 3),
+        "per_op_us": round(elapsed / operations * 1e6, 3),
+        f"{unit}_per_s": round(operations / elapsed, 1),
+    }
+
+
+def clear_timing_caches():
+    timing_parts.cache_clear()
+    time_to_minutes.cache_clear()
+
+
+def run(rows: int, repeat: int) -> dict:
+    results = {}
+
+    cells = timing_cells(rows)
+    parse_all = lambda: [parse_timing(cell) for cell in cells]
+    results["parse_timing_cold"] = result(rows, best_of(parse_all, repeat, clear_timing_caches))
+    results["parse_timing_warm"] = result(rows, best_of(parse_all, repeat))
+
+    headers = FACULTY_HEADER * max(1, rows // len(FACULTY_HEADER))
+    results["camel_to_snake"] = result(len(headers), best_of(lambda: [camel_to_snake(name) for name in headers], repeat))
+
+    records, email_map = synthetic_records(rows)
+    rooms = [record["room_no"] for record in records]
+    rooms[::50] = [float("nan")] * len(rooms[::50])
+    results["sanitize_field"] = result(len(rooms), best_of(lambda: [sanitize_field(room, "room_no") for room in rooms], repeat))
+
+    frame = pd.DataFrame.from_records(records)
+    row_loop = lambda: build_courses_bulk(sanitize_course_frame(frame, email_map), 0, [])
+    results["row_loop_in_memory"] = result(rows, best_of(row_loop, repeat, clear_timing_caches), "rows")
+
+    workbook = write_xlsx(COURSE_HEADER, [list(record.values()) for record in records])
+    parse_file = lambda: parse_offered_courses_file(workbook, email_map, True, None, "courses.xlsx")
+    results["row_loop_xlsx"] = result(rows, best_of(parse_file, repeat, clear_timing_caches), "rows")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = run(args.rows, args.repeat)
+    write_report(build_report("micro", {"rows": args.rows, "repeat": args.repeat}, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# File: python_server/benchmarks/bench_middleware.py
+"""
+Per-request overhead of the request logging middleware.
+
+Calls a minimal FastAPI app directly through ASGI (no server, no transport)
+with a JSON endpoint and a streaming endpoint, and compares:
+
+- no middleware;
+- the previous BaseHTTPMiddleware implementation;
+- the pure ASGI LoggingMiddleware, logging every request as text or JSON,
+  and sampling 10% of the requests.
+
+Log lines go to a handler that discards them, so formatting is measured but
+not I/O. Also checks that streamed chunks reach the client one by one.
+
+Run from python_server/:
+    python -m benchmarks.bench_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware import logging_middleware
+from app.middleware.logging_middleware import LoggingMiddleware
+
+STREAM_CHUNKS = 5
+
+
+class PreviousLoggingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        logging_middleware.logger.info(
+            f"✅ {request.method} {request.url.path} completed_in={process_time:.2f}ms status_code={response.status_code}"
+        )
+        return response
+
+
+def build_app(middleware=None, **options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"item_id": item_id, "name": "CSE101"}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for number in range(STREAM_CHUNKS):
+                yield f"chunk {number}\n".encode()
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    if middleware is not None:
+        app.add_middleware(middleware, **options)
+    return app
+
+
+async def call(app, path: str) -> list:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    messages = []
+    received = []
+
+    async def receive():
+        # Like a server: the body once, then nothing until the client disconnects
+        if received:
+            await asyncio.Event().wait()
+        received.append(True)
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+async def measure(app, requests: int, path: str) -> float:
+    for _ in range(200):
+        await call(app, path)
+    start = time.perf_counter()
+    for number in range(requests):
+        await call(app, path if "{" not in path else path.format(number))
+    return (time.perf_counter() - start) / requests
+
+
+async def main_async(requests: int):
+    variants = [
+        ("no middleware", build_app()),
+        ("BaseHTTPMiddleware (previous)", build_app(PreviousLoggingMiddleware)),
+        ("ASGI, text, every request", build_app(LoggingMiddleware, log_format="text", sample_rate=1.0)),
+        ("ASGI, json, every request", build_app(LoggingMiddleware, log_format="json", sample_rate=1.0)),
+        ("ASGI, text, 10% sampled", build_app(LoggingMiddleware, log_format="text", sample_rate=0.1)),
+    ]
+    print(f"requests={requests}")
+    baseline = {}
+    for name, app in variants:
+        for path in ("/items/{}", "/stream"):
+            per_request = await measure(app, requests, path)
+            baseline.setdefault(path, per_request)
+            overhead = (per_request - baseline[path]) * 1e6
+            print(f"{name:32s} {path:10s} {per_request * 1e6:8.1f} us/request  overhead {overhead:7.1f} us")
+
+    for name, app in variants[1:3]:
+        messages = await call(app, "/stream")
+        bodies = [message for message in messages if message["type"] == "http.response.body" and message.get("body")]
+        print(f"{name:32s} streamed body messages: {len(bodies)} of {STREAM_CHUNKS}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    logger = logging_middleware.logger
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.NullHandler())
+    asyncio.run(main_async(args.requests))
+
+
+if __name__ == "__main__":
+    main()
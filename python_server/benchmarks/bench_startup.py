@@ -0,0 +1,194 @@
+# File: python_server/benchmarks/bench_startup.py
+"""
+Cold start and memory of the server processes, reported as JSON.
+
+1. import: time and RSS of importing app.main in a fresh interpreter, as
+   shipped (pandas and openpyxl loaded by the first upload) and with the
+   ingestion stack imported eagerly, as before;
+2. gunicorn: for every --workers count, with and without preload_app, starts
+   gunicorn with gunicorn.conf.py on benchmarks.standin_app (mongomock-motor,
+   no MongoDB needed) and reports
+   - ready_s: from spawning gunicorn until every worker is up and GET / answers,
+   - RSS and PSS of the master and each worker when idle and after two
+     faculty uploads (the first one loads pandas and openpyxl in its worker),
+   - the latency of both uploads.
+
+PSS splits pages shared between processes evenly, so it shows what
+preload_app saves; RSS counts shared pages in every worker. Memory figures
+need Linux /proc.
+
+Run from python_server/:
+    python -m benchmarks.bench_startup --workers 1 2 4 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from benchmarks.report import build_report, write_report, rss_mb, pss_mb
+from benchmarks.workbooks import faculty_workbook
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app.main
+imported = time.perf_counter() - start
+if {eager}:
+    import app.utils.table_reader, app.services.summary_service, pandas, openpyxl
+from benchmarks.report import rss_mb
+print(json.dumps({{
+    "app_import_s": imported,
+    "total_s": time.perf_counter() - start,
+    "rss_mb": rss_mb(),
+    "ingestion_loaded": [name for name in ("pandas", "numpy", "openpyxl") if name in sys.modules],
+}}))
+"""
+
+ENVIRONMENT = {
+    "DATABASE_URL": "mongodb://localhost:27017",
+    "DATABASE_NAME": "course_benchmark",
+    "JWT_SECRET": "benchmark",
+    "LOG_LEVEL": "WARNING",
+}
+
+
+def measure_import(eager: bool, repeat: int) -> Dict:
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE.format(eager=eager)],
+            capture_output=True, text=True, check=True, env={**os.environ, **ENVIRONMENT}
+        ).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    return {
+        "runs": repeat,
+        "app_import_s_median": round(statistics.median(run["app_import_s"] for run in runs), 3),
+        "total_s_median": round(statistics.median(run["total_s"] for run in runs), 3),
+        "rss_mb_median": statistics.median(run["rss_mb"] for run in runs if run["rss_mb"] is not None) if runs[0]["rss_mb"] else None,
+        "ingestion_loaded": runs[-1]["ingestion_loaded"],
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def child_pids(parent: int) -> List[int]:
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stream:
+                # The command name may contain spaces; the parent pid follows the closing parenthesis
+                fields = stream.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        if int(fields[1]) == parent:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def memory(master: int, workers: List[int]) -> Dict:
+    return {
+        "master": {"rss_mb": rss_mb(master), "pss_mb": pss_mb(master)},
+        "workers": [{"pid": pid, "rss_mb": rss_mb(pid), "pss_mb": pss_mb(pid)} for pid in workers],
+    }
+
+
+def wait_ready(process: subprocess.Popen, url: str, workers: int, timeout: float) -> Optional[float]:
+    """
+    Seconds until `workers` workers are forked and GET / answers, or None on timeout.
+    """
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn exited with code {process.returncode}")
+        try:
+            if len(child_pids(process.pid)) >= workers and httpx.get(url, timeout=1).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+    return None
+
+
+def upload_faculty(url: str, department: str) -> Dict:
+    content = faculty_workbook(120, department)
+    start = time.perf_counter()
+    response = httpx.post(
+        f"{url}/upload/facultyInformation",
+        files={"file": ("faculty.xlsx", content)}, data={"wait": "true"}, timeout=120
+    )
+    return {"status": response.status_code, "latency_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+
+def measure_gunicorn(workers: int, preload: bool, timeout: float) -> Dict:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    environment = {
+        **os.environ, **ENVIRONMENT,
+        "WEB_CONCURRENCY": str(workers), "BIND": f"127.0.0.1:{port}", "PRELOAD_APP": str(preload).lower(),
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "benchmarks.standin_app:app", "-c", "gunicorn.conf.py"],
+        env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        ready = wait_ready(process, url, workers, timeout)
+        if ready is None:
+            return {"workers": workers, "preload_app": preload, "error": f"not ready after {timeout} s"}
+        # Let the remaining workers finish their startup hooks
+        time.sleep(1.0)
+        pids = child_pids(process.pid)
+        idle = memory(process.pid, pids)
+        uploads = [upload_faculty(url, "CSE"), upload_faculty(url, "EEE")]
+        return {
+            "workers": workers,
+            "preload_app": preload,
+            "ready_s": round(ready, 3),
+            "idle": idle,
+            "uploads": uploads,
+            "after_uploads": memory(process.pid, pids),
+        }
+    finally:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per import measurement")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for gunicorn to be ready")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    results = {
+        "import_lazy": measure_import(False, args.repeat),
+        "import_eager": measure_import(True, args.repeat),
+        "gunicorn": [
+            measure_gunicorn(workers, preload, args.timeout)
+            for workers in args.workers for preload in (True, False)
+        ],
+    }
+    parameters = {key: value for key, value in vars(args).items() if key != "output"}
+    write_report(build_report("startup", parameters, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
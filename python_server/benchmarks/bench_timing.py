@@ -0,0 +1,132 @@
+# File: python_server/benchmarks/bench_timing.py
+"""
+Timing parsing, before and after memoization.
+
+Generates timing cells with a realistic distribution: a few dozen day/slot
+combinations, most sections in the common ones, plus spacing variants,
+blank and unparseable cells. Times two stages on the same cells:
+
+- per value: the previous parse_timing (inline re.match + validated Timing)
+  vs the memoized parse_timing (compiled pattern, Timing.construct);
+- per chunk: the previous str.extract split in sanitize_course_frame vs
+  parsing each distinct string once.
+
+Run from python_server/:
+    python -m benchmarks.bench_timing --rows 50000 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import random
+import re
+import time
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+import pandas as pd
+
+from app.models.schemas import Timing
+from app.utils.validators import TIMING_PATTERN, parse_timing, timing_parts, timing_dict, time_to_minutes
+from app.services.course_service import sanitize_course_frame
+from benchmarks.workbooks import DAYS, SLOTS
+
+
+def timing_cells(rows: int, seed: int = 7):
+    rng = random.Random(seed)
+    # Popular slots get most sections, like a real timetable
+    combos = [f"{days} {slot}" for days in DAYS for slot in SLOTS]
+    weights = [1 / (rank + 1) for rank in range(len(combos))]
+    cells = []
+    for value in rng.choices(combos, weights=weights, k=rows):
+        roll = rng.random()
+        if roll < 0.03:
+            value = None
+        elif roll < 0.05:
+            value = "TBA"
+        elif roll < 0.10:
+            value = value.replace(" - ", "-").replace(" AM", "AM")
+        cells.append(value)
+    return cells
+
+
+def previous_parse_timing(timing):
+    if not timing or not isinstance(timing, str):
+        return None
+    match = re.match(TIMING_PATTERN, timing.strip())
+    if not match:
+        return None
+    days, start_time, end_time = match.groups()
+    return Timing(days=days, start_time=start_time.upper(), end_time=end_time.upper())
+
+
+def previous_split(df: pd.DataFrame) -> pd.Series:
+    parts = df['timing'].astype(str).str.strip().str.extract(TIMING_PATTERN)
+    matched = parts[0].notna()
+    timing = pd.Series(None, index=df.index, dtype=object)
+    if matched.any():
+        timing_frame = pd.DataFrame({
+            'days': parts.loc[matched, 0],
+            'start_time': parts.loc[matched, 1].str.upper(),
+            'end_time': parts.loc[matched, 2].str.upper()
+        })
+        timing[matched] = pd.Series(timing_frame.to_dict(orient='records'), index=timing_frame.index)
+    return timing
+
+
+def distinct_split(df: pd.DataFrame) -> list:
+    # Same steps as sanitize_course_frame
+    codes, distinct = pd.factorize(df['timing'], use_na_sentinel=True)
+    parsed = [timing_dict(value) for value in distinct]
+    return [None if code < 0 or parsed[code] is None else dict(parsed[code]) for code in codes]
+
+
+def best_of(function, repeat, reset=None):
+    timings = []
+    for _ in range(repeat):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def clear_caches():
+    timing_parts.cache_clear()
+    time_to_minutes.cache_clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    cells = timing_cells(args.rows)
+    frame = pd.DataFrame({"course_code": "CSE101", "timing": cells})
+    print(f"rows={args.rows} distinct={len(set(cells))}")
+
+    # Both parsers must agree on the display fields
+    display = {"start_minutes", "end_minutes"}
+    for cell in set(cells):
+        old, new = previous_parse_timing(cell), parse_timing(cell)
+        assert (old and old.dict(exclude=display)) == (new and new.dict(exclude=display)), cell
+
+    results = [
+        ("parse_timing (previous)", best_of(lambda: [previous_parse_timing(cell) for cell in cells], args.repeat)),
+        ("parse_timing (memoized, cold)", best_of(lambda: [parse_timing(cell) for cell in cells], args.repeat, clear_caches)),
+        ("parse_timing (memoized, warm)", best_of(lambda: [parse_timing(cell) for cell in cells], args.repeat)),
+        ("chunk split (str.extract)", best_of(lambda: previous_split(frame), args.repeat)),
+        ("chunk split (distinct values)", best_of(lambda: distinct_split(frame), args.repeat, clear_caches)),
+        ("sanitize_course_frame (whole)", best_of(lambda: sanitize_course_frame(frame, {}), args.repeat, clear_caches)),
+    ]
+    for name, elapsed in results:
+        print(f"{name:32s} {elapsed * 1000:8.1f} ms ({args.rows / elapsed:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
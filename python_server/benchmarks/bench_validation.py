@@ -0,0 +1,71 @@
+# File: python_server/benchmarks/bench_validation.py
+"""
+Microbenchmark of per-row vs bulk validation of offered course records.
+
+Compares the per-row path (one Course per row, OfferedCourses re-validating
+the list, then .dict()) with build_courses_bulk on the same sanitized chunk.
+
+Run from python_server/:
+    python -m benchmarks.bench_validation --rows 5000 --repeat 5
+"""
+
+import argparse
+import logging
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+import pandas as pd
+
+from app.models.schemas import OfferedCourses
+from app.services.course_service import sanitize_course_frame, build_courses_per_row, build_courses_bulk
+from benchmarks.workbooks import synthetic_records
+
+
+def per_row(chunk):
+    warnings_list = []
+    courses = build_courses_per_row(chunk, 0, warnings_list)
+    document = OfferedCourses(department="CSE", semester=3, year=2024, courses=courses)
+    return document.dict(by_alias=True)
+
+
+def bulk(chunk):
+    warnings_list = []
+    document = OfferedCourses(department="CSE", semester=3, year=2024, courses=[]).dict(by_alias=True)
+    document["courses"] = build_courses_bulk(chunk, 0, warnings_list)
+    return document
+
+
+def best_of(func, chunk, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(chunk)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    records, email_map = synthetic_records(args.rows)
+    chunk = sanitize_course_frame(pd.DataFrame.from_records(records), email_map)
+
+    assert per_row(chunk)["courses"] == bulk(chunk)["courses"]
+    row_time = best_of(per_row, chunk, args.repeat)
+    bulk_time = best_of(bulk, chunk, args.repeat)
+    print(f"rows={args.rows}")
+    print(f"per-row validation: {row_time * 1000:8.1f} ms ({args.rows / row_time:,.0f} rows/s)")
+    print(f"bulk validation:    {bulk_time * 1000:8.1f} ms ({args.rows / bulk_time:,.0f} rows/s)")
+    print(f"speedup:            {row_time / bulk_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
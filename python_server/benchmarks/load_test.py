@@ -0,0 +1,247 @@
+# File: python_server/benchmarks/load_test.py
+"""
+End-to-end load driver for the upload and read endpoints, reported as JSON.
+
+Runs app.main:app in-process through httpx.ASGITransport, so no server or
+network is involved, against mongomock-motor (default, nothing to install
+beyond benchmarks/requirements.txt) or a real MongoDB (--backend mongodb).
+The app starts up as usual: indexes, parse executor and job workers.
+
+Scenarios, in order:
+1. faculty_upload: one synthetic faculty workbook per department;
+2. offered_courses_upload: --semesters workbooks of --rows sections per
+   department, --upload-concurrency at a time (processed within the request);
+3. offered_courses_upload_unchanged: the first workbook of every department
+   again, which is answered from the stored upload summary;
+4. read scenarios with --concurrency requests in flight: the cached course
+   list, a conditional GET answered with 304, a filtered search, the summary,
+   the semester conflicts and an NDJSON export of one department;
+5. offered_courses_patch_seats: PATCH /offeredCourses with new seat counts
+   for 5 sections, the registration sync that used to need a full upload.
+
+Every scenario reports p50/p95/p99 latency, requests/s and errors; uploads
+also report rows/s. mongomock keeps data in Python dictionaries, so database
+time is not representative: compare runs on the same backend only. Its
+$unwind copies the whole document once per array element, which makes the
+embedded layout quadratic in the section count, so on mongomock the storage
+defaults to the sectioned layout; pass --storage embedded to measure it anyway
+with small --rows.
+
+Run from python_server/:
+    pip install -r benchmarks/requirements.txt
+    python -m benchmarks.load_test --departments 4 --rows 2000 --output load.json
+    python -m benchmarks.load_test --backend mongodb --mongo-url mongodb://localhost:27017
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List
+
+DEPARTMENTS = ["CSE", "EEE", "ECE", "CE", "ME", "BBA", "ENG", "ECO", "PHR", "MATH"]
+FIRST_YEAR = 2024
+
+
+def department_codes(count: int) -> List[str]:
+    return [DEPARTMENTS[n % len(DEPARTMENTS)] + (str(n // len(DEPARTMENTS)) if n >= len(DEPARTMENTS) else "")
+            for n in range(count)]
+
+
+def semesters(count: int) -> List[tuple]:
+    # (semester, year) pairs, three semesters per year
+    return [(n % 3 + 1, FIRST_YEAR + n // 3) for n in range(count)]
+
+
+async def run_scenario(
+    name: str,
+    calls: List[Callable[[], Awaitable]],
+    concurrency: int,
+    expected_status: tuple = (200,),
+    rows_per_call: int = 0
+) -> Dict:
+    """
+    Runs the calls with at most `concurrency` in flight and summarizes their latencies.
+    """
+    from benchmarks.report import latency_summary
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors: Dict[str, int] = {}
+
+    async def timed(call):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await call()
+            latencies.append(time.perf_counter() - start)
+            if response.status_code not in expected_status:
+                errors[str(response.status_code)] = errors.get(str(response.status_code), 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(call) for call in calls))
+    wall = time.perf_counter() - started
+
+    summary = {**latency_summary(latencies), "concurrency": concurrency, "wall_s": round(wall, 3),
+               "requests_per_s": round(len(calls) / wall, 1) if wall else None, "errors": errors}
+    if rows_per_call:
+        summary["rows_per_s"] = round(rows_per_call * len(calls) / wall, 1) if wall else None
+    logging.getLogger("benchmarks.load_test").warning(
+        f"{name}: {summary['count']} requests, p50 {summary.get('p50_ms')} ms, p95 {summary.get('p95_ms')} ms, errors {errors}"
+    )
+    return summary
+
+
+async def drive(args) -> Dict:
+    import httpx
+    from app.main import app
+    from benchmarks.workbooks import faculty_workbook, offered_courses_workbook
+
+    departments = department_codes(args.departments)
+    terms = semesters(args.semesters)
+    results = {}
+
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+            def upload(path: str, content: bytes, data: Dict):
+                files = {"file": ("upload.xlsx", content, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
+                return lambda: client.post(path, files=files, data={**data, "wait": "true"})
+
+            faculty_files = {department: faculty_workbook(args.faculty, department) for department in departments}
+            results["faculty_upload"] = await run_scenario(
+                "faculty_upload",
+                [upload("/upload/facultyInformation", content, {}) for content in faculty_files.values()],
+                args.upload_concurrency, rows_per_call=args.faculty
+            )
+
+            # A different seed per upload, so no two files are identical
+            course_files = {
+                (department, semester, year): offered_courses_workbook(args.rows, args.faculty, seed=index)
+                for index, (department, (semester, year)) in enumerate(
+                    (department, term) for department in departments for term in terms
+                )
+            }
+
+            def course_upload(key):
+                department, semester, year = key
+                return upload("/upload/offeredCourses", course_files[key],
+                              {"department": department, "semester_no": str(semester), "year": str(year)})
+
+            results["offered_courses_upload"] = await run_scenario(
+                "offered_courses_upload", [course_upload(key) for key in course_files],
+                args.upload_concurrency, rows_per_call=args.rows
+            )
+            first_files = [(department, *terms[0]) for department in departments]
+            results["offered_courses_upload_unchanged"] = await run_scenario(
+                "offered_courses_upload_unchanged", [course_upload(key) for key in first_files],
+                args.upload_concurrency, rows_per_call=args.rows
+            )
+
+            keys = list(course_files)
+            params = lambda n: {"department": keys[n % len(keys)][0], "semester": keys[n % len(keys)][1], "year": keys[n % len(keys)][2]}
+            etags = {}
+            for key in keys:
+                response = await client.get("/offeredCourses", params={"department": key[0], "semester": key[1], "year": key[2]})
+                etags[key] = response.headers.get("etag")
+
+            read_scenarios = {
+                "get_offered_courses": (
+                    lambda n: lambda: client.get("/offeredCourses", params=params(n)), (200,)),
+                "get_offered_courses_not_modified": (
+                    lambda n: lambda: client.get("/offeredCourses", params=params(n),
+                                                 headers={"If-None-Match": etags[keys[n % len(keys)]]}), (304,)),
+                "search_offered_courses": (
+                    lambda n: lambda: client.get("/offeredCourses/search", params={
+                        **params(n), "faculty": f"F{n % args.faculty:03d}", "fields": "course_code,section,timing", "limit": 50
+                    }), (200,)),
+                "offered_courses_summary": (
+                    lambda n: lambda: client.get("/offeredCourses/summary", params=params(n)), (200,)),
+                "semester_conflicts": (
+                    lambda n: lambda: client.get("/offeredCourses/conflicts", params={
+                        "semester": keys[n % len(keys)][1], "year": keys[n % len(keys)][2]
+                    }), (200,)),
+            }
+            for name, (make_call, expected) in read_scenarios.items():
+                results[name] = await run_scenario(
+                    name, [make_call(n) for n in range(args.reads)], args.concurrency, expected
+                )
+
+            results["export_ndjson"] = await run_scenario(
+                "export_ndjson",
+                [lambda n=n: client.get("/offeredCourses/export", params={"department": keys[n % len(keys)][0]})
+                 for n in range(max(1, args.reads // 10))],
+                args.concurrency, rows_per_call=args.rows * len(terms)
+            )
+
+            # Runs last because every patch invalidates the cached course list
+            patched = {}
+            for key in keys:
+                response = await client.get("/offeredCourses/search", params={
+                    "department": key[0], "semester": key[1], "year": key[2], "fields": "course_code,section", "limit": 5
+                })
+                patched[key] = response.json()["courses"]
+            results["offered_courses_patch_seats"] = await run_scenario(
+                "offered_courses_patch_seats",
+                [lambda n=n: client.patch("/offeredCourses", params=params(n), json=[
+                    {**section, "seat_taken": n % 40} for section in patched[keys[n % len(keys)]]
+                ]) for n in range(args.reads)],
+                args.concurrency, rows_per_call=5
+            )
+    finally:
+        await app.router.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["mongomock", "mongodb"], default="mongomock")
+    parser.add_argument("--mongo-url", default="mongodb://localhost:27017")
+    parser.add_argument("--database", default="course_benchmark", help="Dropped before the run on --backend mongodb")
+    parser.add_argument("--storage", choices=["embedded", "sectioned"],
+                        help="OFFERED_COURSES_STORAGE; sectioned on mongomock, the configured layout on mongodb")
+    parser.add_argument("--departments", type=int, default=3)
+    parser.add_argument("--semesters", type=int, default=2, help="Offered courses uploads per department")
+    parser.add_argument("--rows", type=int, default=1000, help="Sections per offered courses workbook")
+    parser.add_argument("--faculty", type=int, default=120, help="Faculty per department")
+    parser.add_argument("--upload-concurrency", type=int, default=2)
+    parser.add_argument("--reads", type=int, default=500, help="Requests per read scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Read requests in flight")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args()
+
+    # Settings are read at import time, so the environment is set before the app is imported
+    os.environ["DATABASE_URL"] = args.mongo_url
+    os.environ["DATABASE_NAME"] = args.database
+    os.environ.setdefault("JWT_SECRET", "benchmark")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    if args.storage is None and args.backend == "mongomock":
+        args.storage = "sectioned"
+    if args.storage:
+        os.environ["OFFERED_COURSES_STORAGE"] = args.storage
+
+    from app.models import database
+    backend = contextlib.nullcontext()
+    if args.backend == "mongomock":
+        from mongomock_motor import AsyncMongoMockClient, enabled_gridfs_integration
+        database.AsyncIOMotorClient = AsyncMongoMockClient
+        # Upload jobs keep their files in GridFS
+        backend = enabled_gridfs_integration()
+    else:
+        from pymongo import MongoClient
+        MongoClient(args.mongo_url).drop_database(args.database)
+
+    from benchmarks.report import build_report, write_report
+    from app.middleware import logging_middleware
+    logging_middleware.logger.setLevel(logging.WARNING)
+
+    with backend:
+        results = asyncio.run(drive(args))
+    parameters = {key: value for key, value in vars(args).items() if key != "output"}
+    write_report(build_report("load", parameters, results), args.output)
+
+
+if __name__ == "__main__":
+    main()
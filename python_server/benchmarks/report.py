@@ -0,0 +1,117 @@
+# File: python_server/benchmarks/report.py
+"""
+JSON reports of the benchmark suite, so runs can be stored and compared.
+
+Every report carries the interpreter, platform, git revision and peak RSS of
+the process next to its results; latency results are summarized as count,
+mean, p50/p95/p99 and max in milliseconds.
+"""
+
+import json
+import math
+import platform
+import resource
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+
+def percentile(sorted_samples: List[float], q: float) -> Optional[float]:
+    """
+    Nearest-rank percentile of already sorted samples.
+    """
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def latency_summary(samples: List[float]) -> Dict:
+    """
+    Summarizes durations in seconds as milliseconds.
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return {"count": 0}
+    milliseconds = lambda value: round(value * 1000, 3)
+    return {
+        "count": len(ordered),
+        "mean_ms": milliseconds(sum(ordered) / len(ordered)),
+        "p50_ms": milliseconds(percentile(ordered, 50)),
+        "p95_ms": milliseconds(percentile(ordered, 95)),
+        "p99_ms": milliseconds(percentile(ordered, 99)),
+        "max_ms": milliseconds(ordered[-1]),
+    }
+
+
+def peak_rss_mb() -> float:
+    """
+    Peak resident set size of this process; ru_maxrss is in KiB on Linux and bytes on macOS.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _proc_kib(pid, path: str, field: str) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/{path}") as stream:
+            for line in stream:
+                if line.startswith(field + ":"):
+                    return float(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def rss_mb(pid="self") -> Optional[float]:
+    """
+    Current resident set size of a process (Linux only, None elsewhere).
+    """
+    kib = _proc_kib(pid, "status", "VmRSS")
+    return round(kib / 1024, 1) if kib is not None else None
+
+
+def pss_mb(pid="self") -> Optional[float]:
+    """
+    Proportional set size: resident memory with pages shared between processes,
+    e.g. preforked workers, split evenly among them (Linux only, None elsewhere).
+    """
+    kib = _proc_kib(pid, "smaps_rollup", "Pss")
+    return round(kib / 1024, 1) if kib is not None else None
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def build_report(suite: str, parameters: Dict, results: Dict) -> Dict:
+    return {
+        "suite": suite,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": parameters,
+        "results": results,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def write_report(report: Dict, output: Optional[str] = None):
+    """
+    Writes the report to `output`, or to stdout when no path is given.
+    """
+    text = json.dumps(report, indent=2)
+    if output:
+        with open(output, "w") as stream:
+            stream.write(text + "\n")
+        print(f"Report written to {output}", file=sys.stderr)
+    else:
+        print(text)
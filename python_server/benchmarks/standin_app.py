@@ -0,0 +1,25 @@
+# File: python_server/benchmarks/standin_app.py
+"""
+app.main:app backed by mongomock-motor instead of a MongoDB server, for
+benchmarks that start real server processes:
+
+    gunicorn benchmarks.standin_app:app -c gunicorn.conf.py
+
+The Motor client class is replaced before startup, so every worker still runs
+the usual connect_to_mongo, indexes and job workers, each on its own
+in-memory database.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "course_benchmark")
+os.environ.setdefault("JWT_SECRET", "benchmark")
+
+from mongomock_motor import AsyncMongoMockClient
+
+from app.models import database
+
+database.AsyncIOMotorClient = AsyncMongoMockClient
+
+from app.main import app  # noqa: E402
@@ -0,0 +1,79 @@
+# File: python_server/benchmarks/workbooks.py
+"""
+Synthetic faculty and offered courses data shared by the benchmarks.
+
+Records follow the registrar exports: faculty sheets with camelCase headers,
+offered courses sheets with one row per section, a timing such as
+"MW 10:50 AM - 12:05 PM" and faculty short names that map to the faculty
+sheet of the same department. Generation is seeded, so every run and every
+benchmark sees the same data for the same arguments.
+"""
+
+import io
+import random
+from typing import Dict, List, Tuple
+
+from openpyxl import Workbook
+
+DAYS = ["S", "M", "T", "W", "R", "ST", "MW", "TR", "SR", "A"]
+SLOTS = ["08:00 AM - 09:15 AM", "09:25 AM - 10:40 AM", "10:50 AM - 12:05 PM",
+         "12:15 PM - 01:30 PM", "01:40 PM - 02:55 PM", "03:05 PM - 04:20 PM"]
+
+FACULTY_HEADER = ["ShortName", "Email", "Name", "DesignationName", "AcademicDepartmentShortName"]
+COURSE_HEADER = ["Course", "Section", "Faculty", "Timing", "Room No", "Capacity", "Seat Taken"]
+
+DESIGNATIONS = ["Lecturer", "Senior Lecturer", "Assistant Professor", "Associate Professor", "Professor"]
+
+
+def synthetic_records(rows: int, faculty_count: int = 120, seed: int = 7) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Offered course records (normalized column names) and the matching faculty email map.
+    """
+    rng = random.Random(seed)
+    records = []
+    for i in range(rows):
+        records.append({
+            "course_code": f"CSE{100 + i // 4}",
+            "section": i % 4 + 1,
+            "faculty": f"F{rng.randrange(faculty_count):03d}",
+            "timing": f"{rng.choice(DAYS)} {rng.choice(SLOTS)}",
+            # Numeric and building-prefixed rooms, like the registrar sheets
+            "room_no": rng.choice([rng.randrange(101, 900), f"AB{rng.randrange(1, 4)}-{rng.randrange(101, 900)}"]),
+            "capacity": 40,
+            "seat_taken": rng.randrange(45),
+        })
+    email_map = {f"F{n:03d}": f"f{n}@ewu.edu" for n in range(faculty_count)}
+    return records, email_map
+
+
+def faculty_rows(count: int, department: str = "CSE") -> List[List]:
+    return [
+        [f"F{n:03d}", f"f{n}@ewu.edu", f"Faculty {n}", DESIGNATIONS[n % len(DESIGNATIONS)], department]
+        for n in range(count)
+    ]
+
+
+def write_xlsx(header: List[str], rows: List[List]) -> bytes:
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for row in rows:
+        sheet.append(list(row))
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def faculty_workbook(count: int = 120, department: str = "CSE") -> bytes:
+    """
+    Faculty information workbook with `count` faculty of one department.
+    """
+    return write_xlsx(FACULTY_HEADER, faculty_rows(count, department))
+
+
+def offered_courses_workbook(rows: int, faculty_count: int = 120, seed: int = 7) -> bytes:
+    """
+    Offered courses workbook with `rows` sections taught by the faculty of faculty_workbook(faculty_count).
+    """
+    records, _ = synthetic_records(rows, faculty_count, seed)
+    return write_xlsx(COURSE_HEADER, [list(record.values()) for record in records])
@@ -0,0 +1,43 @@
+# File: python_server/gunicorn.conf.py
+"""
+Gunicorn settings of the multi-process deployment:
+
+    gunicorn app.main:app -c gunicorn.conf.py
+
+Each worker is a uvicorn event loop with its own MongoDB client, parse
+executor, job workers, caches and metrics, all created by the startup hook
+after the fork. With preload_app the master imports the application once and
+the workers share those pages; pandas and openpyxl are not part of it, every
+worker imports them with its first upload.
+
+Environment variables:
+- WEB_CONCURRENCY: worker processes (default: one per CPU);
+- BIND: address to listen on (default 0.0.0.0:3005);
+- PRELOAD_APP: import the application in the master (default true);
+- WORKER_TIMEOUT: seconds before a silent worker is restarted (default 120);
+- MAX_REQUESTS: restart a worker after this many requests, 0 never (default 0).
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:3005")
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.getenv("PRELOAD_APP", "true").lower() == "true"
+
+# Uploads are processed off the event loop, so a silent worker is really stuck
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+max_requests = int(os.getenv("MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+# Requests are logged by LoggingMiddleware
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+
+def post_fork(server, worker):
+    server.log.info(f"🚀 Worker {worker.pid} started")
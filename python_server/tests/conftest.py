@@ -0,0 +1,35 @@
+# File: python_server/tests/conftest.py
+
+import os
+
+# app.config reads these when the services are imported
+os.environ.setdefault("DATABASE_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DATABASE_NAME", "course_test")
+os.environ.setdefault("JWT_SECRET", "test")
+
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def db():
+    """
+    Fresh in-memory database per test; mongomock-motor needs no MongoDB server.
+    """
+    return AsyncMongoMockClient()["course_test"]
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """
+    The response and directory caches are per process; every test starts cold.
+    """
+    from app.utils import cache
+    for instance in list(cache._caches):
+        instance.clear()
+    yield
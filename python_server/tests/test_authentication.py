@@ -0,0 +1,154 @@
+# File: python_server/tests/test_authentication.py
+
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+
+from app.models import authentication
+from app.models.authentication import get_authenticated_user, get_current_user, token_cache, token_digest
+
+pytestmark = pytest.mark.anyio
+
+USER = {"username": "registrar", "role": "admin", "department": "CSE"}
+
+
+def session_token(lifetime_seconds: float = 3600, secret: str = None, **claims) -> str:
+    payload = {**USER, "iat": int(time.time()), **claims}
+    if lifetime_seconds is not None:
+        payload["exp"] = int(time.time() + lifetime_seconds)
+    return jwt.encode(payload, secret or authentication.JWT_SECRET, algorithm="HS256")
+
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """
+    Counts the tokens that are actually verified instead of served from the cache.
+    """
+    calls = []
+    decode_jwt = authentication.decode_jwt
+
+    def counting_decode(token: str):
+        calls.append(token)
+        return decode_jwt(token)
+
+    monkeypatch.setattr(authentication, "decode_jwt", counting_decode)
+    return calls
+
+
+async def test_verified_token_is_served_from_the_cache(decodes):
+    token = session_token()
+
+    assert await get_current_user(token) == USER
+    assert await get_current_user(token) == USER
+
+    assert len(decodes) == 1
+    expires_at, _ = token_cache.get(token_digest(token))
+    assert expires_at == jwt.decode(token, options={"verify_signature": False})["exp"]
+
+
+async def test_cached_users_are_copies(decodes):
+    token = session_token()
+
+    (await get_current_user(token))["role"] = "guest"
+
+    assert (await get_current_user(token))["role"] == "admin"
+
+
+async def test_cached_token_is_rejected_once_it_expires(decodes):
+    token = session_token(lifetime_seconds=1)
+    assert await get_current_user(token) == USER
+
+    await asyncio.sleep(max(0.0, jwt.decode(token, options={"verify_signature": False})["exp"] - time.time()) + 0.05)
+
+    assert await get_current_user(token) is None
+    assert len(decodes) == 2
+    assert token_cache.get(token_digest(token)) is None
+
+
+async def test_cache_entry_past_exp_is_not_trusted(decodes):
+    # The entry outlives exp, e.g. when the monotonic and wall clocks drift apart
+    token = session_token(lifetime_seconds=-10)
+    token_cache.set(token_digest(token), (int(time.time()) - 10, USER))
+
+    assert await get_current_user(token) is None
+
+    assert len(decodes) == 1
+    assert token_cache.get(token_digest(token)) is None
+
+
+async def test_expired_token_is_not_cached(decodes):
+    token = session_token(lifetime_seconds=-10)
+
+    assert await get_current_user(token) is None
+    assert await get_current_user(token) is None
+
+    assert len(decodes) == 2
+    assert len(token_cache._entries) == 0
+
+
+async def test_token_with_a_bad_signature_is_not_cached(decodes):
+    token = session_token(secret="another-secret")
+
+    assert await get_current_user(token) is None
+
+    assert len(token_cache._entries) == 0
+
+
+async def test_token_without_exp_is_cached_without_expiry(decodes):
+    token = session_token(lifetime_seconds=None)
+
+    assert await get_current_user(token) == USER
+    assert await get_current_user(token) == USER
+
+    assert len(decodes) == 1
+    assert token_cache.get(token_digest(token)) == (None, USER)
+
+
+async def test_token_without_username_is_rejected_and_not_cached(decodes):
+    token = session_token(username=None)
+
+    with pytest.raises(HTTPException):
+        await get_current_user(token)
+
+    assert len(token_cache._entries) == 0
+
+
+async def test_least_recently_used_token_is_evicted(decodes, monkeypatch):
+    monkeypatch.setattr(token_cache, "max_entries", 2)
+    evictions = token_cache.evictions
+    first, second, third = (session_token(department=department) for department in ("CSE", "EEE", "BBA"))
+    await get_current_user(first)
+    await get_current_user(second)
+    await get_current_user(first)
+
+    await get_current_user(third)
+
+    assert token_cache.evictions == evictions + 1
+    assert token_cache.get(token_digest(second)) is None
+    await get_current_user(first)
+    assert decodes == [first, second, third]
+    await get_current_user(second)
+    assert decodes == [first, second, third, second]
+
+
+async def test_cache_is_keyed_by_digest(decodes):
+    token = session_token()
+
+    await get_current_user(token)
+
+    assert list(token_cache._entries) == [token_digest(token)]
+    assert all(len(key) == 32 for key in token_cache._entries)
+
+
+async def test_expired_token_is_unauthorized_when_auth_is_enabled(decodes, monkeypatch):
+    monkeypatch.setattr(authentication, "AUTH_ENABLED", True)
+    token = session_token(lifetime_seconds=-10)
+
+    with pytest.raises(HTTPException) as raised:
+        await get_authenticated_user(token)
+
+    assert raised.value.status_code == 401
+    assert await get_authenticated_user(session_token()) == USER
@@ -0,0 +1,184 @@
+# File: python_server/tests/test_conflict_service.py
+
+import pytest
+
+from app.services.conflict_service import (
+    FACULTY_CONFLICT, ROOM_CONFLICT, find_conflicts, load_shared_rows, shared_resources_filter
+)
+from app.services.section_store import save_sections
+from app.utils.validators import time_to_minutes
+
+
+def timing(days: str, start: str, end: str) -> dict:
+    return {
+        "days": days, "start_time": start, "end_time": end,
+        "start_minutes": time_to_minutes(start), "end_minutes": time_to_minutes(end),
+    }
+
+
+def section(code: str, days: str, start: str, end: str, department: str = "CSE", section_no: int = 1,
+            room_no: str = None, faculty: str = None, email: str = None) -> dict:
+    return {
+        "department": department, "course_code": code, "section": section_no,
+        "room_no": room_no, "faculty": faculty, "email": email, "timing": timing(days, start, end),
+    }
+
+
+def clashing_codes(conflicts: list) -> list:
+    return sorted(
+        (conflict["type"], *sorted(row["course_code"] for row in conflict["sections"])) for conflict in conflicts
+    )
+
+
+def test_back_to_back_sections_do_not_clash():
+    rows = [
+        section("CSE101", "ST", "08:00 AM", "09:20 AM", room_no="101"),
+        section("CSE102", "ST", "09:20 AM", "10:40 AM", room_no="101"),
+        section("CSE103", "ST", "10:40 AM", "12:00 PM", room_no="101"),
+    ]
+
+    assert find_conflicts(rows) == []
+
+
+def test_overlap_is_found_next_to_back_to_back_sections():
+    rows = [
+        section("CSE101", "ST", "08:00 AM", "09:20 AM", room_no="101"),
+        section("CSE102", "ST", "09:20 AM", "10:40 AM", room_no="101"),
+        section("CSE103", "ST", "10:00 AM", "11:20 AM", room_no="101"),
+    ]
+
+    (conflict,) = find_conflicts(rows)
+
+    assert conflict["type"] == ROOM_CONFLICT
+    assert conflict["resource"] == "101"
+    assert (conflict["start_time"], conflict["end_time"]) == ("10:00 AM", "10:40 AM")
+    assert [row["course_code"] for row in conflict["sections"]] == ["CSE102", "CSE103"]
+
+
+def test_long_section_clashes_with_every_section_inside_it():
+    rows = [
+        section("CSE101", "M", "08:00 AM", "12:00 PM", room_no="101"),
+        section("CSE102", "M", "08:30 AM", "09:00 AM", room_no="101"),
+        section("CSE103", "M", "09:00 AM", "09:30 AM", room_no="101"),
+        section("CSE104", "M", "11:59 AM", "01:00 PM", room_no="101"),
+    ]
+
+    assert clashing_codes(find_conflicts(rows)) == [
+        (ROOM_CONFLICT, "CSE101", "CSE102"), (ROOM_CONFLICT, "CSE101", "CSE103"), (ROOM_CONFLICT, "CSE101", "CSE104"),
+    ]
+
+
+def test_different_days_and_rooms_do_not_clash():
+    rows = [
+        section("CSE101", "ST", "08:00 AM", "09:20 AM", room_no="101"),
+        section("CSE102", "MW", "08:00 AM", "09:20 AM", room_no="101"),
+        section("CSE103", "ST", "08:00 AM", "09:20 AM", room_no="102"),
+    ]
+
+    assert find_conflicts(rows) == []
+
+
+def test_overlap_on_several_days_is_reported_once():
+    rows = [
+        section("CSE101", "STR", "08:00 AM", "09:20 AM", room_no="101"),
+        section("CSE102", "ST", "09:00 AM", "10:20 AM", room_no="101"),
+    ]
+
+    (conflict,) = find_conflicts(rows)
+
+    assert conflict["days"] == "ST"
+
+
+def test_faculty_is_matched_by_email_across_departments():
+    rows = [
+        section("CSE101", "M", "08:00 AM", "09:20 AM", room_no="101", faculty="AASR", email="aasr@example.edu"),
+        section("EEE101", "M", "09:00 AM", "10:20 AM", department="EEE", room_no="301", faculty="AR", email="AASR@example.edu"),
+        # Same short name in another department is another person
+        section("BBA101", "M", "08:00 AM", "09:20 AM", department="BBA", room_no="401", faculty="AASR"),
+    ]
+
+    (conflict,) = find_conflicts(rows)
+
+    assert conflict["type"] == FACULTY_CONFLICT
+    assert [row["course_code"] for row in conflict["sections"]] == ["CSE101", "EEE101"]
+
+
+def test_room_and_faculty_clash_are_both_reported():
+    rows = [
+        section("CSE101", "M", "08:00 AM", "09:20 AM", room_no="101", faculty="AASR"),
+        section("CSE102", "M", "08:00 AM", "09:20 AM", room_no="101", faculty="AASR"),
+    ]
+
+    assert clashing_codes(find_conflicts(rows)) == [
+        (FACULTY_CONFLICT, "CSE101", "CSE102"), (ROOM_CONFLICT, "CSE101", "CSE102"),
+    ]
+
+
+def test_focus_department_keeps_only_its_conflicts():
+    rows = [
+        section("CSE101", "M", "08:00 AM", "09:20 AM", room_no="101"),
+        section("EEE101", "M", "08:00 AM", "09:20 AM", department="EEE", room_no="101"),
+        section("BBA101", "T", "08:00 AM", "09:20 AM", department="BBA", room_no="201"),
+        section("BBA102", "T", "08:00 AM", "09:20 AM", department="BBA", room_no="201"),
+    ]
+
+    assert clashing_codes(find_conflicts(rows, focus_department="EEE")) == [(ROOM_CONFLICT, "CSE101", "EEE101")]
+
+
+def test_sections_without_usable_timing_are_skipped():
+    rows = [
+        section("CSE101", "M", "08:00 AM", "09:20 AM", room_no="101"),
+        {**section("CSE102", "M", "08:00 AM", "09:20 AM", room_no="101"), "timing": None},
+        section("CSE103", "M", "09:20 AM", "08:00 AM", room_no="101"),
+    ]
+
+    assert find_conflicts(rows) == []
+
+
+def test_stored_display_times_are_used_without_minutes():
+    rows = [
+        {**section("CSE101", "M", "08:00 AM", "09:20 AM", room_no="101"), "timing": {"days": "M", "start_time": "08:00 AM", "end_time": "09:20 AM"}},
+        section("CSE102", "M", "09:00 AM", "10:20 AM", room_no="101"),
+    ]
+
+    assert clashing_codes(find_conflicts(rows)) == [(ROOM_CONFLICT, "CSE101", "CSE102")]
+
+
+def test_shared_resources_filter_matches_rooms_emails_and_faculty():
+    courses = [
+        {"room_no": 101, "faculty": "AASR", "email": "AASR@example.edu"},
+        {"room_no": "102", "faculty": None, "email": None},
+    ]
+
+    assert shared_resources_filter(courses) == {"$or": [
+        {"room_no": {"$in": ["101", "102"]}},
+        {"email": {"$in": ["AASR@example.edu", "aasr@example.edu"]}},
+        {"faculty": {"$in": ["AASR"]}},
+    ]}
+    assert shared_resources_filter([{"course_code": "CSE101"}]) is None
+
+
+@pytest.mark.anyio
+async def test_load_shared_rows_reads_only_sections_sharing_a_resource(db):
+    def stored(code: str, **fields) -> dict:
+        row = section(code, "M", "08:00 AM", "09:20 AM", **fields)
+        row.pop("department")
+        return row
+
+    # Embedded layout
+    await db["offered_courses"].insert_one({"department": "EEE", "semester": 3, "year": 2024, "courses": [
+        stored("EEE101", room_no="101"), stored("EEE102", room_no="301", email="aasr@example.edu"),
+        stored("EEE103", room_no="302"),
+    ]})
+    # Sectioned layout
+    await save_sections(db, "BBA", 3, 2024, [stored("BBA101", room_no="401", faculty="AASR"), stored("BBA102", room_no="402")])
+    # Department being replaced and another semester
+    await save_sections(db, "CSE", 3, 2024, [stored("CSE900", room_no="101")])
+    await save_sections(db, "MAT", 1, 2025, [stored("MAT101", room_no="101")])
+
+    upload = [stored("CSE101", room_no="101", faculty="AASR", email="AASR@example.edu")]
+    rows = await load_shared_rows(db, 3, 2024, upload, exclude_department="CSE")
+
+    assert sorted(row["course_code"] for row in rows) == ["BBA101", "EEE101", "EEE102"]
+    assert {row["department"] for row in rows} == {"EEE", "BBA"}
+    assert await load_shared_rows(db, 3, 2024, [{"course_code": "CSE101"}]) == []
@@ -0,0 +1,120 @@
+# File: python_server/tests/test_etag.py
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.models.database import get_database, get_read_database
+from app.routes import course_routes
+from app.utils.etag import compute_version, etag_matches, format_etag
+
+VERSION = "3f2a"
+
+
+@pytest.mark.parametrize("if_none_match", [
+    '"3f2a"',
+    'W/"3f2a"',
+    '"0000", "3f2a"',
+    '"0000",W/"3f2a"',
+    ' "0000" ,  "3f2a" ',
+    "*",
+    '"0000", *',
+])
+def test_matching_if_none_match(if_none_match):
+    assert etag_matches(if_none_match, VERSION)
+
+
+@pytest.mark.parametrize("if_none_match, version", [
+    (None, VERSION),
+    ("", VERSION),
+    ('"3f2a"', None),
+    ("*", None),
+    ('"0000"', VERSION),
+    ('"0000", W/"1111"', VERSION),
+    ('"3f2a0"', VERSION),
+    ('W/"3f2"', VERSION),
+])
+def test_non_matching_if_none_match(if_none_match, version):
+    assert not etag_matches(if_none_match, version)
+
+
+def test_etag_round_trips_through_format():
+    assert etag_matches(format_etag(VERSION), VERSION)
+    assert format_etag(VERSION) == '"3f2a"'
+
+
+def test_version_depends_on_values_not_key_order():
+    assert compute_version({"a": 1, "b": [1, 2]}) == compute_version({"b": [1, 2], "a": 1})
+    assert compute_version({"a": 1, "b": [1, 2]}) != compute_version({"a": 1, "b": [2, 1]})
+
+
+@pytest.fixture
+async def client(db):
+    app = FastAPI()
+    app.include_router(course_routes.router)
+    app.dependency_overrides[get_database] = lambda: db
+    app.dependency_overrides[get_read_database] = lambda: db
+    await db["offered_courses"].insert_one({
+        "department": "CSE", "semester": 3, "year": 2024, "version": "v1", "uploaded_by": "registrar",
+        "courses": [{"course_code": "CSE101", "section": 1, "faculty": None, "seat_taken": 10}],
+    })
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+PARAMS = {"department": "CSE", "semester": 3, "year": 2024}
+
+
+@pytest.mark.anyio
+async def test_conditional_get_is_answered_with_304(client):
+    response = await client.get("/offeredCourses", params=PARAMS)
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"v1"'
+
+    for if_none_match in ('"v1"', 'W/"v1"', '"v0", "v1"', "*"):
+        cached = await client.get("/offeredCourses", params=PARAMS, headers={"If-None-Match": if_none_match})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == '"v1"'
+        assert cached.content == b""
+
+    stale = await client.get("/offeredCourses", params=PARAMS, headers={"If-None-Match": '"v0"'})
+    assert stale.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_patch_changes_the_etag(client):
+    await client.get("/offeredCourses", params=PARAMS)
+
+    patched = await client.patch("/offeredCourses", params=PARAMS, json=[{"course_code": "CSE101", "section": 1, "seat_taken": 25}])
+    assert patched.status_code == 200
+    version = patched.json()["version"]
+
+    response = await client.get("/offeredCourses", params=PARAMS, headers={"If-None-Match": '"v1"'})
+    assert response.status_code == 200
+    assert response.headers["etag"] == format_etag(version)
+    assert response.json()["courses"][0]["seat_taken"] == 25
+    again = await client.get("/offeredCourses", params=PARAMS, headers={"If-None-Match": format_etag(version)})
+    assert again.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_write_by_another_worker_changes_the_etag(client, db):
+    await client.get("/offeredCourses", params=PARAMS)
+
+    # Another worker's upload does not invalidate this worker's cache
+    await db["offered_courses"].update_one(PARAMS, {"$set": {"version": "v2", "courses.0.seat_taken": 30}})
+
+    response = await client.get("/offeredCourses", params=PARAMS, headers={"If-None-Match": '"v1"'})
+    assert response.status_code == 200
+    assert response.headers["etag"] == '"v2"'
+    assert response.json()["courses"][0]["seat_taken"] == 30
+    plain = await client.get("/offeredCourses", params=PARAMS)
+    assert plain.headers["etag"] == '"v2"'
+
+
+@pytest.mark.anyio
+async def test_missing_semester_is_404_with_or_without_if_none_match(client):
+    params = {**PARAMS, "year": 2030}
+
+    assert (await client.get("/offeredCourses", params=params)).status_code == 404
+    assert (await client.get("/offeredCourses", params=params, headers={"If-None-Match": "*"})).status_code == 404
@@ -0,0 +1,82 @@
+# File: python_server/tests/test_export_service.py
+
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from app.services.export_service import CSV_COLUMNS, build_export_filter, iter_export_rows, stream_export
+from app.services.section_store import SECTIONED_LAYOUT, save_sections
+
+pytestmark = pytest.mark.anyio
+
+
+def course(code: str, section: int = 1, **fields) -> dict:
+    return {"course_code": code, "section": section, "faculty": "AASR", "room_no": "101", **fields}
+
+
+async def store(db, department: str, semester: int, year: int, courses: list, sectioned: bool = False):
+    key = {"department": department, "semester": semester, "year": year}
+    if sectioned:
+        await db["offered_courses"].insert_one({**key, "layout": SECTIONED_LAYOUT})
+        await save_sections(db, department, semester, year, courses)
+    else:
+        await db["offered_courses"].insert_one({**key, "courses": courses})
+
+
+@pytest.fixture
+async def mixed_layouts(db):
+    # Inserted out of order and alternating between the layouts
+    await store(db, "EEE", 1, 2024, [course("EEE101")], sectioned=True)
+    await store(db, "CSE", 3, 2024, [course("CSE301", 2), course("CSE301", 1)])
+    await store(db, "BBA", 1, 2025, [course("BBA101")])
+    await store(db, "CSE", 1, 2024, [course("CSE102"), course("CSE101")], sectioned=True)
+    await store(db, "CSE", 1, 2025, [course("CSE201")])
+    return db
+
+
+def keys(rows: list) -> list:
+    return [(row["department"], row["semester"], row["year"], row["course_code"], row["section"]) for row in rows]
+
+
+async def test_mixed_layouts_are_exported_in_one_order(mixed_layouts):
+    rows = [row async for row in iter_export_rows(mixed_layouts, {})]
+
+    assert keys(rows) == [
+        ("BBA", 1, 2025, "BBA101", 1),
+        ("CSE", 1, 2024, "CSE102", 1),
+        ("CSE", 1, 2024, "CSE101", 1),
+        ("CSE", 1, 2025, "CSE201", 1),
+        ("CSE", 3, 2024, "CSE301", 2),
+        ("CSE", 3, 2024, "CSE301", 1),
+        ("EEE", 1, 2024, "EEE101", 1),
+    ]
+
+
+async def test_filters_apply_to_both_layouts(mixed_layouts):
+    query = build_export_filter(["CSE", "EEE"], year_from=2024, year_to=2024, semester_to=1)
+
+    rows = [row async for row in iter_export_rows(mixed_layouts, query, {"course_code": {"$in": ["CSE101", "EEE101"]}})]
+
+    assert keys(rows) == [("CSE", 1, 2024, "CSE101", 1), ("EEE", 1, 2024, "EEE101", 1)]
+
+
+async def test_ndjson_export(mixed_layouts):
+    body = b"".join([chunk async for chunk in stream_export(mixed_layouts, {"department": {"$in": ["BBA"]}})])
+
+    assert [json.loads(line) for line in body.splitlines()] == [
+        {"department": "BBA", "semester": 1, "year": 2025, **course("BBA101")}
+    ]
+
+
+async def test_gzip_csv_export(mixed_layouts):
+    chunks = [chunk async for chunk in stream_export(mixed_layouts, {}, "csv", compress=True)]
+
+    table = list(csv.reader(io.StringIO(gzip.decompress(b"".join(chunks)).decode())))
+    assert table[0] == CSV_COLUMNS
+    assert [(row[0], row[3]) for row in table[1:]] == [
+        ("BBA", "BBA101"), ("CSE", "CSE102"), ("CSE", "CSE101"), ("CSE", "CSE201"),
+        ("CSE", "CSE301"), ("CSE", "CSE301"), ("EEE", "EEE101"),
+    ]
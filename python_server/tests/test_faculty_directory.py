@@ -0,0 +1,45 @@
+# File: python_server/tests/test_faculty_directory.py
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from app.services.faculty_directory import get_faculty_index
+
+pytestmark = pytest.mark.anyio
+
+
+def faculty(short_name: str, email: str) -> dict:
+    return {"short_name": short_name, "email": email, "name": f"Faculty {short_name}", "designation": "Lecturer"}
+
+
+async def test_index_builds_lookup_tables_without_validating_the_response(db):
+    # Legacy or hand-edited documents may not pass the response model
+    await db["faculty_information"].insert_one({"department": "CSE", "version": "v1", "faculty_list": [
+        faculty("AASR", "aasr@example.edu"), faculty("MNH", "not-an-email"),
+    ]})
+
+    index = await get_faculty_index(db, "CSE")
+
+    assert index.version == "v1"
+    assert index.by_short_name == {"AASR": "aasr@example.edu", "MNH": "not-an-email"}
+    assert set(index.by_email) == {"aasr@example.edu", "not-an-email"}
+    with pytest.raises(ValidationError):
+        index.body()
+
+
+async def test_response_body_is_rendered_once(db):
+    await db["faculty_information"].insert_one({"department": "CSE", "version": "v1", "faculty_list": [
+        faculty("AASR", "aasr@example.edu"),
+    ]})
+    index = await get_faculty_index(db, "CSE")
+
+    body = index.body()
+
+    assert json.loads(body) == {"department": "CSE", "faculty_list": [faculty("AASR", "aasr@example.edu")]}
+    assert index.body() is body
+
+
+async def test_missing_department_has_no_index(db):
+    assert await get_faculty_index(db, "CSE") is None
@@ -0,0 +1,211 @@
+# File: python_server/tests/test_job_service.py
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from mongomock_motor import enabled_gridfs_integration
+
+from app.exceptions.custom_exceptions import FileProcessingError, ServiceUnavailableError
+from app.services import job_service
+from app.services.job_service import (
+    FACULTY_INFORMATION_JOB, JOBS_COLLECTION, PAYLOADS_BUCKET,
+    claim_next_job, enqueue_job, fail_abandoned_jobs, get_job, run_job
+)
+from app.utils.file_handler import ReceivedUpload
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = b"short_name,email\nAASR,aasr@example.edu\n"
+
+# Exceptions raised by the replaced processing for the "outcome" job parameter
+OUTCOMES = {
+    "invalid": FileProcessingError(detail="❌ No valid faculty records found."),
+    "unexpected": RuntimeError("connection reset"),
+    "saturated": ServiceUnavailableError(),
+}
+
+
+@pytest.fixture(autouse=True)
+def gridfs():
+    with enabled_gridfs_integration():
+        yield
+
+
+@pytest.fixture
+def processed(monkeypatch):
+    """
+    Replaces the faculty upload processing and records what every job was given.
+    """
+    calls = []
+
+    async def process_faculty_info(file_content, filename=None, progress=None, **params):
+        calls.append({"file_content": file_content, "filename": filename, **params})
+        if isinstance(file_content, str):
+            with open(file_content, "rb") as stream:
+                calls[-1]["read"] = stream.read()
+        await progress("parse")
+        await progress("save", 1)
+        if params.get("outcome"):
+            raise OUTCOMES[params["outcome"]]
+        return {"message": "✅ Stored", "department": "CSE", "total_records": 1, "warnings": []}
+
+    monkeypatch.setattr(job_service, "process_faculty_info", process_faculty_info)
+    monkeypatch.setattr(job_service, "UPLOAD_JOB_POLL_SECONDS", 0)
+    return calls
+
+
+async def enqueue(db, params: dict = None, content: bytes = CONTENT) -> str:
+    upload = ReceivedUpload("faculty.csv", len(content), "digest", content=content)
+    return (await enqueue_job(db, FACULTY_INFORMATION_JOB, upload, params or {"uploaded_by": "registrar"}))["job_id"]
+
+
+async def stored_files(db) -> int:
+    return await db[f"{PAYLOADS_BUCKET}.files"].count_documents({})
+
+
+async def expire_lease(db, job_id: str):
+    await db[JOBS_COLLECTION].update_one(
+        {"_id": job_id}, {"$set": {"lease_expires_at": datetime.utcnow() - timedelta(seconds=1)}}
+    )
+
+
+async def test_enqueue_keeps_the_file_out_of_the_job_document(db):
+    job_id = await enqueue(db)
+
+    stored = await db[JOBS_COLLECTION].find_one({"_id": job_id})
+    assert "payload" not in stored
+    assert stored["payload_size"] == len(CONTENT)
+    assert await stored_files(db) == 1
+    job = await get_job(db, job_id)
+    assert (job["status"], job["stage"], job["attempts"]) == ("queued", "queued", 0)
+    assert "payload_id" not in job
+
+
+async def test_enqueue_streams_spooled_uploads(db, tmp_path):
+    path = tmp_path / "faculty.csv"
+    path.write_bytes(CONTENT * 1000)
+    upload = ReceivedUpload("faculty.csv", len(CONTENT) * 1000, "digest", path=str(path))
+
+    job = await enqueue_job(db, FACULTY_INFORMATION_JOB, upload, {})
+
+    claimed = await claim_next_job(db, "worker-1")
+    assert claimed["_id"] == job["job_id"]
+    assert await job_service._load_payload(db, claimed) == CONTENT * 1000
+
+
+async def test_claim_takes_the_oldest_queued_job_once(db):
+    first, second = await enqueue(db), await enqueue(db)
+
+    claimed = await claim_next_job(db, "worker-1")
+
+    assert claimed["_id"] == first
+    assert (claimed["status"], claimed["lease_owner"], claimed["attempts"]) == ("running", "worker-1", 1)
+    assert claimed["lease_expires_at"] > datetime.utcnow()
+    assert (await claim_next_job(db, "worker-2"))["_id"] == second
+    assert await claim_next_job(db, "worker-3") is None
+
+
+async def test_expired_lease_is_reclaimed_by_another_worker(db):
+    job_id = await enqueue(db)
+    await claim_next_job(db, "worker-1")
+    assert await claim_next_job(db, "worker-2") is None
+
+    await expire_lease(db, job_id)
+    claimed = await claim_next_job(db, "worker-2")
+
+    assert (claimed["_id"], claimed["lease_owner"], claimed["attempts"]) == (job_id, "worker-2", 2)
+
+
+async def test_job_abandoned_on_its_last_attempt_fails(db, monkeypatch):
+    monkeypatch.setattr(job_service, "UPLOAD_JOB_MAX_ATTEMPTS", 2)
+    job_id = await enqueue(db)
+    for worker_id in ("worker-1", "worker-2"):
+        assert (await claim_next_job(db, worker_id))["_id"] == job_id
+        await expire_lease(db, job_id)
+
+    assert await claim_next_job(db, "worker-3") is None
+    await fail_abandoned_jobs(db)
+
+    job = await get_job(db, job_id)
+    assert (job["status"], job["error"]) == ("failed", "❌ Job was abandoned by its worker.")
+    assert "finished_at" in job
+    assert await stored_files(db) == 0
+
+
+async def test_running_job_within_its_lease_is_not_failed(db, monkeypatch):
+    monkeypatch.setattr(job_service, "UPLOAD_JOB_MAX_ATTEMPTS", 1)
+    job_id = await enqueue(db)
+    await claim_next_job(db, "worker-1")
+
+    await fail_abandoned_jobs(db)
+
+    assert (await get_job(db, job_id))["status"] == "running"
+    assert await stored_files(db) == 1
+
+
+async def test_succeeded_job_stores_the_result_and_deletes_the_file(db, processed):
+    job_id = await enqueue(db)
+
+    await run_job(db, await claim_next_job(db, "worker-1"), "worker-1")
+
+    job = await get_job(db, job_id)
+    assert (job["status"], job["stage"], job["rows_processed"]) == ("succeeded", "completed", 1)
+    assert job["rows"] == {"total_records": 1, "warnings": 0}
+    assert job["result"]["department"] == "CSE"
+    assert processed == [{"file_content": CONTENT, "filename": "faculty.csv", "uploaded_by": "registrar"}]
+    assert await stored_files(db) == 0
+
+
+async def test_large_file_is_processed_from_a_temporary_file(db, processed, monkeypatch):
+    monkeypatch.setattr(job_service, "UPLOAD_SPOOL_BYTES", 16)
+    await enqueue(db)
+
+    await run_job(db, await claim_next_job(db, "worker-1"), "worker-1")
+
+    (call,) = processed
+    assert call["read"] == CONTENT
+    assert not os.path.exists(call["file_content"])
+
+
+async def test_failed_job_keeps_the_error_and_deletes_the_file(db, processed):
+    job_id = await enqueue(db, {"outcome": "invalid"})
+
+    await run_job(db, await claim_next_job(db, "worker-1"), "worker-1")
+
+    job = await get_job(db, job_id)
+    assert (job["status"], job["stage"], job["error"]) == ("failed", "failed", "❌ No valid faculty records found.")
+    assert await stored_files(db) == 0
+    assert await claim_next_job(db, "worker-2") is None
+
+
+async def test_unexpected_error_fails_the_job_without_details(db, processed):
+    job_id = await enqueue(db, {"outcome": "unexpected"})
+
+    await run_job(db, await claim_next_job(db, "worker-1"), "worker-1")
+
+    assert (await get_job(db, job_id))["error"] == "❌ Internal server error."
+
+
+async def test_saturated_executor_requeues_without_counting_the_attempt(db, processed):
+    job_id = await enqueue(db, {"outcome": "saturated"})
+
+    await run_job(db, await claim_next_job(db, "worker-1"), "worker-1")
+
+    job = await get_job(db, job_id)
+    assert (job["status"], job["stage"], job["attempts"]) == ("queued", "queued", 0)
+    assert await stored_files(db) == 1
+    assert (await claim_next_job(db, "worker-2"))["_id"] == job_id
+
+
+async def test_worker_that_lost_its_lease_does_not_finish_the_job(db, processed):
+    job_id = await enqueue(db)
+    stale = await claim_next_job(db, "worker-1")
+    await expire_lease(db, job_id)
+    await claim_next_job(db, "worker-2")
+
+    await run_job(db, stale, "worker-1")
+
+    job = await get_job(db, job_id)
+    assert (job["status"], job["attempts"]) == ("running", 2)
+    assert await stored_files(db) == 1
@@ -0,0 +1,48 @@
+# File: python_server/tests/test_metrics.py
+
+import pytest
+
+from app.exceptions.custom_exceptions import FileProcessingError
+from app.services.patch_service import OFFERED_COURSES_PATCH_PIPELINE, patch_offered_courses
+from app.utils.metrics import UPLOADS, count_failures
+
+pytestmark = pytest.mark.anyio
+
+
+def uploads(pipeline: str, outcome: str) -> float:
+    return UPLOADS.values.get((pipeline, outcome), 0)
+
+
+async def test_raised_exceptions_are_counted_as_failed_uploads():
+    @count_failures("test_pipeline")
+    async def upload(fail: bool):
+        if fail:
+            raise FileProcessingError(detail="❌ No valid course records found.")
+        return "stored"
+
+    before = uploads("test_pipeline", "failed")
+
+    assert await upload(False) == "stored"
+    with pytest.raises(FileProcessingError):
+        await upload(True)
+
+    assert uploads("test_pipeline", "failed") == before + 1
+
+
+async def test_failed_patch_is_counted(db, monkeypatch):
+    await db["offered_courses"].insert_one({
+        "department": "CSE", "semester": 3, "year": 2024, "version": "v1",
+        "courses": [{"course_code": "CSE101", "section": 1, "seat_taken": 10}],
+    })
+
+    async def failing_bulk_write(*args, **kwargs):
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(type(db["offered_courses"]), "bulk_write", failing_bulk_write)
+    failed, processed = (uploads(OFFERED_COURSES_PATCH_PIPELINE, outcome) for outcome in ("failed", "processed"))
+
+    with pytest.raises(FileProcessingError):
+        await patch_offered_courses(db, "CSE", 3, 2024, [{"course_code": "CSE101", "section": 1, "seat_taken": 25}], {})
+
+    assert uploads(OFFERED_COURSES_PATCH_PIPELINE, "failed") == failed + 1
+    assert uploads(OFFERED_COURSES_PATCH_PIPELINE, "processed") == processed
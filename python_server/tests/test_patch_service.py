@@ -0,0 +1,218 @@
+# File: python_server/tests/test_patch_service.py
+
+import json
+
+import pytest
+
+from app.exceptions.custom_exceptions import FileProcessingError, PayloadTooLargeError
+from app.services import patch_service
+from app.services.patch_service import (
+    load_patched_sections, parse_patch_rows, patch_offered_courses, save_patch, validate_patch_rows
+)
+from app.services.section_store import SECTIONED_LAYOUT, load_sections, save_sections, semester_key
+
+CSV = "text/csv"
+JSON = "application/json"
+KEY = semester_key("CSE", 3, 2024)
+
+
+def course(code: str, section: int, **fields) -> dict:
+    return {
+        "course_code": code, "section": section, "faculty": "AASR", "email": "aasr@example.edu",
+        "timing": None, "room_no": "101", "capacity": 30, "seat_taken": 10, **fields,
+    }
+
+
+async def store_embedded(db, courses: list):
+    await db["offered_courses"].insert_one({**KEY, "version": "v1", "source_digest": "digest", "courses": courses})
+
+
+async def store_sectioned(db, courses: list):
+    await db["offered_courses"].insert_one({**KEY, "version": "v1", "source_digest": "digest", "layout": SECTIONED_LAYOUT})
+    await save_sections(db, "CSE", 3, 2024, courses)
+
+
+def test_json_null_clears_a_field():
+    rows = parse_patch_rows(json.dumps([{"Course": "CSE101", "section": 1, "faculty": None}]).encode(), JSON)
+
+    assert rows == [{"course_code": "CSE101", "section": 1, "faculty": None}]
+
+
+def test_empty_csv_cell_leaves_the_field_unchanged():
+    content = "Course,Section,Faculty,Seat Taken\nCSE101,1,,25\nCSE102,2, ,\n".encode()
+
+    rows = parse_patch_rows(content, "text/csv; charset=utf-8")
+
+    assert rows == [
+        {"course_code": "CSE101", "section": "1", "seat_taken": "25"},
+        {"course_code": "CSE102", "section": "2"},
+    ]
+
+
+def test_json_changes_object_and_byte_order_mark_are_accepted():
+    content = "﻿".encode() + json.dumps({"changes": [{"course_code": "CSE101", "section": 1, "Seat Taken": 5}]}).encode()
+
+    assert parse_patch_rows(content, None) == [{"course_code": "CSE101", "section": 1, "seat_taken": 5}]
+
+
+@pytest.mark.parametrize("content, content_type", [
+    (b"{not json", JSON),
+    (b'{"course_code": "CSE101"}', JSON),
+    (b'[{"course_code": "CSE101"}, 1]', JSON),
+    (b"[]", JSON),
+    (b"Course,Section\n", CSV),
+    ("Course\nCSE101\n".encode("utf-16"), CSV),
+])
+def test_malformed_bodies_are_rejected(content, content_type):
+    with pytest.raises(FileProcessingError):
+        parse_patch_rows(content, content_type)
+
+
+def test_too_many_changes_are_rejected(monkeypatch):
+    monkeypatch.setattr(patch_service, "OFFERED_COURSES_PATCH_MAX_ROWS", 2)
+    rows = [{"course_code": "CSE101", "section": section} for section in range(3)]
+
+    with pytest.raises(PayloadTooLargeError):
+        parse_patch_rows(json.dumps(rows).encode(), JSON)
+
+
+def test_validation_keeps_only_changed_fields():
+    rows = [
+        {"course_code": "CSE101", "section": "1", "seat_taken": "25"},
+        {"course_code": "CSE102", "section": 2, "timing": "MW 08:00 AM - 09:15 AM", "room_no": 305},
+    ]
+
+    changes, warnings = validate_patch_rows(rows, {})
+
+    assert warnings == []
+    assert changes == {
+        ("CSE101", 1): {"seat_taken": 25},
+        ("CSE102", 2): {
+            "room_no": "305",
+            "timing": {"days": "MW", "start_time": "08:00 AM", "end_time": "09:15 AM", "start_minutes": 480, "end_minutes": 555},
+        },
+    }
+
+
+def test_faculty_change_sets_or_clears_the_email():
+    rows = [
+        {"course_code": "CSE101", "section": 1, "faculty": "MNH"},
+        {"course_code": "CSE102", "section": 1, "faculty": None},
+        {"course_code": "CSE103", "section": 1, "faculty": "XYZ"},
+    ]
+
+    changes, warnings = validate_patch_rows(rows, {"MNH": "mnh@example.edu"})
+
+    assert changes == {
+        ("CSE101", 1): {"faculty": "MNH", "email": "mnh@example.edu"},
+        ("CSE102", 1): {"faculty": None, "email": None},
+        ("CSE103", 1): {"faculty": "XYZ", "email": None},
+    }
+    assert warnings == [{"record": 3, "course_code": "CSE103", "errors": ["Email mapping not found for faculty 'XYZ'."]}]
+
+
+def test_invalid_rows_are_skipped_with_warnings():
+    rows = [
+        {"course_code": "CSE101", "section": 1, "dedicated_department": "CSE"},
+        {"course_code": "CSE101", "section": 1},
+        {"course_code": "CSE101", "section": 1, "timing": "sometime"},
+        {"course_code": "CSE101", "section": 1, "seat_taken": "many"},
+        {"course_code": "CSE101", "seat_taken": 5},
+        {"course_code": "CSE101", "section": 1, "seat_taken": 5},
+    ]
+
+    changes, warnings = validate_patch_rows(rows, {})
+
+    assert changes == {("CSE101", 1): {"seat_taken": 5}}
+    assert [(warning["record"], warning["errors"]) for warning in warnings] == [
+        (1, ["Unknown fields: dedicated_department."]),
+        (2, ["No fields to change."]),
+        (3, ["Invalid timing 'sometime', expected e.g. MW 08:00 AM - 09:15 AM."]),
+        (4, ["seat_taken: value is not a valid integer"]),
+        (5, ["Missing section."]),
+    ]
+
+
+def test_later_rows_for_a_section_override_earlier_ones():
+    rows = [
+        {"course_code": "CSE101", "section": 1, "seat_taken": 5, "room_no": "101"},
+        {"course_code": "CSE101", "section": 1, "seat_taken": 7},
+    ]
+
+    changes, _ = validate_patch_rows(rows, {})
+
+    assert changes == {("CSE101", 1): {"seat_taken": 7, "room_no": "101"}}
+
+
+@pytest.mark.anyio
+async def test_save_patch_updates_embedded_sections_in_place(db):
+    await store_embedded(db, [course("CSE101", 1), course("CSE101", 2), course("CSE102", 1)])
+    changes = {("CSE101", 2): {"seat_taken": 25}, ("CSE102", 1): {"faculty": None, "email": None}}
+
+    # Every section is read with the fields changed on any of them
+    fields = {"course_code", "section", "seat_taken", "faculty", "email"}
+    assert await load_patched_sections(db, KEY, False, changes) == {
+        ("CSE101", 2): {field: course("CSE101", 2)[field] for field in fields},
+        ("CSE102", 1): {field: course("CSE102", 1)[field] for field in fields},
+    }
+    matched = await save_patch(db, KEY, False, {**changes, ("CSE999", 1): {"seat_taken": 1}}, "v2")
+
+    assert matched == 2
+    document = await db["offered_courses"].find_one(KEY)
+    assert document["courses"] == [
+        course("CSE101", 1), course("CSE101", 2, seat_taken=25), course("CSE102", 1, faculty=None, email=None)
+    ]
+    assert document["version"] == "v2"
+    assert "source_digest" not in document
+
+
+@pytest.mark.anyio
+async def test_save_patch_updates_sectioned_sections(db):
+    await store_sectioned(db, [course("CSE101", 1), course("CSE101", 2)])
+    changes = {("CSE101", 2): {"room_no": "305"}}
+
+    assert await load_patched_sections(db, KEY, True, changes) == {
+        ("CSE101", 2): {"course_code": "CSE101", "section": 2, "room_no": "101"},
+    }
+    assert await save_patch(db, KEY, True, changes, "v2") == 1
+
+    assert await load_sections(db, "CSE", 3, 2024) == [course("CSE101", 1), course("CSE101", 2, room_no="305")]
+    header = await db["offered_courses"].find_one(KEY)
+    assert header["version"] == "v2"
+    assert "source_digest" not in header
+
+
+@pytest.mark.anyio
+async def test_patch_reports_updated_unchanged_and_missing_sections(db):
+    await store_embedded(db, [course("CSE101", 1), course("CSE102", 1)])
+    rows = parse_patch_rows(json.dumps([
+        {"course_code": "CSE101", "section": 1, "seat_taken": 25},
+        {"course_code": "CSE102", "section": 1, "seat_taken": 10},
+        {"course_code": "CSE103", "section": 1, "seat_taken": 5},
+    ]).encode(), JSON)
+
+    result = await patch_offered_courses(db, "CSE", 3, 2024, rows, {"username": "registrar"})
+
+    assert (result["updated"], result["unchanged"]) == (1, 1)
+    assert result["version"] != "v1"
+    assert result["warnings"] == [{"record": None, "course_code": "CSE103", "errors": ["Section 1 not found."]}]
+    document = await db["offered_courses"].find_one(KEY)
+    assert [row["seat_taken"] for row in document["courses"]] == [25, 10]
+
+
+@pytest.mark.anyio
+async def test_patch_without_changes_keeps_the_version(db):
+    await store_embedded(db, [course("CSE101", 1)])
+    rows = [{"course_code": "CSE101", "section": 1, "seat_taken": 10}]
+
+    result = await patch_offered_courses(db, "CSE", 3, 2024, rows, {"username": "registrar"})
+
+    assert (result["updated"], result["unchanged"], result["version"]) == (0, 1, "v1")
+    assert (await db["offered_courses"].find_one(KEY))["source_digest"] == "digest"
+
+
+@pytest.mark.anyio
+async def test_patch_of_unknown_semester_returns_none(db):
+    rows = [{"course_code": "CSE101", "section": 1, "seat_taken": 10}]
+
+    assert await patch_offered_courses(db, "CSE", 3, 2024, rows, {"username": "registrar"}) is None
@@ -0,0 +1,94 @@
+# File: python_server/tests/test_section_store.py
+
+import pytest
+
+from app.services.section_store import (
+    SECTIONS_COLLECTION, dedupe_sections, save_sections, load_sections, delete_sections
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def course(code: str, section: int, **fields) -> dict:
+    return {"course_code": code, "section": section, "faculty": "AASR", "room_no": "101", "seat_taken": 10, **fields}
+
+
+def test_dedupe_keeps_last_row_per_section():
+    courses = [course("CSE101", 1, seat_taken=1), course("CSE101", 2), course("CSE101", 1, seat_taken=3)]
+
+    unique, warnings = dedupe_sections(courses)
+
+    assert [(row["course_code"], row["section"], row["seat_taken"]) for row in unique] == [
+        ("CSE101", 2, 10), ("CSE101", 1, 3)
+    ]
+    assert warnings == [{
+        "record": None, "course_code": "CSE101",
+        "errors": ["Duplicate section 1; only the last row was stored."]
+    }]
+
+
+async def test_first_save_inserts_every_section(db):
+    counts = await save_sections(db, "CSE", 3, 2024, [course("CSE101", 1), course("CSE102", 1)])
+
+    assert counts == {"inserted": 2, "updated": 0, "deleted": 0, "unchanged": 0}
+    assert [row["course_code"] for row in await load_sections(db, "CSE", 3, 2024)] == ["CSE101", "CSE102"]
+
+
+async def test_save_diffs_inserts_updates_and_deletes(db):
+    await save_sections(db, "CSE", 3, 2024, [course("CSE101", 1), course("CSE102", 1), course("CSE103", 1)])
+    stored_ids = {row["course_code"]: row["_id"] async for row in db[SECTIONS_COLLECTION].find()}
+
+    counts = await save_sections(db, "CSE", 3, 2024, [
+        course("CSE101", 1),                 # unchanged
+        course("CSE102", 1, seat_taken=25),  # updated in place
+        course("CSE104", 1),                 # inserted; CSE103 is deleted
+    ])
+
+    assert counts == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+    sections = await load_sections(db, "CSE", 3, 2024)
+    assert [(row["course_code"], row["seat_taken"]) for row in sections] == [
+        ("CSE101", 10), ("CSE102", 25), ("CSE104", 10)
+    ]
+    # Unchanged and updated sections keep their documents
+    after_ids = {row["course_code"]: row["_id"] async for row in db[SECTIONS_COLLECTION].find()}
+    assert after_ids["CSE101"] == stored_ids["CSE101"]
+    assert after_ids["CSE102"] == stored_ids["CSE102"]
+
+
+async def test_save_follows_the_new_row_order(db):
+    await save_sections(db, "CSE", 3, 2024, [course("CSE101", 1), course("CSE102", 1)])
+
+    counts = await save_sections(db, "CSE", 3, 2024, [course("CSE102", 1), course("CSE101", 1)])
+
+    # Only the positions changed
+    assert counts == {"inserted": 0, "updated": 2, "deleted": 0, "unchanged": 0}
+    assert [row["course_code"] for row in await load_sections(db, "CSE", 3, 2024)] == ["CSE102", "CSE101"]
+
+
+async def test_identical_save_writes_nothing(db):
+    courses = [course("CSE101", 1), course("CSE102", 1)]
+    await save_sections(db, "CSE", 3, 2024, courses)
+
+    counts = await save_sections(db, "CSE", 3, 2024, courses)
+
+    assert counts == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 2}
+
+
+async def test_semesters_are_saved_and_deleted_independently(db):
+    await save_sections(db, "CSE", 3, 2024, [course("CSE101", 1)])
+    await save_sections(db, "EEE", 3, 2024, [course("EEE101", 1)])
+    await save_sections(db, "CSE", 1, 2025, [course("CSE201", 1)])
+
+    assert await delete_sections(db, "CSE", 3, 2024) == 1
+
+    assert await load_sections(db, "CSE", 3, 2024) == []
+    assert [row["course_code"] for row in await load_sections(db, "EEE", 3, 2024)] == ["EEE101"]
+    assert [row["course_code"] for row in await load_sections(db, "CSE", 1, 2025)] == ["CSE201"]
+
+
+async def test_loaded_sections_have_the_embedded_shape(db):
+    await save_sections(db, "CSE", 3, 2024, [course("CSE101", 1)])
+
+    (section,) = await load_sections(db, "CSE", 3, 2024)
+
+    assert section == course("CSE101", 1)
@@ -0,0 +1,108 @@
+# File: python_server/tests/test_upload_dedupe.py
+
+import pytest
+
+from app.models import database
+from app.services.course_service import process_offered_courses
+from app.services.faculty_service import process_faculty_info
+from app.services.patch_service import patch_offered_courses
+from app.utils.parse_executor import shutdown_parse_executor, start_parse_executor
+
+pytestmark = pytest.mark.anyio
+
+USER = {"username": "registrar"}
+SEMESTER = {"year": 2024, "semester_no": 3, "department": "CSE"}
+
+FACULTY = (
+    b"ShortName,Email,Name,DesignationName,AcademicDepartmentShortName\n"
+    b"AASR,aasr@example.edu,Faculty AASR,Lecturer,CSE\n"
+    b"MNH,mnh@example.edu,Faculty MNH,Lecturer,CSE\n"
+)
+COURSES = (
+    b"Course,Section,Faculty,Timing,Room No,Capacity,Seat Taken\n"
+    b"CSE101,1,AASR,MW 08:00 AM - 09:15 AM,101,40,35\n"
+    b"CSE102,1,MNH,ST 10:50 AM - 12:05 PM,102,40,20\n"
+)
+
+
+@pytest.fixture
+async def uploads(db, monkeypatch):
+    """
+    Points the upload services at the in-memory database with a running parse executor.
+    """
+    monkeypatch.setattr(database, "db", db)
+    start_parse_executor()
+    yield db
+    shutdown_parse_executor()
+
+
+async def upload_faculty(content: bytes = FACULTY) -> dict:
+    return await process_faculty_info(content, uploaded_by="registrar", filename="faculty.csv")
+
+
+async def upload_courses(content: bytes = COURSES) -> dict:
+    return await process_offered_courses(content, user=USER, filename="courses.csv", **SEMESTER)
+
+
+async def stored_courses(db) -> list:
+    document = await db["offered_courses"].find_one({"department": "CSE", "semester": 3, "year": 2024})
+    return document["courses"]
+
+
+async def test_identical_faculty_upload_is_deduplicated(uploads):
+    first = await upload_faculty()
+    stored = await uploads["faculty_information"].find_one({"department": "CSE"})
+
+    again = await upload_faculty()
+
+    assert first["deduplicated"] is False
+    assert again["deduplicated"] is True
+    assert (again["department"], again["total_records"]) == ("CSE", 2)
+    assert await uploads["faculty_information"].find_one({"department": "CSE"}) == stored
+
+
+async def test_identical_course_upload_is_deduplicated(uploads):
+    await upload_faculty()
+    first = await upload_courses()
+    stored = await uploads["offered_courses"].find_one({"department": "CSE"})
+
+    again = await upload_courses()
+
+    assert first["deduplicated"] is False
+    assert again["deduplicated"] is True
+    assert (again["total_courses"], again["warnings"]) == (first["total_courses"], first["warnings"])
+    assert await uploads["offered_courses"].find_one({"department": "CSE"}) == stored
+
+
+async def test_changed_course_file_is_processed(uploads):
+    await upload_faculty()
+    await upload_courses()
+
+    result = await upload_courses(COURSES.replace(b",40,35\n", b",40,38\n"))
+
+    assert result["deduplicated"] is False
+    assert [course["seat_taken"] for course in await stored_courses(uploads)] == [38, 20]
+
+
+async def test_course_upload_after_a_patch_is_processed_again(uploads):
+    await upload_faculty()
+    await upload_courses()
+    await patch_offered_courses(uploads, "CSE", 3, 2024, [{"course_code": "CSE101", "section": 1, "seat_taken": 5}], USER)
+
+    result = await upload_courses()
+
+    # The sheet replaces the patched seat count instead of being skipped as unchanged
+    assert result["deduplicated"] is False
+    assert [course["seat_taken"] for course in await stored_courses(uploads)] == [35, 20]
+    assert (await upload_courses())["deduplicated"] is True
+
+
+async def test_course_upload_after_a_faculty_change_is_processed_again(uploads):
+    await upload_faculty()
+    await upload_courses()
+    await upload_faculty(FACULTY.replace(b"mnh@example.edu", b"mnh@cse.example.edu"))
+
+    result = await upload_courses()
+
+    assert result["deduplicated"] is False
+    assert [course["email"] for course in await stored_courses(uploads)] == ["aasr@example.edu", "mnh@cse.example.edu"]